@@ -4,9 +4,22 @@ import streamlit as st
 import json
 from io import BytesIO
 
+from lib.batch import export_languages
 from lib.pdf_parser import extract_text_from_pdf
-from lib.groq_client import structure_resume, optimize_resume, translate_resume
-from lib.pdf_generator import generate_pdf
+from lib.metrics import registry
+from lib.groq_client import (
+    optimize_sections_patch,
+    optimize_resume_stream,
+    translate_resume_stream,
+    last_call_cached,
+    last_prompt_stats,
+    last_translation_stats,
+)
+from lib.pdf_generator import generate_pdf_cached
+from lib.templates import DEFAULT_TEMPLATE, list_templates
+from lib.resume_parser import structure_resume_pdf
+from lib.sections import apply_patch, default_section_paths, parse_path
+from lib.translation_memory import SUPPORTED_LANGUAGES
 
 # Page configuration
 st.set_page_config(
@@ -15,6 +28,36 @@ st.set_page_config(
     layout="centered",
 )
 
+
+def render_section(container, path: tuple, value):
+    """Render a completed resume section from a streamed LLM response."""
+    key = path[0]
+    if len(path) == 2:
+        if key == "experience":
+            header = value.get("title", "")
+            if value.get("company"):
+                header += f" — {value['company']}"
+            bullets = "\n".join(f"- {b}" for b in value.get("bullets", []))
+            container.markdown(f"**{header}**\n\n{bullets}")
+        elif key == "projects":
+            bullets = "\n".join(f"- {b}" for b in value.get("bullets", []))
+            container.markdown(f"**{value.get('name', '')}**\n\n{bullets}")
+    elif key == "professional_title":
+        container.markdown(f"**Title:** {value}")
+    elif key == "summary":
+        container.markdown(f"**Profile**\n\n{value}")
+    elif key == "skills":
+        if isinstance(value, dict):
+            value = [
+                skill
+                for group in value.values()
+                for skill in (group if isinstance(group, list) else [group])
+            ]
+        container.markdown("**Skills:** " + ", ".join(str(s) for s in value))
+    elif key not in ("experience", "projects"):
+        container.caption(f"{key.replace('_', ' ').capitalize()} ready")
+
+
 st.title("Resume Tailor")
 st.markdown("Fine-tune your resume for specific job descriptions")
 
@@ -27,8 +70,18 @@ if "resume_optimized" not in st.session_state:
     st.session_state.resume_optimized = None
 if "step" not in st.session_state:
     st.session_state.step = 1
-if "resume_french" not in st.session_state:
-    st.session_state.resume_french = None
+if "translations" not in st.session_state:
+    st.session_state.translations = {}
+if "cached_steps" not in st.session_state:
+    st.session_state.cached_steps = set()
+
+# LLM result cache controls
+use_cache = not st.sidebar.checkbox(
+    "Bypass LLM cache", value=False, help="Always call the model, even for repeated inputs"
+)
+show_debug = st.sidebar.checkbox(
+    "Show debug metrics", value=False, help="Per-stage timings, token usage and cache hits"
+)
 
 # Step 1: Upload Resume
 st.header("1. Upload Resume")
@@ -38,18 +91,27 @@ if uploaded_file is not None:
     if st.session_state.resume_text is None:
         with st.spinner("Extracting text from PDF..."):
             pdf_bytes = BytesIO(uploaded_file.read())
-            st.session_state.resume_text = extract_text_from_pdf(pdf_bytes)
+            st.session_state.resume_text = extract_text_from_pdf(pdf_bytes, fast=True)
 
         with st.spinner("Structuring resume..."):
             try:
-                st.session_state.resume_structured = structure_resume(
-                    st.session_state.resume_text
+                # Standard layouts are parsed locally; the LLM is only used as a fallback
+                st.session_state.resume_structured, method = structure_resume_pdf(
+                    pdf_bytes, resume_text=st.session_state.resume_text, use_cache=use_cache
                 )
+                if method == "local":
+                    st.session_state.cached_steps.add("structure_local")
+                elif last_call_cached():
+                    st.session_state.cached_steps.add("structure")
                 st.session_state.step = 2
             except Exception as e:
                 st.error(f"Error structuring resume: {str(e)}")
 
     if st.session_state.resume_structured:
+        if "structure" in st.session_state.cached_steps:
+            st.caption("Structured resume loaded from cache")
+        elif "structure_local" in st.session_state.cached_steps:
+            st.caption("Resume structured locally from its layout (no LLM call)")
         with st.expander("View extracted resume", expanded=False):
             st.json(st.session_state.resume_structured)
 
@@ -62,13 +124,51 @@ if st.session_state.step >= 2:
         placeholder="Paste the full job description to optimize your resume for...",
     )
 
+    section_mode = st.toggle(
+        "Only rewrite selected sections",
+        help="Faster: the model returns just the chosen sections instead of the whole resume",
+    )
+    if section_mode:
+        selected_sections = st.multiselect(
+            "Sections to optimize",
+            options=default_section_paths(st.session_state.resume_structured),
+            default=default_section_paths(st.session_state.resume_structured),
+        )
+
     if st.button("Optimize Resume", disabled=not job_description):
+        preview = st.container(border=True)
         with st.spinner("Optimizing resume for job description..."):
             try:
-                st.session_state.resume_optimized = optimize_resume(
-                    st.session_state.resume_structured, job_description
-                )
-                st.session_state.resume_french = None  # Reset French version
+                if section_mode:
+                    patch = optimize_sections_patch(
+                        st.session_state.resume_structured,
+                        job_description,
+                        sections=selected_sections,
+                        use_cache=use_cache,
+                    )
+                    merged = apply_patch(st.session_state.resume_structured, patch)
+                    for section_path in patch:
+                        parts = parse_path(section_path)
+                        if len(parts) == 3:
+                            render_section(preview, (parts[0], parts[1]), merged[parts[0]][parts[1]])
+                        else:
+                            render_section(preview, (parts[0],), merged[parts[0]])
+                    st.session_state.resume_optimized = merged
+                else:
+                    # Render sections as soon as each one is generated
+                    for path, value in optimize_resume_stream(
+                        st.session_state.resume_structured, job_description, use_cache=use_cache
+                    ):
+                        if path:
+                            render_section(preview, path, value)
+                        else:
+                            st.session_state.resume_optimized = value
+                st.session_state.cached_steps.discard("optimize")
+                if not section_mode and last_call_cached():
+                    st.session_state.cached_steps.add("optimize")
+                st.session_state.prompt_stats = None if section_mode else last_prompt_stats()
+                st.session_state.translations = {}  # Reset translated versions
+                st.session_state.export_zip = None
                 st.session_state.step = 3
             except Exception as e:
                 st.error(f"Error optimizing resume: {str(e)}")
@@ -76,6 +176,14 @@ if st.session_state.step >= 2:
 # Step 3: Review Optimizations
 if st.session_state.step >= 3 and st.session_state.resume_optimized:
     st.header("3. Review Optimized Resume")
+    if "optimize" in st.session_state.cached_steps:
+        st.caption("Optimized resume loaded from cache")
+    elif st.session_state.get("prompt_stats"):
+        stats = st.session_state.prompt_stats
+        st.caption(
+            f"Prompt: ~{stats['prompt_tokens']} tokens "
+            f"(~{stats['saved_tokens']} saved by compact JSON)"
+        )
 
     # Display optimized resume in editable JSON format
     optimized_json = st.text_area(
@@ -96,11 +204,24 @@ if st.session_state.step >= 3 and st.session_state.resume_optimized:
     if edited_resume:
         st.header("4. Download Resume")
 
+        page_limit = st.selectbox(
+            "Page limit",
+            options=["No limit", 1, 2],
+            help="Tighten type and spacing, then trim the last bullets, to fit this many pages",
+        )
+        target_pages = None if page_limit == "No limit" else page_limit
+        templates = list_templates()
+        template = st.selectbox(
+            "Template", options=templates, index=templates.index(DEFAULT_TEMPLATE)
+        )
+
         col1, col2 = st.columns(2)
 
         with col1:
             try:
-                pdf_bytes = generate_pdf(st.session_state.resume_optimized)
+                pdf_bytes = generate_pdf_cached(
+                    st.session_state.resume_optimized, target_pages, template
+                )
                 st.download_button(
                     label="Download PDF (English)",
                     data=pdf_bytes,
@@ -111,45 +232,100 @@ if st.session_state.step >= 3 and st.session_state.resume_optimized:
                 st.error(f"Error generating PDF: {str(e)}")
 
         with col2:
-            if st.session_state.resume_french is None:
-                if st.button("Generate French Version"):
-                    with st.spinner("Translating resume to French..."):
+            language = st.selectbox("Translate to", options=list(SUPPORTED_LANGUAGES))
+            suffix = SUPPORTED_LANGUAGES[language]
+            if language not in st.session_state.translations:
+                if st.button(f"Generate {language} Version"):
+                    translation_preview = st.container(border=True)
+                    with st.spinner(f"Translating resume to {language}..."):
                         try:
-                            st.session_state.resume_french = translate_resume(
-                                st.session_state.resume_optimized
-                            )
+                            # Render sections as soon as their strings are translated
+                            for path, value in translate_resume_stream(
+                                st.session_state.resume_optimized, language, use_cache=use_cache
+                            ):
+                                if path:
+                                    render_section(translation_preview, path, value)
+                                else:
+                                    st.session_state.translations[language] = value
+                            st.session_state.translation_stats = last_translation_stats()
                             st.rerun()
                         except Exception as e:
                             st.error(f"Error translating resume: {str(e)}")
             else:
-                with st.expander("Edit French Resume (JSON)", expanded=True):
-                    french_json = st.text_area(
-                        "Review and edit the French resume",
-                        value=json.dumps(st.session_state.resume_french, indent=2, ensure_ascii=False),
+                stats = st.session_state.get("translation_stats")
+                if stats and stats["language"] == language:
+                    st.caption(
+                        f"{stats['reused']} of {stats['strings']} strings reused "
+                        "from translation memory"
+                    )
+                with st.expander(f"Edit {language} Resume (JSON)", expanded=True):
+                    translated_json = st.text_area(
+                        f"Review and edit the {language} resume",
+                        value=json.dumps(
+                            st.session_state.translations[language], indent=2, ensure_ascii=False
+                        ),
                         height=250,
-                        key="french_json_editor",
+                        key=f"translated_json_editor_{suffix}",
                     )
 
                     # Validate JSON on edit
                     try:
-                        edited_french = json.loads(french_json)
-                        st.session_state.resume_french = edited_french
+                        edited_translation = json.loads(translated_json)
+                        st.session_state.translations[language] = edited_translation
                     except json.JSONDecodeError:
                         st.warning("Invalid JSON format. Please fix the syntax.")
-                        edited_french = None
+                        edited_translation = None
 
-                if edited_french:
+                if edited_translation:
                     try:
-                        french_pdf_bytes = generate_pdf(st.session_state.resume_french)
+                        translated_pdf_bytes = generate_pdf_cached(
+                            st.session_state.translations[language], target_pages, template
+                        )
                         st.download_button(
-                            label="Download PDF (French)",
-                            data=french_pdf_bytes,
-                            file_name="Jithin_Reghuvaran_CV_FR.pdf",
+                            label=f"Download PDF ({language})",
+                            data=translated_pdf_bytes,
+                            file_name=f"Jithin_Reghuvaran_CV_{suffix}.pdf",
                             mime="application/pdf",
-                            key="french_pdf_download",
+                            key=f"translated_pdf_download_{suffix}",
                         )
                     except Exception as e:
-                        st.error(f"Error generating French PDF: {str(e)}")
+                        st.error(f"Error generating {language} PDF: {str(e)}")
+
+        # Export several languages at once
+        selected_languages = st.multiselect(
+            "Export translations",
+            options=list(SUPPORTED_LANGUAGES),
+            help="Translate and render all selected languages concurrently into one ZIP",
+        )
+        if st.button("Export Translated PDFs", disabled=not selected_languages):
+            with st.spinner(f"Translating and rendering {len(selected_languages)} languages..."):
+                try:
+                    st.session_state.export_zip, st.session_state.export_report = export_languages(
+                        st.session_state.resume_optimized,
+                        selected_languages,
+                        file_stem="Jithin_Reghuvaran_CV",
+                        use_cache=use_cache,
+                        target_pages=target_pages,
+                        template=template,
+                    )
+                except Exception as e:
+                    st.error(f"Error exporting translations: {str(e)}")
+
+        if st.session_state.get("export_zip"):
+            for entry in st.session_state.export_report:
+                if entry["status"] == "ok":
+                    st.caption(
+                        f"{entry['language']}: translated in {entry['translate_seconds']:.1f}s, "
+                        f"rendered in {entry['render_seconds']:.1f}s"
+                    )
+                else:
+                    st.warning(f"{entry['language']}: {entry.get('error', entry['status'])}")
+            st.download_button(
+                label="Download Translated PDFs (ZIP)",
+                data=st.session_state.export_zip,
+                file_name="Jithin_Reghuvaran_CV_translations.zip",
+                mime="application/zip",
+            )
 
 # Reset button
 if st.session_state.step > 1:
@@ -157,6 +333,38 @@ if st.session_state.step > 1:
         st.session_state.resume_text = None
         st.session_state.resume_structured = None
         st.session_state.resume_optimized = None
-        st.session_state.resume_french = None
+        st.session_state.translations = {}
+        st.session_state.export_zip = None
+        st.session_state.cached_steps = set()
         st.session_state.step = 1
         st.rerun()
+
+# Debug panel: where the time went
+if show_debug:
+    with st.sidebar.expander("Debug metrics", expanded=True):
+        st.markdown("**Stage timings**")
+        st.table(
+            [
+                {"stage": stage, **summary}
+                for stage, summary in sorted(registry.stage_summary().items())
+            ]
+        )
+        st.markdown("**Counters**")
+        st.table(
+            [{"metric": name, "value": value} for name, value in sorted(registry.counters().items())]
+        )
+        st.markdown("**Recent spans**")
+        st.table(
+            [
+                {
+                    "stage": record["stage"],
+                    "parent": record["parent"] or "",
+                    "ms": round(record["seconds"] * 1000, 1),
+                    "status": record["status"],
+                }
+                for record in registry.recent_spans()[-25:]
+            ]
+        )
+        if st.button("Reset metrics"):
+            registry.reset()
+            st.rerun()
@@ -0,0 +1 @@
+"""Benchmarks for Resume Tailor. Run modules with python -m benchmarks.<name>."""
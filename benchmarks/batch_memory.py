@@ -0,0 +1,85 @@
+"""Peak memory of zipping many rendered PDFs: buffered bytes versus streamed zip entries.
+
+"buffered" collects generate_pdf() bytes for every resume before writing the
+archive, as batch exports used to; "streamed" renders each PDF with
+render_pdf() straight into its zip entry. Each strategy runs in a fresh
+process and reports how far its peak resident memory rose above the level
+reached after one warm-up render.
+
+Usage: python -m benchmarks.batch_memory [--count N] [--entries N]
+"""
+
+import argparse
+import resource
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from lib.pdf_generator import generate_pdf, render_pdf
+
+from .common import sample_resume
+
+
+def buffered(resumes: list, path: Path) -> None:
+    files = {f"resume_{i}.pdf": generate_pdf(resume) for i, resume in enumerate(resumes)}
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for file_name, data in files.items():
+            zf.writestr(file_name, data)
+
+
+def streamed(resumes: list, path: Path) -> None:
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for i, resume in enumerate(resumes):
+            with zf.open(f"resume_{i}.pdf", "w") as entry:
+                render_pdf(resume, entry)
+
+
+def _max_rss_kb() -> float:
+    """Peak resident memory of this process in KiB (Linux reports KiB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(strategy: str, count: int, entries: int) -> tuple:
+    """Run one strategy in the current process: (peak growth KiB, seconds, archive KiB)."""
+    resumes = []
+    for i in range(count):
+        resume = sample_resume(n_experience=entries, n_bullets=6)
+        resume["name"] = f"{resume['name']} {i}"
+        resumes.append(resume)
+
+    # Warm up fonts and layout caches so only the batch itself is measured
+    generate_pdf(resumes[0])
+    baseline = _max_rss_kb()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "batch.zip"
+        start = time.perf_counter()
+        STRATEGIES[strategy](resumes, path)
+        seconds = time.perf_counter() - start
+        return _max_rss_kb() - baseline, seconds, path.stat().st_size / 1024
+
+
+STRATEGIES = {"buffered": buffered, "streamed": streamed}
+
+
+def main(argv: list | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100, help="PDFs per archive")
+    parser.add_argument("--entries", type=int, default=5, help="Experience entries per resume")
+    args = parser.parse_args(argv)
+
+    print(f"{args.count} PDFs of {args.entries} entries")
+    print(f"{'':>10}{'peak growth':>14}{'time':>10}{'archive':>12}")
+    for strategy in STRATEGIES:
+        # A fresh process per strategy, so one's peak does not mask the other's
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            growth_kb, seconds, archive_kb = pool.submit(
+                measure, strategy, args.count, args.entries
+            ).result()
+        print(f"{strategy:>10}{growth_kb:>11.0f}KiB{seconds:>9.2f}s{archive_kb:>9.0f}KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Per-render latency of generate_pdf with and without the font cache.
+
+Usage: python -m benchmarks.font_cache [--repeat N]
+"""
+
+import argparse
+
+from lib.pdf_generator import ResumePDF, clear_font_cache, generate_pdf
+
+from .common import sample_resume, summarize, time_calls
+
+
+def main(argv: list | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args(argv)
+
+    resume = sample_resume()
+
+    def uncached(fn):
+        def run():
+            clear_font_cache()
+            fn()
+        return run
+
+    render = lambda: generate_pdf(resume)  # noqa: E731
+
+    # Warm up imports and the cache before timing
+    render()
+
+    rows = [
+        ("ResumePDF()", "re-parse fonts", summarize(time_calls(uncached(ResumePDF), args.repeat))),
+        ("ResumePDF()", "font cache", summarize(time_calls(ResumePDF, args.repeat))),
+        ("generate_pdf", "re-parse fonts", summarize(time_calls(uncached(render), args.repeat))),
+        ("generate_pdf", "font cache", summarize(time_calls(render, args.repeat))),
+    ]
+
+    print(f"{'':>14}{'':>16}{'mean':>10}{'p50':>10}{'p95':>10}")
+    for target, label, stats in rows:
+        print(
+            f"{target:>14}{label:>16}"
+            f"{stats['mean_ms']:>8.1f}ms{stats['p50_ms']:>8.1f}ms{stats['p95_ms']:>8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
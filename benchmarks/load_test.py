@@ -0,0 +1,145 @@
+"""End-to-end pipeline throughput under concurrent load, against the offline fake LLM.
+
+Each simulated user structures a resume, optimizes it for a job description,
+translates it and optionally renders the PDF. Threads model concurrent
+Streamlit sessions; --async models the API service.
+
+Usage: python -m benchmarks.load_test [--users N] [--concurrency N] [--latency S]
+       [--tokens-per-second N] [--error-rate P] [--malformed-rate P] [--render] [--async]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from lib import groq_client
+from lib.llm_backend import FakeBackend
+from lib.pdf_generator import generate_pdf
+from lib.scheduler import get_scheduler
+
+from .common import sample_resume, summarize
+
+JOB_DESCRIPTION = "Senior ML Engineer: Python, PyTorch, AWS, Kubernetes, production NLP systems."
+
+
+def _resume_text(user: int) -> str:
+    """Plain-text resume for one simulated user."""
+    resume = sample_resume()
+    lines = [f"{resume['name']} {user}", resume["professional_title"], resume["summary"]]
+    for entry in resume["experience"]:
+        lines.append(f"{entry['title']} at {entry['company']} ({entry['dates']})")
+        lines.extend(entry["bullets"])
+    return "\n".join(lines)
+
+
+def run_user(user: int, render: bool) -> float:
+    """Run the pipeline once and return its wall time in seconds."""
+    start = time.perf_counter()
+    resume = groq_client.structure_resume(_resume_text(user), use_cache=False)
+    resume = {**sample_resume(), **resume}
+    optimized = groq_client.optimize_resume(resume, JOB_DESCRIPTION, use_cache=False)
+    translated = groq_client.translate_resume(optimized, "French", use_cache=False)
+    if render:
+        generate_pdf(translated)
+    return time.perf_counter() - start
+
+
+async def arun_user(user: int, render: bool) -> float:
+    """Async counterpart of run_user; rendering runs in a worker thread."""
+    start = time.perf_counter()
+    resume = await groq_client.astructure_resume(_resume_text(user), use_cache=False)
+    resume = {**sample_resume(), **resume}
+    optimized = await groq_client.aoptimize_resume(resume, JOB_DESCRIPTION, use_cache=False)
+    translated = await groq_client.atranslate_resume(optimized, "French", use_cache=False)
+    if render:
+        await asyncio.to_thread(generate_pdf, translated)
+    return time.perf_counter() - start
+
+
+def _run_threads(users: int, concurrency: int, render: bool) -> tuple:
+    timings, errors = [], []
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(run_user, user, render) for user in range(users)]
+        for future in futures:
+            try:
+                timings.append(future.result())
+            except Exception as e:
+                errors.append(str(e))
+    return timings, errors
+
+
+async def _run_async(users: int, concurrency: int, render: bool) -> tuple:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(user):
+        async with semaphore:
+            return await arun_user(user, render)
+
+    results = await asyncio.gather(
+        *(bounded(user) for user in range(users)), return_exceptions=True
+    )
+    timings = [r for r in results if not isinstance(r, BaseException)]
+    errors = [str(r) for r in results if isinstance(r, BaseException)]
+    return timings, errors
+
+
+def main(argv: list | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.3, help="Seconds to first token")
+    parser.add_argument("--tokens-per-second", type=float, default=500.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--malformed-rate", type=float, default=0.0, help="Share of replies needing a repair"
+    )
+    parser.add_argument("--recordings", help="JSONL recordings to replay")
+    parser.add_argument("--rpm", type=int, default=100000, help="Scheduler requests per minute")
+    parser.add_argument("--tpm", type=int, default=100000000, help="Scheduler tokens per minute")
+    parser.add_argument("--render", action="store_true", help="Also render each PDF")
+    parser.add_argument("--async", dest="use_async", action="store_true")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("GROQ_REQUESTS_PER_MINUTE", str(args.rpm))
+    os.environ.setdefault("GROQ_TOKENS_PER_MINUTE", str(args.tpm))
+    options = {
+        "latency": args.latency,
+        "tokens_per_second": args.tokens_per_second,
+        "error_rate": args.error_rate,
+        "malformed_rate": args.malformed_rate,
+    }
+    if args.recordings:
+        backend = FakeBackend.from_jsonl(args.recordings, **options)
+    else:
+        backend = FakeBackend(**options)
+    groq_client.set_backend(backend)
+
+    start = time.perf_counter()
+    if args.use_async:
+        timings, errors = asyncio.run(_run_async(args.users, args.concurrency, args.render))
+    else:
+        timings, errors = _run_threads(args.users, args.concurrency, args.render)
+    elapsed = time.perf_counter() - start
+
+    stats = summarize(timings) if timings else {"mean_ms": 0, "p50_ms": 0, "p95_ms": 0}
+    metrics = get_scheduler().metrics()
+    print(f"mode:        {'async' if args.use_async else 'threads'}")
+    print(f"users:       {args.users} ({args.concurrency} concurrent)")
+    print(f"completed:   {len(timings)}  failed: {len(errors)}")
+    print(f"wall time:   {elapsed:.2f}s")
+    print(f"throughput:  {len(timings) / elapsed:.2f} pipelines/s")
+    print(
+        f"latency:     mean {stats['mean_ms']:.0f}ms  p50 {stats['p50_ms']:.0f}ms  "
+        f"p95 {stats['p95_ms']:.0f}ms"
+    )
+    print(f"LLM calls:   {backend.calls}  retries: {metrics['retries']}")
+    for error in sorted(set(errors)):
+        print(f"error:       {error}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
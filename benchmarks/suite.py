@@ -0,0 +1,233 @@
+"""Benchmark suite: extraction, rendering, JSON/prompt building, match scoring and the pipeline.
+
+Reports p50/p95 latency, throughput and peak Python memory per case, saves
+results to JSON and flags cases whose p50 regressed against a baseline.
+
+Usage: python -m benchmarks.suite [--stages extract,render,json,match,pipeline]
+       [--repeat N] [--output results.json] [--baseline benchmarks/baseline.json]
+       [--save-baseline] [--threshold 0.2]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+
+from lib import groq_client
+from lib.keywords import KeywordIndex, flatten_skills
+from lib.llm_backend import FakeBackend
+from lib.matching import MatchIndex, job_terms, resume_terms
+from lib.pdf_generator import generate_pdf, measure_layout
+from lib.pdf_parser import extract_text_from_pdf
+from lib.prompt_builder import OPTIMIZE_EXCLUDED_FIELDS, build_resume_prompt, compact_json
+from lib.prompts import OPTIMIZE_RESUME_PROMPT
+from lib.response import parse_json_response, validate_resume
+from lib.translation_memory import extract_segments
+
+from .common import peak_memory_kb, sample_pdf, sample_resume, summarize, time_calls
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+STAGES = ("extract", "render", "json", "match", "pipeline")
+
+EXTRACT_PAGES = (1, 2, 5, 10)
+RENDER_ENTRIES = (1, 5, 10, 25, 50)
+MATCH_JOBS = 5000
+JOB_DESCRIPTION = "Senior ML Engineer: Python, PyTorch, AWS, Kubernetes, production NLP systems."
+
+
+def extract_cases() -> list:
+    """extract_text_from_pdf on 1-10 page PDFs, with the default and fast paths."""
+    cases = []
+    for pages in EXTRACT_PAGES:
+        pdf_bytes = sample_pdf(pages)
+        cases.append((f"extract/{pages}p", lambda b=pdf_bytes: extract_text_from_pdf(b)))
+        cases.append(
+            (f"extract_fast/{pages}p", lambda b=pdf_bytes: extract_text_from_pdf(b, fast=True))
+        )
+    return cases
+
+
+def render_cases() -> list:
+    """generate_pdf on resumes with 1-50 experience entries of 8 bullets each, plus page fitting
+    and an alternate template."""
+    cases = []
+    for entries in RENDER_ENTRIES:
+        resume = sample_resume(n_experience=entries, n_bullets=8)
+        cases.append((f"render/{entries}x8", lambda r=resume: generate_pdf(r)))
+    resume = sample_resume(n_experience=25, n_bullets=8)
+    cases.append(("measure/25x8", lambda: measure_layout(resume)))
+    resume = sample_resume(n_experience=4, n_bullets=8)
+    cases.append(("render_fit/4x8_1p", lambda: generate_pdf(resume, target_pages=1)))
+    cases.append(
+        ("render_template/4x8", lambda: generate_pdf(resume, template="experience_first"))
+    )
+    return cases
+
+
+def json_cases() -> list:
+    """Serialization, prompt building, response parsing, validation and skill ranking of a large
+    resume."""
+    resume = sample_resume(n_experience=50, n_bullets=8)
+    skills = flatten_skills(resume.get("skills", [])) * 10
+    response = json.dumps(resume, indent=2)
+    truncated = response[: int(len(response) * 0.9)]
+    return [
+        ("json/dumps_indent", lambda: json.dumps(resume, indent=2)),
+        ("json/compact", lambda: compact_json(resume)),
+        (
+            "json/build_prompt",
+            lambda: build_resume_prompt(
+                OPTIMIZE_RESUME_PROMPT,
+                resume,
+                OPTIMIZE_EXCLUDED_FIELDS,
+                job_description=JOB_DESCRIPTION,
+            ),
+        ),
+        ("json/parse_response", lambda: parse_json_response(response)),
+        ("json/repair_truncated", lambda: parse_json_response(truncated)),
+        ("json/validate", lambda: validate_resume(resume)),
+        ("json/translation_segments", lambda: extract_segments(resume)),
+        (
+            "json/rank_skills",
+            lambda: KeywordIndex({"text": JOB_DESCRIPTION}).rank(skills),
+        ),
+    ]
+
+
+def match_cases() -> list:
+    """Ranking 5000 synthetic job descriptions per resume, and 100 resumes against them."""
+    words = JOB_DESCRIPTION.split() + [f"term{i}" for i in range(20000)]
+    generator = random.Random(0)
+    jobs = [" ".join(generator.choices(words, k=300)) for _ in range(MATCH_JOBS)]
+    index = MatchIndex.from_jobs(jobs)
+    resume = resume_terms(sample_resume())
+    resumes = [resume_terms(sample_resume(n_experience=n % 6 + 1)) for n in range(100)]
+    return [
+        ("match/index_500_jobs", lambda: MatchIndex.from_jobs(jobs[:500])),
+        (f"match/bm25_top10_{MATCH_JOBS}", lambda: index.top_k(resume, 10)),
+        (f"match/tfidf_top10_{MATCH_JOBS}", lambda: index.top_k(resume, 10, "tfidf")),
+        (f"match/matrix_100x{MATCH_JOBS}", lambda: index.score_matrix(resumes)),
+        ("match/job_terms", lambda: job_terms(jobs[0])),
+    ]
+
+
+def pipeline_cases() -> list:
+    """structure -> optimize -> translate -> render against an instant fake LLM, and the same
+    with every first reply malformed so each call goes through the corrective re-request."""
+    backends = {"clean": FakeBackend(), "repair": FakeBackend(malformed_rate=1.0)}
+    resume = sample_resume()
+    text = "\n".join(
+        [resume["name"], resume["summary"]]
+        + [bullet for entry in resume["experience"] for bullet in entry["bullets"]]
+    )
+
+    def run(render: bool, backend: str = "clean"):
+        groq_client.set_backend(backends[backend])
+        structured = {**resume, **groq_client.structure_resume(text, use_cache=False)}
+        optimized = groq_client.optimize_resume(structured, JOB_DESCRIPTION, use_cache=False)
+        translated = groq_client.translate_resume(optimized, "French", use_cache=False)
+        if render:
+            generate_pdf(translated)
+
+    return [
+        ("pipeline/llm_only", lambda: run(False)),
+        ("pipeline/with_render", lambda: run(True)),
+        ("pipeline/repair", lambda: run(False, "repair")),
+    ]
+
+
+CASE_BUILDERS = {
+    "extract": extract_cases,
+    "render": render_cases,
+    "json": json_cases,
+    "match": match_cases,
+    "pipeline": pipeline_cases,
+}
+
+
+def run_case(fn, repeat: int) -> dict:
+    """Time one case and measure its peak memory in a separate run."""
+    fn()  # Warm up caches and imports
+    timings = time_calls(fn, repeat)
+    stats = summarize(timings)
+    stats["throughput_per_s"] = round(len(timings) / sum(timings), 2)
+    stats["peak_memory_kb"] = peak_memory_kb(fn)
+    return stats
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Find cases whose p50 latency grew by more than threshold over the baseline.
+
+    Returns:
+        List of (case, baseline_p50_ms, current_p50_ms) tuples.
+    """
+    regressions = []
+    for case, stats in results.items():
+        previous = baseline.get(case)
+        if previous and stats["p50_ms"] > previous["p50_ms"] * (1 + threshold):
+            regressions.append((case, previous["p50_ms"], stats["p50_ms"]))
+    return regressions
+
+
+def main(argv: list | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stages", default=",".join(STAGES), help="Comma-separated stages")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--save-baseline", action="store_true", help="Store results as baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed p50 slowdown")
+    args = parser.parse_args(argv)
+
+    # Keep the persistent LLM caches out of the measurements
+    os.environ["RESUME_TAILOR_NO_CACHE"] = "1"
+    os.environ.setdefault("GROQ_REQUESTS_PER_MINUTE", "100000000")
+    os.environ.setdefault("GROQ_TOKENS_PER_MINUTE", "100000000000")
+
+    results = {}
+    print(f"{'case':<28}{'p50':>10}{'p95':>10}{'ops/s':>10}{'peak':>12}")
+    for stage in args.stages.split(","):
+        for case, fn in CASE_BUILDERS[stage]():
+            stats = run_case(fn, args.repeat)
+            results[case] = stats
+            print(
+                f"{case:<28}{stats['p50_ms']:>8.1f}ms{stats['p95_ms']:>8.1f}ms"
+                f"{stats['throughput_per_s']:>10.1f}{stats['peak_memory_kb']:>9.0f}KiB"
+            )
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(report, indent=2))
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        return 0
+
+    baseline = json.loads(baseline_path.read_text())["results"]
+    regressions = compare(results, baseline, args.threshold)
+    for case, before, after in regressions:
+        print(f"REGRESSION {case}: p50 {before:.1f}ms -> {after:.1f}ms", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
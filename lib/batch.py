@@ -0,0 +1,427 @@
+"""Batch tailoring: one resume against many job descriptions or target languages."""
+
+import argparse
+import json
+import multiprocessing
+import re
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import ExitStack
+from io import BytesIO
+from pathlib import Path
+
+from .groq_client import last_call_cached, last_translation_stats, optimize_resume, translate_resume
+from .matching import rank_jobs
+from .pdf_generator import compile_template, generate_pdf, render_pdf
+from .templates import list_templates
+from .translation_memory import SUPPORTED_LANGUAGES
+
+JOB_FILE_SUFFIXES = (".txt", ".md")
+
+# Render workers come from a fork server (or are spawned where there is none)
+# rather than being forked from this process, whose translation and LLM
+# threads may hold locks at that moment that a forked child would inherit
+RENDER_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def load_job_descriptions(source: Path | str) -> list:
+    """
+    Load job descriptions from a directory or a JSONL file.
+
+    A directory contributes one job per .txt/.md file, identified by the file
+    stem. A JSONL file contributes one job per line, read from the "id" and
+    "job_description" (or "text") fields.
+
+    Args:
+        source: Path to a directory or JSONL file.
+
+    Returns:
+        List of {"id": ..., "job_description": ...} dictionaries.
+    """
+    source = Path(source)
+    jobs = []
+
+    if source.is_dir():
+        for path in sorted(source.iterdir()):
+            if path.suffix.lower() in JOB_FILE_SUFFIXES:
+                jobs.append({"id": path.stem, "job_description": path.read_text(encoding="utf-8")})
+    else:
+        with open(source, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                text = record.get("job_description") or record.get("text") or ""
+                jobs.append({"id": str(record.get("id", line_no)), "job_description": text})
+
+    return jobs
+
+
+def _safe_name(job_id: str) -> str:
+    """Turn a job id into a safe file name stem."""
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", job_id).strip("._") or "job"
+
+
+def _optimize_job(resume_json: dict, job: dict, use_cache: bool) -> dict:
+    """Optimize the resume for one job, recording the outcome in a report entry."""
+    entry = {"id": job["id"], "status": "pending", "cached": False}
+    start = time.perf_counter()
+
+    # Rate limits and transient errors are retried by the request scheduler
+    try:
+        entry["resume"] = optimize_resume(resume_json, job["job_description"], use_cache=use_cache)
+        entry["cached"] = last_call_cached()
+        entry["status"] = "optimized"
+    except Exception as e:
+        entry["status"] = "error"
+        entry["error"] = str(e)
+
+    entry["optimize_seconds"] = round(time.perf_counter() - start, 3)
+    return entry
+
+
+def _render(resume_json: dict, target_pages: int | None = None, template=None) -> tuple:
+    """Render one resume in a worker process, returning (pdf_bytes, seconds)."""
+    start = time.perf_counter()
+    pdf_bytes = generate_pdf(resume_json, target_pages, template)
+    return pdf_bytes, time.perf_counter() - start
+
+
+def _render_to_file(
+    resume_json: dict, path: str, target_pages: int | None = None, template=None
+) -> float:
+    """Render one resume to a file in a worker process, returning the seconds taken."""
+    start = time.perf_counter()
+    render_pdf(resume_json, path, target_pages, template)
+    return time.perf_counter() - start
+
+
+def tailor_batch(
+    resume_json: dict,
+    jobs: list,
+    output: Path | str,
+    max_workers: int = 4,
+    render_workers: int | None = None,
+    as_zip: bool = False,
+    use_cache: bool = True,
+    target_pages: int | None = None,
+    template: str | dict | None = None,
+    top_k: int | None = None,
+) -> list:
+    """
+    Tailor one resume against many job descriptions.
+
+    Optimization calls run concurrently in a bounded thread pool, paced by
+    the shared request scheduler to stay within rate limits, and every
+    successful result is rendered in a process pool. Each job produces
+    <id>.json and <id>.pdf plus a shared report.json, written to a folder or
+    to a zip archive. Workers write PDFs to disk and zip entries are streamed
+    from those files, so no rendered PDF is held in memory by this process.
+
+    With top_k, jobs are first ranked locally by BM25 similarity to the
+    resume (see matching.rank_jobs) and only the best k are sent to the model.
+
+    Args:
+        resume_json: Structured resume as a dictionary.
+        jobs: Job dictionaries as returned by load_job_descriptions.
+        output: Output folder, or zip file path when as_zip is True.
+        max_workers: Maximum concurrent optimization calls.
+        render_workers: Worker processes for PDF rendering (default: CPU count).
+        as_zip: Write a zip archive instead of a folder.
+        use_cache: Set to False to bypass the LLM result cache.
+        target_pages: Fit each PDF on at most this many pages.
+        template: Template name or dictionary for the PDFs (default: classic).
+        top_k: Only tailor the resume to the k best matching jobs; the others
+            are reported as "skipped" with their match_score. Jobs tied at
+            the cutoff score are kept in their original order.
+
+    Returns:
+        Per-job status report entries.
+
+    Raises:
+        ValueError: If the template is unknown or malformed, or top_k is
+            less than 1.
+    """
+    if top_k is not None and top_k < 1:
+        raise ValueError(f"top_k must be at least 1, got {top_k}")
+    output = Path(output)
+    # Fail before any LLM call; workers compile and cache the plan themselves
+    compile_template(template)
+
+    # Rank jobs locally so only the best matches cost an LLM call
+    scores = {}
+    selected = range(len(jobs))
+    if top_k is not None:
+        ranking = rank_jobs(resume_json, [job["job_description"] for job in jobs])
+        scores = {index: round(score, 4) for index, score in ranking}
+        selected = sorted(index for index, _ in ranking[:top_k])
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = pool.map(
+            lambda index: _optimize_job(resume_json, jobs[index], use_cache), selected
+        )
+        tailored = dict(zip(selected, results))
+
+    entries = [
+        tailored.get(index, {"id": job["id"], "status": "skipped"})
+        for index, job in enumerate(jobs)
+    ]
+    for index, entry in enumerate(entries):
+        if index in scores:
+            entry["match_score"] = scores[index]
+
+    # One unique file stem per entry, even when job ids repeat or sanitize alike;
+    # "report" is taken by report.json
+    used = {"report"}
+    for entry in entries:
+        stem = _safe_name(entry["id"])
+        while stem in used:
+            stem += "_"
+        used.add(stem)
+        entry["file_stem"] = stem
+
+    optimized = [entry for entry in entries if entry["status"] == "optimized"]
+
+    if as_zip:
+        output.parent.mkdir(parents=True, exist_ok=True)
+    else:
+        output.mkdir(parents=True, exist_ok=True)
+
+    with ExitStack() as stack:
+        if as_zip:
+            archive = stack.enter_context(
+                zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED)
+            )
+            # Workers render into scratch files that are streamed into the archive
+            pdf_dir = Path(stack.enter_context(tempfile.TemporaryDirectory(dir=output.parent)))
+        else:
+            archive = None
+            pdf_dir = output
+
+        def write(file_name: str, data: bytes):
+            if archive is not None:
+                archive.writestr(file_name, data)
+            else:
+                (output / file_name).write_bytes(data)
+
+        for entry in optimized:
+            write(
+                f"{entry['file_stem']}.json",
+                json.dumps(entry["resume"], indent=2, ensure_ascii=False).encode("utf-8"),
+            )
+
+        # PDFs go to disk in the workers, so memory stays bounded however many jobs there are
+        pool = stack.enter_context(
+            ProcessPoolExecutor(max_workers=render_workers, mp_context=RENDER_MP_CONTEXT)
+        )
+        futures = {
+            pool.submit(
+                _render_to_file,
+                entry["resume"],
+                str(pdf_dir / f"{entry['file_stem']}.pdf"),
+                target_pages,
+                template,
+            ): entry
+            for entry in optimized
+        }
+        for future in as_completed(futures):
+            entry = futures[future]
+            file_name = f"{entry['file_stem']}.pdf"
+            try:
+                seconds = future.result()
+            except Exception as e:
+                entry["status"] = "error"
+                entry["error"] = f"Error generating PDF: {e}"
+                continue
+            if archive is not None:
+                path = pdf_dir / file_name
+                with open(path, "rb") as src, archive.open(file_name, "w") as dst:
+                    shutil.copyfileobj(src, dst)
+                path.unlink()
+            entry["render_seconds"] = round(seconds, 3)
+            entry["pdf"] = file_name
+            entry["status"] = "ok"
+
+        report = [{k: v for k, v in entry.items() if k != "resume"} for entry in entries]
+        write("report.json", json.dumps(report, indent=2).encode("utf-8"))
+
+    return report
+
+
+def _translate_language(resume_json: dict, language: str, use_cache: bool) -> dict:
+    """Translate the resume into one language, recording the outcome in a report entry."""
+    entry = {"language": language, "status": "pending"}
+    start = time.perf_counter()
+
+    try:
+        entry["resume"] = translate_resume(resume_json, language, use_cache=use_cache)
+        entry["reused_strings"] = last_translation_stats()["reused"]
+        entry["status"] = "translated"
+    except Exception as e:
+        entry["status"] = "error"
+        entry["error"] = str(e)
+
+    entry["translate_seconds"] = round(time.perf_counter() - start, 3)
+    return entry
+
+
+def export_languages(
+    resume_json: dict,
+    languages: list,
+    file_stem: str = "resume",
+    render_workers: int | None = None,
+    use_cache: bool = True,
+    target_pages: int | None = None,
+    template: str | dict | None = None,
+) -> tuple:
+    """
+    Translate a resume into several languages and package the PDFs as one zip.
+
+    All translations run concurrently, and each one is handed to a process
+    pool for rendering as soon as it finishes, so overall latency is close to
+    the slowest single translation plus one render rather than the sum.
+
+    Args:
+        resume_json: Structured resume as a dictionary.
+        languages: Target language names, e.g. ["French", "German"].
+        file_stem: File name prefix; files are named <stem>_<code>.pdf/.json.
+        render_workers: Worker processes for PDF rendering (default: CPU count).
+        use_cache: Set to False to bypass the LLM result cache and translation memory.
+        target_pages: Fit each PDF on at most this many pages.
+        template: Template name or dictionary for the PDFs (default: classic).
+
+    Returns:
+        (zip_bytes, report) where report has one entry per language with its
+        status, translate_seconds, render_seconds and ready_seconds (time from
+        the start of the export until its PDF was ready). The zip also
+        contains the translated JSON and report.json.
+
+    Raises:
+        ValueError: If the template is unknown or malformed.
+    """
+    languages = list(dict.fromkeys(languages))
+    compile_template(template)
+    start = time.perf_counter()
+    entries = {}
+    buffer = BytesIO()
+
+    with (
+        zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as zf,
+        ThreadPoolExecutor(max_workers=len(languages) or 1) as translate_pool,
+        ProcessPoolExecutor(
+            max_workers=render_workers, mp_context=RENDER_MP_CONTEXT
+        ) as render_pool,
+    ):
+        pending = {
+            translate_pool.submit(_translate_language, resume_json, language, use_cache)
+            for language in languages
+        }
+        renders = {}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future not in renders:
+                    # A translation finished: start rendering it right away
+                    entry = future.result()
+                    entries[entry["language"]] = entry
+                    if entry["status"] == "translated":
+                        render = render_pool.submit(
+                            _render, entry["resume"], target_pages, template
+                        )
+                        renders[render] = entry["language"]
+                        pending.add(render)
+                    continue
+
+                # Each PDF goes into the archive as soon as it arrives
+                language = renders.pop(future)
+                entry = entries[language]
+                name = f"{file_stem}_{SUPPORTED_LANGUAGES.get(language) or _safe_name(language)}"
+                try:
+                    pdf_bytes, seconds = future.result()
+                except Exception as e:
+                    entry["status"] = "error"
+                    entry["error"] = f"Error generating PDF: {e}"
+                    continue
+                entry["ready_seconds"] = round(time.perf_counter() - start, 3)
+                zf.writestr(f"{name}.pdf", pdf_bytes)
+                zf.writestr(
+                    f"{name}.json", json.dumps(entry["resume"], indent=2, ensure_ascii=False)
+                )
+                entry["render_seconds"] = round(seconds, 3)
+                entry["pdf"] = f"{name}.pdf"
+                entry["status"] = "ok"
+
+        report = [
+            {k: v for k, v in entries[language].items() if k != "resume"}
+            for language in languages
+        ]
+        zf.writestr("report.json", json.dumps(report, indent=2))
+
+    return buffer.getvalue(), report
+
+
+def main(argv: list | None = None) -> int:
+    """Command-line entry point: python -m lib.batch RESUME JOBS -o OUTPUT."""
+    parser = argparse.ArgumentParser(
+        description="Tailor one structured resume against many job descriptions."
+    )
+    parser.add_argument("resume", help="Structured resume JSON file")
+    parser.add_argument("jobs", help="Directory of .txt/.md job descriptions or a JSONL file")
+    parser.add_argument("-o", "--output", required=True, help="Output folder or .zip file")
+    parser.add_argument("--zip", action="store_true", help="Write a zip archive")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent LLM calls")
+    parser.add_argument("--render-workers", type=int, default=None, help="PDF render processes")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the LLM result cache")
+    parser.add_argument("--pages", type=int, default=None, help="Fit each PDF on N pages")
+    parser.add_argument(
+        "--template", choices=list_templates(), default=None, help="PDF template (default: classic)"
+    )
+    parser.add_argument(
+        "--top-k", type=int, default=None, help="Only tailor to the K best matching jobs"
+    )
+    args = parser.parse_args(argv)
+    if args.top_k is not None and args.top_k < 1:
+        parser.error("--top-k must be at least 1")
+
+    with open(args.resume, encoding="utf-8") as f:
+        resume_json = json.load(f)
+    jobs = load_job_descriptions(args.jobs)
+
+    report = tailor_batch(
+        resume_json,
+        jobs,
+        args.output,
+        max_workers=args.workers,
+        render_workers=args.render_workers,
+        as_zip=args.zip or args.output.endswith(".zip"),
+        use_cache=not args.no_cache,
+        target_pages=args.pages,
+        template=args.template,
+        top_k=args.top_k,
+    )
+
+    failed = [entry for entry in report if entry["status"] not in ("ok", "skipped")]
+    for entry in report:
+        line = f"{entry['id']}: {entry['status']}"
+        if entry.get("error"):
+            line += f" ({entry['error']})"
+        print(line)
+    tailored = sum(entry["status"] == "ok" for entry in report)
+    print(f"{tailored}/{len(report)} jobs tailored -> {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""Persistent content-addressed cache for LLM results."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_CACHE_PATH = Path(
+    os.getenv(
+        "RESUME_TAILOR_CACHE_PATH",
+        Path.home() / ".cache" / "resume-tailor" / "llm_cache.sqlite3",
+    )
+)
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 500
+
+
+def make_key(*parts) -> str:
+    """
+    Build a stable cache key from JSON-serializable parts.
+
+    Args:
+        parts: Values identifying the request (model, template, inputs, ...).
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding of the parts.
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """SQLite-backed cache with TTL expiry and LRU eviction."""
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_CACHE_PATH,
+        ttl: float | None = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str):
+        """Return the cached value for a key, or None on miss or expiry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, created_at = row
+            if self.ttl is not None and now - created_at > self.ttl:
+                self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE results SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(value)
+
+    def set(self, key: str, value) -> None:
+        """Store a JSON-serializable value and evict least recently used entries."""
+        now = time.time()
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, payload, now, now),
+            )
+            self._conn.execute(
+                """
+                DELETE FROM results WHERE key IN (
+                    SELECT key FROM results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove every entry and reset the hit/miss counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the current number of entries."""
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ResultCache:
+    """Get the process-wide result cache, creating it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResultCache()
+        return _cache
+
+
+def cache_enabled() -> bool:
+    """Return False when caching is disabled via RESUME_TAILOR_NO_CACHE."""
+    return os.getenv("RESUME_TAILOR_NO_CACHE", "").lower() not in ("1", "true", "yes")
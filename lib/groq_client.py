@@ -1,18 +1,108 @@
-"""Groq API client for LLM operations."""
+"""LLM operations on resumes, backed by Groq or another LLMBackend."""
 
+import asyncio
+import copy
 import json
+import logging
 import os
-from groq import Groq
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import partial
+import httpx
+from groq import AsyncGroq, BadRequestError, DefaultAsyncHttpxClient, DefaultHttpxClient, Groq
 from dotenv import load_dotenv
-from .prompts import STRUCTURE_RESUME_PROMPT, OPTIMIZE_RESUME_PROMPT, TRANSLATE_RESUME_PROMPT
+from .cache import cache_enabled, get_cache, make_key
+from .json_stream import JSONSectionParser
+from .keywords import rank_skills
+from .llm_backend import Completion, FakeBackend, LLMBackend, Usage
+from .metrics import increment, span, traced
+from .prompt_builder import OPTIMIZE_EXCLUDED_FIELDS, build_resume_prompt, compact_json, merge_fields
+from .response import (
+    TruncatedJSONError,
+    coerce_resume,
+    parse_json_response,
+    validate_job_analysis,
+    validate_resume,
+    validate_section_value,
+    validate_translations,
+)
+from .scheduler import estimate_tokens, get_scheduler
+from .sections import apply_patch, default_section_paths, get_section, section_context, section_kind
+from .translation_memory import apply_translations, extract_segments, get_translation_memory
+from .prompts import (
+    STRUCTURE_RESUME_PROMPT,
+    ANALYZE_JOB_PROMPT,
+    OPTIMIZE_ANALYZED_RESUME_PROMPT,
+    OPTIMIZE_RESUME_PROMPT,
+    OPTIMIZE_SECTION_PROMPT,
+    REPAIR_JSON_PROMPT,
+    SECTION_INSTRUCTIONS,
+    TRANSLATE_STRINGS_PROMPT,
+)
 
 load_dotenv()
 
-MODEL = "llama-3.3-70b-versatile"
+logger = logging.getLogger(__name__)
 
+MODEL = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
 
-def get_client() -> Groq:
-    """Get Groq client instance."""
+# Ask the API to constrain non-streamed completions to a JSON object
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# LLM backend: "groq" (default) or "fake" for offline load testing
+BACKEND = os.getenv("RESUME_TAILOR_LLM_BACKEND", "groq")
+
+# Completion budget per section kind for section-scoped optimization
+SECTION_MAX_TOKENS = {"professional_title": 50, "summary": 400, "skills": 400, "bullets": 1000}
+
+# Estimated prompt tokens of untranslated strings sent per translation request
+TRANSLATION_BATCH_TOKENS = 1500
+
+# Optimize against a cached analysis of the job description rather than the raw
+# posting (set RESUME_TAILOR_JOB_ANALYSIS=0 to send the posting itself)
+ANALYZE_JOBS = os.getenv("RESUME_TAILOR_JOB_ANALYSIS", "1").lower() not in ("0", "false", "no")
+
+# Completion budget of a job analysis
+JOB_ANALYSIS_MAX_TOKENS = 800
+
+# Largest completion budget a request cut off at its token limit is retried with
+MAX_COMPLETION_TOKENS = 8000
+
+# Problem reported for output cut off before its JSON value was complete
+OUTPUT_CUT_OFF = "output was cut off at the token limit"
+
+# Job analyses kept in memory, in front of the result cache
+JOB_ANALYSIS_CACHE_SIZE = 256
+
+# HTTP connection pool settings shared by the sync and async clients
+MAX_CONNECTIONS = int(os.getenv("GROQ_MAX_CONNECTIONS", "20"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("GROQ_MAX_KEEPALIVE_CONNECTIONS", "10"))
+KEEPALIVE_EXPIRY = float(os.getenv("GROQ_KEEPALIVE_EXPIRY", "30"))
+
+# Whether the most recent call in the current thread/task was served from cache
+_last_call_cached = ContextVar("last_call_cached", default=False)
+
+# Estimated token counts of the most recent resume prompt in the current thread/task
+_last_prompt_stats = ContextVar("last_prompt_stats", default=None)
+
+# Translation memory usage of the most recent translation in the current thread/task
+_last_translation_stats = ContextVar("last_translation_stats", default=None)
+
+_client = None
+_client_lock = threading.Lock()
+_backend = None
+# One async client per event loop, since httpx async pools are bound to a loop
+_async_clients = weakref.WeakKeyDictionary()
+# Job analyses by (model, normalized posting) key, least recently used first
+_job_analyses = OrderedDict()
+_job_analyses_lock = threading.Lock()
+
+
+def _get_api_key() -> str:
+    """Resolve the Groq API key from Streamlit secrets or the environment."""
     # Try st.secrets first (Streamlit Cloud), then fall back to env vars
     api_key = None
     try:
@@ -26,111 +116,1082 @@ def get_client() -> Groq:
 
     if not api_key:
         raise ValueError("GROQ_API_KEY not found in secrets or environment variables")
-    return Groq(api_key=api_key)
+    return api_key
+
+
+def _pool_limits() -> httpx.Limits:
+    """Connection pool limits for the shared HTTP clients."""
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
 
 
-def structure_resume(resume_text: str) -> dict:
+def get_client() -> Groq:
+    """Get the shared Groq client, creating it with a pooled HTTP client on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            # Retries are handled by the request scheduler
+            _client = Groq(
+                api_key=_get_api_key(),
+                http_client=DefaultHttpxClient(limits=_pool_limits()),
+                max_retries=0,
+            )
+        return _client
+
+
+def get_async_client() -> AsyncGroq:
+    """Get the shared AsyncGroq client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = AsyncGroq(
+            api_key=_get_api_key(),
+            http_client=DefaultAsyncHttpxClient(limits=_pool_limits()),
+            max_retries=0,
+        )
+        _async_clients[loop] = client
+    return client
+
+
+def configure_pool(
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = None,
+) -> None:
     """
-    Use LLM to structure raw resume text into JSON format.
+    Change connection pool settings and drop the shared clients.
+
+    Clients created afterwards use the new settings.
 
     Args:
-        resume_text: Raw text extracted from PDF.
+        max_connections: Maximum concurrent connections.
+        max_keepalive_connections: Maximum idle connections kept open.
+        keepalive_expiry: Seconds an idle connection is kept alive.
+    """
+    global _client, MAX_CONNECTIONS, MAX_KEEPALIVE_CONNECTIONS, KEEPALIVE_EXPIRY
+    with _client_lock:
+        if max_connections is not None:
+            MAX_CONNECTIONS = max_connections
+        if max_keepalive_connections is not None:
+            MAX_KEEPALIVE_CONNECTIONS = max_keepalive_connections
+        if keepalive_expiry is not None:
+            KEEPALIVE_EXPIRY = keepalive_expiry
+        if _client is not None:
+            _client.close()
+        _client = None
+        _async_clients.clear()
+
+
+def _failed_generation(error: BadRequestError) -> str | None:
+    """Return the rejected output of a JSON-mode request, if the API included it."""
+    body = error.body if isinstance(error.body, dict) else {}
+    details = body.get("error", body)
+    if isinstance(details, dict) and details.get("code") == "json_validate_failed":
+        return details.get("failed_generation")
+    return None
+
+
+def _groq_completion(response) -> Completion:
+    """Convert a Groq chat completion to a Completion."""
+    usage = response.usage
+    if usage is not None:
+        usage = Usage(usage.prompt_tokens, usage.completion_tokens, usage.total_tokens)
+    choice = response.choices[0]
+    return Completion(choice.message.content, usage, choice.finish_reason)
+
+
+class GroqBackend(LLMBackend):
+    """LLMBackend using the shared, pooled Groq clients."""
+
+    def __init__(self, model: str = MODEL):
+        self.model = model
+
+    def complete(self, messages: list, temperature: float, max_tokens: int) -> Completion:
+        try:
+            response = get_client().chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=JSON_RESPONSE_FORMAT,
+            )
+        except BadRequestError as e:
+            # Output rejected by JSON mode is often repairable locally
+            content = _failed_generation(e)
+            if content is None:
+                raise
+            return Completion(content)
+        return _groq_completion(response)
+
+    async def acomplete(self, messages: list, temperature: float, max_tokens: int) -> Completion:
+        try:
+            response = await get_async_client().chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=JSON_RESPONSE_FORMAT,
+            )
+        except BadRequestError as e:
+            content = _failed_generation(e)
+            if content is None:
+                raise
+            return Completion(content)
+        return _groq_completion(response)
+
+    def stream(self, messages: list, temperature: float, max_tokens: int):
+        # JSON mode is not available for streamed requests
+        response = get_client().chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        return (
+            chunk.choices[0].delta.content
+            for chunk in response
+            if chunk.choices and chunk.choices[0].delta.content
+        )
+
+
+def get_backend() -> LLMBackend:
+    """Get the LLM backend selected by RESUME_TAILOR_LLM_BACKEND, creating it on first use."""
+    global _backend
+    with _client_lock:
+        if _backend is None:
+            _backend = FakeBackend.from_env() if BACKEND == "fake" else GroqBackend()
+        return _backend
+
+
+def set_backend(backend: LLMBackend | None) -> None:
+    """Use a different LLM backend for all later calls (None restores the default)."""
+    global _backend
+    with _client_lock:
+        _backend = backend
+
+
+def last_call_cached() -> bool:
+    """Return True if the last LLM call in this thread or task was served from cache."""
+    return _last_call_cached.get()
+
+
+def last_prompt_stats() -> dict | None:
+    """
+    Return estimated token counts for the last resume prompt in this thread or task.
+
+    The dictionary has the task name, prompt_tokens for the compact prompt,
+    baseline_tokens for the previous indented full-resume prompt and
+    saved_tokens.
+    """
+    return _last_prompt_stats.get()
+
+
+def last_translation_stats() -> dict | None:
+    """
+    Return translation memory usage for the last translation in this thread or task.
+
+    The dictionary has the target language, the number of distinct strings,
+    how many were reused from the translation memory and how many were sent
+    to the model.
+    """
+    return _last_translation_stats.get()
+
+
+def _resume_prompt(task: str, template: str, resume_json: dict, excluded: tuple, **fields) -> tuple:
+    """Build a compact resume prompt and record its estimated token counts."""
+    prompt, held_back, stats = build_resume_prompt(template, resume_json, excluded, **fields)
+    stats = {"task": task, **stats}
+    _last_prompt_stats.set(stats)
+    logger.info(
+        "%s prompt: ~%d tokens (~%d saved by compaction)",
+        task,
+        stats["prompt_tokens"],
+        stats["saved_tokens"],
+    )
+    return prompt, held_back
+
+
+def _merge_stream(events, held_back: dict, key_order: list):
+    """Re-insert held-back fields into the final document of a section stream."""
+    for path, value in events:
+        if not path:
+            value = merge_fields(value, held_back, key_order)
+        yield path, value
+
+
+def _check_response(content: str, validate, finish_reason: str | None = None) -> tuple:
+    """
+    Parse, locally repair and validate model output.
+
+    Only syntax slips such as trailing commas and code fences are repaired;
+    output cut off at the token limit is rejected, since closing it would
+    silently drop its last elements.
 
     Returns:
-        Structured resume as a dictionary.
+        (result, errors) where result is None if the output could not be
+        parsed, and errors lists the problems found (empty when usable).
     """
-    client = get_client()
+    if finish_reason == "length":
+        return None, [OUTPUT_CUT_OFF]
+    with span("llm.parse", chars=len(content)):
+        try:
+            result = parse_json_response(content, allow_truncated=False)
+        except TruncatedJSONError:
+            return None, [OUTPUT_CUT_OFF]
+        except json.JSONDecodeError as e:
+            return None, [f"invalid JSON: {e}"]
 
-    prompt = STRUCTURE_RESUME_PROMPT.format(resume_text=resume_text)
+        if isinstance(result, dict):
+            coerce_resume(result)
+        return result, validate(result)
+
+
+def _repair_messages(prompt: str, content: str, errors: list) -> list:
+    """Conversation asking the model to correct its previous output."""
+    return [
+        {"role": "user", "content": prompt},
+        {"role": "assistant", "content": content},
+        {
+            "role": "user",
+            "content": REPAIR_JSON_PROMPT.format(errors="\n".join(f"- {e}" for e in errors)),
+        },
+    ]
+
+
+def _retry_request(prompt: str, content: str, errors: list, max_tokens: int) -> tuple:
+    """
+    Messages and completion budget for the one re-request after unusable output.
+
+    Output cut off at the token limit is requested again with twice the
+    budget; other problems get a corrective conversation.
+
+    Returns:
+        (messages, max_tokens).
+    """
+    if errors == [OUTPUT_CUT_OFF]:
+        max_tokens = min(2 * max_tokens, MAX_COMPLETION_TOKENS)
+        logger.warning("Re-requesting truncated response with max_tokens=%d", max_tokens)
+        return [{"role": "user", "content": prompt}], max_tokens
+    logger.warning("Re-requesting invalid JSON response: %s", "; ".join(errors))
+    return _repair_messages(prompt, content, errors), max_tokens
+
+
+def _record_usage(backend: LLMBackend, completion: Completion) -> None:
+    """Add the token usage reported for a completion to the metrics."""
+    if completion.usage is not None:
+        increment("llm_prompt_tokens_total", completion.usage.prompt_tokens, model=backend.model)
+        increment(
+            "llm_completion_tokens_total", completion.usage.completion_tokens, model=backend.model
+        )
+
+
+def _request_json(messages: list, temperature: float, max_tokens: int) -> Completion:
+    """Send a JSON-mode chat request through the scheduler and return the completion."""
+    backend = get_backend()
+    completion = get_scheduler().call(
+        lambda: backend.complete(messages, temperature, max_tokens),
+        tokens=estimate_tokens(compact_json(messages)) + max_tokens,
+    )
+    _record_usage(backend, completion)
+    return completion
+
+
+async def _arequest_json(messages: list, temperature: float, max_tokens: int) -> Completion:
+    """Async counterpart of _request_json."""
+    backend = get_backend()
+    completion = await get_scheduler().acall(
+        lambda: backend.acomplete(messages, temperature, max_tokens),
+        tokens=estimate_tokens(compact_json(messages)) + max_tokens,
+    )
+    _record_usage(backend, completion)
+    return completion
+
+
+def _valid_or_raise(result, errors: list):
+    """Return a checked result, or raise if it is still unusable after the re-request."""
+    if errors:
+        raise ValueError("Model returned unusable JSON: " + "; ".join(errors))
+    return result
+
+
+def _cache_lookup(template: str, prompt: str, temperature: float, use_cache: bool) -> tuple:
+    """
+    Look up a request in the result cache.
+
+    Returns:
+        (key, cached_value). key is None when caching is bypassed, and
+        cached_value is None on a miss.
+    """
+    _last_call_cached.set(False)
+    if not (use_cache and cache_enabled()):
+        return None, None
+
+    key = make_key(get_backend().model, template, prompt, temperature)
+    cached = get_cache().get(key)
+    if cached is not None:
+        _last_call_cached.set(True)
+        increment("cache_hits_total", cache="llm")
+    else:
+        increment("cache_misses_total", cache="llm")
+    return key, cached
+
+
+def _complete_json(
+    template: str,
+    prompt: str,
+    temperature: float,
+    max_tokens: int = 4000,
+    use_cache: bool = True,
+    validate=validate_resume,
+) -> dict:
+    """
+    Send a prompt to the model and parse the JSON response, going through the cache.
+
+    The request uses JSON mode. Malformed output is repaired locally where
+    possible; only output that is still unparseable or fails validation
+    triggers one corrective re-request, and output cut off at the token
+    limit is requested again with a larger budget. Only usable output is
+    cached.
+
+    Args:
+        template: Unrendered prompt template (part of the cache key).
+        prompt: Rendered prompt sent to the model.
+        temperature: Sampling temperature.
+        max_tokens: Maximum completion tokens.
+        use_cache: Set to False to bypass the cache for this call.
+        validate: Callable returning a list of problems with the parsed result.
+
+    Returns:
+        Parsed JSON response as a dictionary.
+
+    Raises:
+        ValueError: If the response is still unusable after the re-request.
+    """
+    key, cached = _cache_lookup(template, prompt, temperature, use_cache)
+    if cached is not None:
+        return cached
+
+    messages = [{"role": "user", "content": prompt}]
+    completion = _request_json(messages, temperature, max_tokens)
+    result, errors = _check_response(completion.content, validate, completion.finish_reason)
+
+    if errors:
+        messages, max_tokens = _retry_request(prompt, completion.content, errors, max_tokens)
+        completion = _request_json(messages, temperature, max_tokens)
+        result = _valid_or_raise(
+            *_check_response(completion.content, validate, completion.finish_reason)
+        )
+
+    if key is not None:
+        get_cache().set(key, result)
+
+    return result
+
+
+async def _acomplete_json(
+    template: str,
+    prompt: str,
+    temperature: float,
+    max_tokens: int = 4000,
+    use_cache: bool = True,
+    validate=validate_resume,
+) -> dict:
+    """Async counterpart of _complete_json."""
+    key, cached = _cache_lookup(template, prompt, temperature, use_cache)
+    if cached is not None:
+        return cached
+
+    messages = [{"role": "user", "content": prompt}]
+    completion = await _arequest_json(messages, temperature, max_tokens)
+    result, errors = _check_response(completion.content, validate, completion.finish_reason)
+
+    if errors:
+        messages, max_tokens = _retry_request(prompt, completion.content, errors, max_tokens)
+        completion = await _arequest_json(messages, temperature, max_tokens)
+        result = _valid_or_raise(
+            *_check_response(completion.content, validate, completion.finish_reason)
+        )
+
+    if key is not None:
+        get_cache().set(key, result)
+
+    return result
+
+
+def _replay_sections(document: dict):
+    """Yield a finished document as the same (path, value) events as a live stream."""
+    for section, value in document.items():
+        yield from _section_events(section, value)
+    yield (), document
+
+
+def _section_events(section: str, value):
+    """Yield the (path, value) events of one finished top-level section."""
+    if isinstance(value, list) and section in ("experience", "projects"):
+        for index, item in enumerate(value):
+            yield (section, index), item
+    yield (section,), value
+
+
+def _stream_json(
+    template: str,
+    prompt: str,
+    temperature: float,
+    max_tokens: int = 4000,
+    use_cache: bool = True,
+):
+    """
+    Stream a JSON response from the model, yielding sections as they complete.
+
+    Args:
+        template: Unrendered prompt template (part of the cache key).
+        prompt: Rendered prompt sent to the model.
+        temperature: Sampling temperature.
+        max_tokens: Maximum completion tokens.
+        use_cache: Set to False to bypass the cache for this call.
+
+    Yields:
+        (path, value) tuples: (key,) for each completed top-level section,
+        (key, index) for each completed experience/project entry, and finally
+        ((), document) with the full parsed response.
+
+    JSON mode is not available for streamed requests, so the final buffer is
+    repaired and validated locally, with one non-streamed corrective
+    re-request if that fails (a larger one if the stream was cut off).
+    """
+    key, cached = _cache_lookup(template, prompt, temperature, use_cache)
+    if cached is not None:
+        yield from _replay_sections(cached)
+        return
+
+    backend = get_backend()
+    messages = [{"role": "user", "content": prompt}]
+
+    # Only opening the stream is retried; failures mid-stream propagate
+    deltas = get_scheduler().call(
+        lambda: backend.stream(messages, temperature, max_tokens),
+        tokens=estimate_tokens(prompt) + max_tokens,
+    )
+
+    parser = JSONSectionParser()
+    with span("llm.stream"):
+        for delta in deltas:
+            yield from parser.feed(delta)
+
+    result, errors = _check_response(parser.buffer, validate_resume)
+
+    if errors:
+        messages, max_tokens = _retry_request(prompt, parser.buffer, errors, max_tokens)
+        completion = _request_json(messages, temperature, max_tokens)
+        result = _valid_or_raise(
+            *_check_response(completion.content, validate_resume, completion.finish_reason)
+        )
+
+    if key is not None:
+        get_cache().set(key, result)
+
+    yield (), result
+
+
+def _normalize_job_description(job_description: str) -> str:
+    """Strip blank lines and repeated spaces, so reformatted copies of a posting match."""
+    lines = (" ".join(line.split()) for line in job_description.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _analysis_lookup(text: str, use_cache: bool) -> tuple:
+    """
+    Look up a job analysis in memory.
+
+    Returns:
+        (key, analysis) where analysis is None on a miss or when caching is
+        bypassed.
+    """
+    key = make_key(get_backend().model, ANALYZE_JOB_PROMPT, text)
+    if not (use_cache and cache_enabled()):
+        return key, None
+    with _job_analyses_lock:
+        analysis = _job_analyses.get(key)
+        if analysis is not None:
+            _job_analyses.move_to_end(key)
+    if analysis is not None:
+        increment("cache_hits_total", cache="job_analysis")
+        _last_call_cached.set(True)
+        return key, copy.deepcopy(analysis)
+    increment("cache_misses_total", cache="job_analysis")
+    return key, None
+
+
+def _analysis_store(key: str, analysis: dict) -> None:
+    """Keep a job analysis in memory, evicting the least recently used beyond the limit."""
+    with _job_analyses_lock:
+        _job_analyses[key] = copy.deepcopy(analysis)
+        _job_analyses.move_to_end(key)
+        while len(_job_analyses) > JOB_ANALYSIS_CACHE_SIZE:
+            _job_analyses.popitem(last=False)
+
+
+def clear_job_analyses() -> None:
+    """Drop the in-memory job analyses (the result cache keeps its copies)."""
+    with _job_analyses_lock:
+        _job_analyses.clear()
+
+
+@traced("analyze_job")
+def analyze_job_description(job_description: str, use_cache: bool = True) -> dict:
+    """
+    Extract the title, seniority, skills and keywords of a job description.
+
+    Runs once per distinct posting: analyses are kept in memory and in the
+    result cache, so tailoring many resumes to one job re-reads the compact
+    analysis instead of sending the full posting each time.
+
+    Args:
+        job_description: Job posting text.
+        use_cache: Set to False to bypass both caches.
 
-    response = client.chat.completions.create(
-        model=MODEL,
-        messages=[{"role": "user", "content": prompt}],
+    Returns:
+        Dictionary with title, seniority, required_skills, preferred_skills,
+        keywords and responsibilities.
+    """
+    text = _normalize_job_description(job_description)
+    key, analysis = _analysis_lookup(text, use_cache)
+    if analysis is not None:
+        return analysis
+
+    prompt = ANALYZE_JOB_PROMPT.format(job_description=text)
+    analysis = _complete_json(
+        ANALYZE_JOB_PROMPT,
+        prompt,
         temperature=0.1,
-        max_tokens=4000,
+        max_tokens=JOB_ANALYSIS_MAX_TOKENS,
+        use_cache=use_cache,
+        validate=validate_job_analysis,
     )
+    if use_cache and cache_enabled():
+        _analysis_store(key, analysis)
+    return analysis
+
+
+def _optimize_prompt(resume_json: dict, job_description: str, job_analysis: dict | None) -> tuple:
+    """
+    Build the optimization prompt, against a job analysis when one is given.
 
-    content = response.choices[0].message.content.strip()
+    With an analysis, the raw posting is replaced by the compact analysis and
+    the resume's skills ranked locally by the job's keyword index.
 
-    # Handle potential markdown code blocks
-    if content.startswith("```"):
-        content = content.split("```")[1]
-        if content.startswith("json"):
-            content = content[4:]
-        content = content.strip()
+    Returns:
+        (template, prompt, held_back).
 
-    return json.loads(content)
+    Raises:
+        ValueError: If the job analysis is malformed.
+    """
+    if job_analysis is None:
+        prompt, held_back = _resume_prompt(
+            "optimize_resume",
+            OPTIMIZE_RESUME_PROMPT,
+            resume_json,
+            OPTIMIZE_EXCLUDED_FIELDS,
+            job_description=job_description,
+        )
+        return OPTIMIZE_RESUME_PROMPT, prompt, held_back
+
+    errors = validate_job_analysis(job_analysis)
+    if errors:
+        raise ValueError("Invalid job analysis: " + "; ".join(errors))
+    ranked = rank_skills(resume_json.get("skills", []), job_description, job_analysis)
+    prompt, held_back = _resume_prompt(
+        "optimize_resume",
+        OPTIMIZE_ANALYZED_RESUME_PROMPT,
+        resume_json,
+        OPTIMIZE_EXCLUDED_FIELDS,
+        job_analysis=compact_json(job_analysis),
+        ranked_skills=compact_json([skill for skill, score in ranked if score > 0]),
+    )
+    return OPTIMIZE_ANALYZED_RESUME_PROMPT, prompt, held_back
 
 
-def optimize_resume(resume_json: dict, job_description: str) -> dict:
+@traced("structure_resume")
+def structure_resume(resume_text: str, use_cache: bool = True) -> dict:
+    """
+    Use LLM to structure raw resume text into JSON format.
+
+    Args:
+        resume_text: Raw text extracted from PDF.
+        use_cache: Set to False to bypass the result cache.
+
+    Returns:
+        Structured resume as a dictionary.
+    """
+    prompt = STRUCTURE_RESUME_PROMPT.format(resume_text=resume_text)
+
+    return _complete_json(STRUCTURE_RESUME_PROMPT, prompt, temperature=0.1, use_cache=use_cache)
+
+
+@traced("optimize_resume")
+def optimize_resume(
+    resume_json: dict,
+    job_description: str,
+    use_cache: bool = True,
+    job_analysis: dict | None = None,
+) -> dict:
     """
     Optimize resume for a specific job description.
 
     Args:
         resume_json: Structured resume as a dictionary.
         job_description: Target job description text.
+        use_cache: Set to False to bypass the result cache.
+        job_analysis: Analysis of the job description from
+            analyze_job_description; analyzed (and cached) on demand if omitted.
 
     Returns:
         Optimized resume as a dictionary.
+
+    Raises:
+        ValueError: If a supplied job_analysis is malformed.
+    """
+    if job_analysis is None and ANALYZE_JOBS:
+        job_analysis = analyze_job_description(job_description, use_cache)
+    template, prompt, held_back = _optimize_prompt(resume_json, job_description, job_analysis)
+
+    result = _complete_json(template, prompt, temperature=0.3, use_cache=use_cache)
+    return merge_fields(result, held_back, list(resume_json))
+
+
+@traced("optimize_resume_stream")
+def optimize_resume_stream(
+    resume_json: dict,
+    job_description: str,
+    use_cache: bool = True,
+    job_analysis: dict | None = None,
+):
+    """
+    Streaming variant of optimize_resume.
+
+    Args:
+        resume_json: Structured resume as a dictionary.
+        job_description: Target job description text.
+        use_cache: Set to False to bypass the result cache.
+        job_analysis: Analysis of the job description, as for optimize_resume.
+
+    Yields:
+        (path, value) tuples as sections complete; the last item is
+        ((), optimized_resume).
+
+    Raises:
+        ValueError: If a supplied job_analysis is malformed.
+    """
+    if job_analysis is None and ANALYZE_JOBS:
+        job_analysis = analyze_job_description(job_description, use_cache)
+    template, prompt, held_back = _optimize_prompt(resume_json, job_description, job_analysis)
+
+    events = _stream_json(template, prompt, temperature=0.3, use_cache=use_cache)
+    yield from _merge_stream(events, held_back, list(resume_json))
+
+
+@traced("optimize_section")
+def optimize_section(
+    resume_json: dict, path: str, job_description: str, use_cache: bool = True
+):
     """
-    client = get_client()
+    Optimize a single resume section for a job description.
+
+    Args:
+        resume_json: Structured resume as a dictionary.
+        path: Section path, e.g. "summary", "skills" or "experience[0].bullets".
+        job_description: Target job description text.
+        use_cache: Set to False to bypass the result cache.
+
+    Returns:
+        Optimized value for the section.
 
-    prompt = OPTIMIZE_RESUME_PROMPT.format(
-        resume_json=json.dumps(resume_json, indent=2),
+    Raises:
+        ValueError: If path is not an optimizable section.
+    """
+    kind = section_kind(path)
+    prompt = OPTIMIZE_SECTION_PROMPT.format(
+        section_path=path,
+        section_json=compact_json(get_section(resume_json, path)),
+        context_json=compact_json(section_context(resume_json, path)),
         job_description=job_description,
+        section_instructions=SECTION_INSTRUCTIONS[kind],
     )
 
-    response = client.chat.completions.create(
-        model=MODEL,
-        messages=[{"role": "user", "content": prompt}],
+    result = _complete_json(
+        OPTIMIZE_SECTION_PROMPT,
+        prompt,
         temperature=0.3,
-        max_tokens=4000,
+        max_tokens=SECTION_MAX_TOKENS[kind],
+        use_cache=use_cache,
+        validate=partial(validate_section_value, kind=kind),
+    )
+    return result["value"]
+
+
+@traced("optimize_sections_patch")
+def optimize_sections_patch(
+    resume_json: dict,
+    job_description: str,
+    sections: list | None = None,
+    max_workers: int = 4,
+    use_cache: bool = True,
+) -> dict:
+    """
+    Optimize independent resume sections in parallel.
+
+    Args:
+        resume_json: Structured resume as a dictionary.
+        job_description: Target job description text.
+        sections: Section paths to optimize (default: every optimizable section).
+        max_workers: Maximum concurrent section calls.
+        use_cache: Set to False to bypass the result cache.
+
+    Returns:
+        Patch mapping each section path to its optimized value.
+
+    Raises:
+        ValueError: If a path is not an optimizable section.
+    """
+    if sections is None:
+        sections = default_section_paths(resume_json)
+    # Reject bad paths before any request is sent
+    for path in sections:
+        section_kind(path)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        values = pool.map(
+            lambda path: optimize_section(resume_json, path, job_description, use_cache),
+            sections,
+        )
+        return dict(zip(sections, values))
+
+
+@traced("optimize_sections")
+def optimize_sections(
+    resume_json: dict,
+    job_description: str,
+    sections: list | None = None,
+    max_workers: int = 4,
+    use_cache: bool = True,
+) -> dict:
+    """
+    Optimize only the targeted sections and merge them into the resume.
+
+    Unlike optimize_resume, the model only returns the rewritten sections,
+    so output tokens scale with the sections changed rather than the
+    whole document.
+
+    Args:
+        resume_json: Structured resume as a dictionary.
+        job_description: Target job description text.
+        sections: Section paths to optimize (default: every optimizable section).
+        max_workers: Maximum concurrent section calls.
+        use_cache: Set to False to bypass the result cache.
+
+    Returns:
+        Optimized resume as a dictionary.
+
+    Raises:
+        ValueError: If a path is not an optimizable section.
+    """
+    patch = optimize_sections_patch(
+        resume_json, job_description, sections, max_workers=max_workers, use_cache=use_cache
+    )
+    return apply_patch(resume_json, patch)
+
+
+def _plan_translation(resume_json: dict, target_language: str, use_cache: bool) -> tuple:
+    """
+    Split a resume into translatable strings and look them up in the translation memory.
+
+    Returns:
+        (segments, known, missing): the (path, text) segments, translations
+        already in memory, and distinct strings still to translate.
+    """
+    segments = extract_segments(resume_json)
+    sources = list(dict.fromkeys(text for _, text in segments))
+    known = {}
+    if use_cache and cache_enabled():
+        known = get_translation_memory().lookup(sources, target_language)
+    missing = [text for text in sources if text not in known]
+    return segments, known, missing
+
+
+def _translation_batches(strings: list) -> list:
+    """Group strings into batches of at most TRANSLATION_BATCH_TOKENS estimated tokens."""
+    batches, batch, size = [], [], 0
+    for text in strings:
+        tokens = estimate_tokens(text)
+        if batch and size + tokens > TRANSLATION_BATCH_TOKENS:
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append(text)
+        size += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _translation_prompt(batch: list, target_language: str) -> tuple:
+    """
+    Build one batch translation request.
+
+    Returns:
+        (prompt, validate, max_tokens) where max_tokens is sized to the
+        batch, so the rate limiter does not reserve a full-document budget.
+    """
+    strings_json = compact_json(batch)
+    prompt = TRANSLATE_STRINGS_PROMPT.format(
+        target_language=target_language, strings_json=strings_json
     )
+    max_tokens = min(4000, 2 * estimate_tokens(strings_json) + 100)
+    return prompt, partial(validate_translations, count=len(batch)), max_tokens
 
-    content = response.choices[0].message.content.strip()
 
-    # Handle potential markdown code blocks
-    if content.startswith("```"):
-        content = content.split("```")[1]
-        if content.startswith("json"):
-            content = content[4:]
-        content = content.strip()
+def _finish_translation(
+    resume_json: dict,
+    segments: list,
+    known: dict,
+    translated: dict,
+    target_language: str,
+) -> dict:
+    """Save new translations to memory, record usage and reassemble the resume."""
+    if translated:
+        get_translation_memory().store(translated, target_language)
+    increment("cache_hits_total", len(known), cache="translation_memory")
+    increment("cache_misses_total", len(translated), cache="translation_memory")
 
-    return json.loads(content)
+    stats = {
+        "language": target_language,
+        "strings": len(known) + len(translated),
+        "reused": len(known),
+        "translated": len(translated),
+    }
+    _last_translation_stats.set(stats)
+    _last_call_cached.set(not translated)
+    logger.info(
+        "translate_resume (%s): %d strings, %d from translation memory",
+        target_language,
+        stats["strings"],
+        stats["reused"],
+    )
+    return apply_translations(resume_json, segments, {**known, **translated})
 
 
-def translate_resume(resume_json: dict, target_language: str = "French") -> dict:
+@traced("translate_resume")
+def translate_resume(
+    resume_json: dict, target_language: str = "French", use_cache: bool = True
+) -> dict:
     """
     Translate resume content to a target language.
 
+    Strings already in the translation memory are reused; only new or
+    changed strings are sent to the model, in compact batched requests,
+    and the resume is reassembled locally.
+
     Args:
         resume_json: Structured resume as a dictionary.
         target_language: Target language for translation (default: French).
+        use_cache: Set to False to bypass the result cache and translation memory.
 
     Returns:
         Translated resume as a dictionary.
     """
-    client = get_client()
+    segments, known, missing = _plan_translation(resume_json, target_language, use_cache)
+
+    translated = {}
+    for batch in _translation_batches(missing):
+        prompt, validate, max_tokens = _translation_prompt(batch, target_language)
+        result = _complete_json(
+            TRANSLATE_STRINGS_PROMPT,
+            prompt,
+            temperature=0.1,
+            max_tokens=max_tokens,
+            use_cache=use_cache,
+            validate=validate,
+        )
+        translated.update(zip(batch, result["translations"]))
+
+    return _finish_translation(resume_json, segments, known, translated, target_language)
+
+
+@traced("translate_resume_stream")
+def translate_resume_stream(
+    resume_json: dict, target_language: str = "French", use_cache: bool = True
+):
+    """
+    Variant of translate_resume yielding the result section by section.
+
+    Batches are requested in document order, and each section is yielded
+    as soon as all of its strings are translated, so the first sections
+    are available before the last batch completes.
+
+    Args:
+        resume_json: Structured resume as a dictionary.
+        target_language: Target language for translation (default: French).
+        use_cache: Set to False to bypass the result cache and translation memory.
+
+    Yields:
+        (path, value) tuples for each section, in document order; the last
+        item is ((), translated_resume).
+    """
+    segments, known, missing = _plan_translation(resume_json, target_language, use_cache)
+    # Events in stream order, each with the segments it needs translated
+    pending = [
+        (path, [(seg_path, text) for seg_path, text in segments if seg_path[: len(path)] == path])
+        for section, value in resume_json.items()
+        for path, _ in _section_events(section, value)
+    ]
+
+    translated = {}
+    batches = iter(_translation_batches(missing))
+    while True:
+        available = {**known, **translated}
+        while pending and all(text in available for _, text in pending[0][1]):
+            path, needed = pending.pop(0)
+            value = apply_translations({path[0]: resume_json[path[0]]}, needed, available)
+            for part in path:
+                value = value[part]
+            yield path, value
+
+        batch = next(batches, None)
+        if batch is None:
+            break
+        prompt, validate, max_tokens = _translation_prompt(batch, target_language)
+        result = _complete_json(
+            TRANSLATE_STRINGS_PROMPT,
+            prompt,
+            temperature=0.1,
+            max_tokens=max_tokens,
+            use_cache=use_cache,
+            validate=validate,
+        )
+        translated.update(zip(batch, result["translations"]))
+
+    yield (), _finish_translation(resume_json, segments, known, translated, target_language)
+
+
+@traced("structure_resume")
+async def astructure_resume(resume_text: str, use_cache: bool = True) -> dict:
+    """
+    Async variant of structure_resume using the backend's async API.
+
+    Args:
+        resume_text: Raw text extracted from PDF.
+        use_cache: Set to False to bypass the result cache.
+
+    Returns:
+        Structured resume as a dictionary.
+    """
+    prompt = STRUCTURE_RESUME_PROMPT.format(resume_text=resume_text)
 
-    prompt = TRANSLATE_RESUME_PROMPT.format(
-        resume_json=json.dumps(resume_json, indent=2),
-        target_language=target_language,
+    return await _acomplete_json(
+        STRUCTURE_RESUME_PROMPT, prompt, temperature=0.1, use_cache=use_cache
     )
 
-    response = client.chat.completions.create(
-        model=MODEL,
-        messages=[{"role": "user", "content": prompt}],
+
+@traced("analyze_job")
+async def aanalyze_job_description(job_description: str, use_cache: bool = True) -> dict:
+    """
+    Async variant of analyze_job_description using the backend's async API.
+
+    Args:
+        job_description: Job posting text.
+        use_cache: Set to False to bypass both caches.
+
+    Returns:
+        Job analysis dictionary.
+    """
+    text = _normalize_job_description(job_description)
+    key, analysis = _analysis_lookup(text, use_cache)
+    if analysis is not None:
+        return analysis
+
+    prompt = ANALYZE_JOB_PROMPT.format(job_description=text)
+    analysis = await _acomplete_json(
+        ANALYZE_JOB_PROMPT,
+        prompt,
         temperature=0.1,
-        max_tokens=4000,
+        max_tokens=JOB_ANALYSIS_MAX_TOKENS,
+        use_cache=use_cache,
+        validate=validate_job_analysis,
     )
+    if use_cache and cache_enabled():
+        _analysis_store(key, analysis)
+    return analysis
+
+
+@traced("optimize_resume")
+async def aoptimize_resume(
+    resume_json: dict,
+    job_description: str,
+    use_cache: bool = True,
+    job_analysis: dict | None = None,
+) -> dict:
+    """
+    Async variant of optimize_resume using the backend's async API.
+
+    Args:
+        resume_json: Structured resume as a dictionary.
+        job_description: Target job description text.
+        use_cache: Set to False to bypass the result cache.
+        job_analysis: Analysis of the job description from
+            analyze_job_description; analyzed (and cached) on demand if omitted.
 
-    content = response.choices[0].message.content.strip()
+    Returns:
+        Optimized resume as a dictionary.
+
+    Raises:
+        ValueError: If a supplied job_analysis is malformed.
+    """
+    if job_analysis is None and ANALYZE_JOBS:
+        job_analysis = await aanalyze_job_description(job_description, use_cache)
+    template, prompt, held_back = _optimize_prompt(resume_json, job_description, job_analysis)
+
+    result = await _acomplete_json(template, prompt, temperature=0.3, use_cache=use_cache)
+    return merge_fields(result, held_back, list(resume_json))
+
+
+@traced("translate_resume")
+async def atranslate_resume(
+    resume_json: dict, target_language: str = "French", use_cache: bool = True
+) -> dict:
+    """
+    Async variant of translate_resume using the backend's async API.
+
+    Args:
+        resume_json: Structured resume as a dictionary.
+        target_language: Target language for translation (default: French).
+        use_cache: Set to False to bypass the result cache and translation memory.
+
+    Returns:
+        Translated resume as a dictionary.
+    """
+    segments, known, missing = _plan_translation(resume_json, target_language, use_cache)
+
+    batches = _translation_batches(missing)
+    requests = [_translation_prompt(batch, target_language) for batch in batches]
+    results = await asyncio.gather(
+        *(
+            _acomplete_json(
+                TRANSLATE_STRINGS_PROMPT,
+                prompt,
+                temperature=0.1,
+                max_tokens=max_tokens,
+                use_cache=use_cache,
+                validate=validate,
+            )
+            for prompt, validate, max_tokens in requests
+        )
+    )
 
-    # Handle potential markdown code blocks
-    if content.startswith("```"):
-        content = content.split("```")[1]
-        if content.startswith("json"):
-            content = content[4:]
-        content = content.strip()
+    translated = {}
+    for batch, result in zip(batches, results):
+        translated.update(zip(batch, result["translations"]))
 
-    return json.loads(content)
+    return _finish_translation(resume_json, segments, known, translated, target_language)
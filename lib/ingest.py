@@ -0,0 +1,238 @@
+"""Bulk ingestion: a directory of resume PDFs into a structured JSON store."""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from .groq_client import structure_resume
+from .pdf_parser import extract_text_from_pdf
+from .resume_parser import DEFAULT_MIN_CONFIDENCE, parse_resume_layout
+
+
+class ResumeStore:
+    """SQLite store of ingested resumes, keyed by content hash, with progress state."""
+
+    def __init__(self, path: Path | str):
+        self._conn = sqlite3.connect(str(path))
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS resumes (
+                content_hash TEXT PRIMARY KEY,
+                source_path TEXT NOT NULL,
+                status TEXT NOT NULL,
+                text TEXT,
+                data TEXT,
+                method TEXT,
+                error TEXT,
+                updated_at REAL NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    def add_file(self, path: str, content_hash: str) -> None:
+        """Record a file and create a pending resume entry for new content."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO files (path, content_hash) VALUES (?, ?)", (path, content_hash)
+        )
+        self._conn.execute(
+            "INSERT OR IGNORE INTO resumes (content_hash, source_path, status, updated_at) "
+            "VALUES (?, ?, 'pending', ?)",
+            (content_hash, path, time.time()),
+        )
+        self._conn.commit()
+
+    def update(self, content_hash: str, **fields) -> None:
+        """Update columns of a resume entry."""
+        fields["updated_at"] = time.time()
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        self._conn.execute(
+            f"UPDATE resumes SET {assignments} WHERE content_hash = ?",
+            (*fields.values(), content_hash),
+        )
+        self._conn.commit()
+
+    def pending(self, statuses: tuple) -> list:
+        """Return (content_hash, source_path, text) for entries in the given statuses."""
+        placeholders = ", ".join("?" for _ in statuses)
+        return self._conn.execute(
+            f"SELECT content_hash, source_path, text FROM resumes WHERE status IN ({placeholders})",
+            statuses,
+        ).fetchall()
+
+    def counts(self) -> dict:
+        """Return the number of resume entries per status."""
+        rows = self._conn.execute("SELECT status, COUNT(*) FROM resumes GROUP BY status")
+        return dict(rows.fetchall())
+
+    def export_jsonl(self, output: Path | str) -> int:
+        """Write every structured resume to a JSONL file and return the count."""
+        rows = self._conn.execute(
+            "SELECT content_hash, source_path, data FROM resumes WHERE status = 'structured'"
+        )
+        count = 0
+        with open(output, "w", encoding="utf-8") as f:
+            for content_hash, source_path, data in rows:
+                record = {
+                    "content_hash": content_hash,
+                    "source_path": source_path,
+                    "resume": json.loads(data),
+                }
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _hash_file(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _extract(path: str) -> tuple:
+    """
+    Extract text from one PDF and try the local layout parser (worker process entry point).
+
+    Returns:
+        (text, resume) where resume is None unless the local parse is confident.
+    """
+    text = extract_text_from_pdf(path, fast=True)
+    resume, confidence = parse_resume_layout(path)
+    return text, resume if confidence >= DEFAULT_MIN_CONFIDENCE else None
+
+
+def ingest_directory(
+    directory: Path | str,
+    store: ResumeStore,
+    extract_workers: int | None = None,
+    max_concurrency: int = 4,
+    retry_errors: bool = False,
+    use_cache: bool = True,
+    progress=None,
+) -> dict:
+    """
+    Extract and structure every PDF under a directory.
+
+    Files are deduplicated by content hash. Extraction and local layout
+    parsing run in a process pool; only documents the local parser is not
+    confident about go to structure_resume, with bounded concurrency. Every
+    step is saved to the store as it completes, so an interrupted run
+    resumes where it stopped.
+
+    Args:
+        directory: Directory searched recursively for *.pdf files.
+        store: Resume store recording progress and results.
+        extract_workers: Processes for text extraction (default: CPU count).
+        max_concurrency: Maximum concurrent structure_resume calls.
+        retry_errors: Also retry entries that failed on a previous run.
+        use_cache: Set to False to bypass the LLM result cache.
+        progress: Optional callback(stage, source_path, status).
+
+    Returns:
+        Number of resume entries per status after the run.
+    """
+    for path in sorted(Path(directory).rglob("*")):
+        if path.is_file() and path.suffix.lower() == ".pdf":
+            store.add_file(str(path), _hash_file(path))
+
+    retry = ("error",) if retry_errors else ()
+
+    # Stage 1: text extraction
+    to_extract = [row for row in store.pending(("pending",) + retry) if row[2] is None]
+    with ProcessPoolExecutor(max_workers=extract_workers) as pool:
+        futures = {
+            pool.submit(_extract, source_path): (content_hash, source_path)
+            for content_hash, source_path, _ in to_extract
+        }
+        for future in as_completed(futures):
+            content_hash, source_path = futures[future]
+            try:
+                text, resume = future.result()
+                if resume is not None:
+                    data = json.dumps(resume, ensure_ascii=False)
+                    store.update(
+                        content_hash,
+                        status="structured",
+                        text=text,
+                        data=data,
+                        method="local",
+                        error=None,
+                    )
+                    status = "structured"
+                else:
+                    store.update(content_hash, status="extracted", text=text, error=None)
+                    status = "extracted"
+            except Exception as e:
+                store.update(content_hash, status="error", error=f"Extraction failed: {e}")
+                status = "error"
+            if progress:
+                progress("extract", source_path, status)
+
+    # Stage 2: LLM structuring
+    to_structure = [row for row in store.pending(("extracted",) + retry) if row[2] is not None]
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        futures = {
+            pool.submit(structure_resume, text, use_cache): (content_hash, source_path)
+            for content_hash, source_path, text in to_structure
+        }
+        for future in as_completed(futures):
+            content_hash, source_path = futures[future]
+            try:
+                data = json.dumps(future.result(), ensure_ascii=False)
+                store.update(content_hash, status="structured", data=data, method="llm", error=None)
+                status = "structured"
+            except Exception as e:
+                store.update(content_hash, status="error", error=f"Structuring failed: {e}")
+                status = "error"
+            if progress:
+                progress("structure", source_path, status)
+
+    return store.counts()
+
+
+def main(argv: list | None = None) -> int:
+    """Command-line entry point: python -m lib.ingest DIRECTORY --db STORE."""
+    parser = argparse.ArgumentParser(description="Structure a directory of resume PDFs.")
+    parser.add_argument("directory", help="Directory searched recursively for PDFs")
+    parser.add_argument("--db", default="resumes.sqlite3", help="SQLite progress/result store")
+    parser.add_argument("--extract-workers", type=int, default=None, help="Extraction processes")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent LLM calls")
+    parser.add_argument("--retry-errors", action="store_true", help="Retry previously failed files")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the LLM result cache")
+    parser.add_argument("--export", help="Also write structured resumes to this JSONL file")
+    args = parser.parse_args(argv)
+
+    store = ResumeStore(args.db)
+    try:
+        counts = ingest_directory(
+            args.directory,
+            store,
+            extract_workers=args.extract_workers,
+            max_concurrency=args.concurrency,
+            retry_errors=args.retry_errors,
+            use_cache=not args.no_cache,
+            progress=lambda stage, path, status: print(f"[{stage}] {path}: {status}"),
+        )
+        if args.export:
+            exported = store.export_jsonl(args.export)
+            print(f"Exported {exported} resumes to {args.export}")
+    finally:
+        store.close()
+
+    print(", ".join(f"{status}: {count}" for status, count in sorted(counts.items())))
+    return 1 if counts.get("error") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
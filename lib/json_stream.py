@@ -0,0 +1,142 @@
+"""Incremental parsing of streamed JSON objects."""
+
+import json
+
+WHITESPACE = " \t\r\n"
+
+
+class JSONSectionParser:
+    """
+    Incrementally parse a streamed top-level JSON object.
+
+    Text is fed in arbitrary chunks. Each top-level member is reported as soon
+    as its value closes, and elements of the arrays named in ``split_arrays``
+    are reported one by one as each element closes. Any text before the first
+    ``{`` (such as a markdown code fence) is ignored.
+    """
+
+    def __init__(self, split_arrays: tuple = ("experience", "projects")):
+        self.split_arrays = set(split_arrays)
+        self.buffer = ""
+        self.done = False
+        self._pos = 0
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = None
+        # Top-level member state
+        self._key = None
+        self._expect_key = True
+        self._value_start = None
+        # Split array element state
+        self._splitting = False
+        self._item_start = None
+        self._item_index = 0
+
+    def feed(self, chunk: str) -> list:
+        """
+        Consume a chunk of text.
+
+        Args:
+            chunk: Next piece of the streamed response.
+
+        Returns:
+            List of (path, value) tuples for sections completed by this chunk,
+            where path is (key,) for a top-level member or (key, index) for an
+            element of a split array.
+        """
+        self.buffer += chunk
+        events = []
+
+        while self._pos < len(self.buffer) and not self.done:
+            i = self._pos
+            ch = self.buffer[i]
+            self._pos += 1
+
+            if not self._started:
+                if ch == "{":
+                    self._started = True
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._close_string(i, events)
+                continue
+
+            if ch in WHITESPACE:
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+                self._open_value(i)
+            elif ch in "{[":
+                self._open_value(i)
+                self._depth += 1
+                if self._depth == 2 and ch == "[" and self._key in self.split_arrays:
+                    self._splitting = True
+                    self._item_index = 0
+            elif ch in "}]":
+                self._end_scalar(i, events)
+                self._depth -= 1
+                if self._depth == 2 and self._splitting and self._item_start is not None:
+                    self._emit_item(i + 1, events)
+                elif self._depth == 1:
+                    if self._splitting:
+                        self._splitting = False
+                    self._emit_member(i + 1, events)
+                elif self._depth == 0:
+                    self.done = True
+            elif ch == ",":
+                self._end_scalar(i, events)
+                if self._depth == 1:
+                    self._expect_key = True
+            elif ch == ":":
+                continue
+            else:
+                # Start of a number or literal (true/false/null)
+                self._open_value(i)
+
+        return events
+
+    def _open_value(self, i: int):
+        """Record where the value or array element starting at i begins."""
+        if self._depth == 1 and not self._expect_key and self._value_start is None:
+            self._value_start = i
+        elif self._depth == 2 and self._splitting and self._item_start is None:
+            self._item_start = i
+
+    def _close_string(self, i: int, events: list):
+        """Handle the end of a string literal at index i."""
+        if self._depth == 1 and self._expect_key:
+            self._key = json.loads(self.buffer[self._string_start:i + 1])
+            self._expect_key = False
+        elif self._depth == 1 and self._value_start is not None:
+            self._emit_member(i + 1, events)
+        elif self._depth == 2 and self._splitting and self._item_start is not None:
+            self._emit_item(i + 1, events)
+
+    def _end_scalar(self, i: int, events: list):
+        """Close a pending number or literal terminated by the delimiter at i."""
+        if self._depth == 1 and self._value_start is not None:
+            self._emit_member(i, events)
+        elif self._depth == 2 and self._splitting and self._item_start is not None:
+            self._emit_item(i, events)
+
+    def _emit_member(self, end: int, events: list):
+        text = self.buffer[self._value_start:end]
+        events.append(((self._key,), json.loads(text)))
+        self._value_start = None
+
+    def _emit_item(self, end: int, events: list):
+        text = self.buffer[self._item_start:end]
+        events.append(((self._key, self._item_index), json.loads(text)))
+        self._item_start = None
+        self._item_index += 1
@@ -0,0 +1,156 @@
+"""Keyword tokenization and an inverted index for ranking resume skills against a job."""
+
+import functools
+import math
+import re
+
+# Job indexes kept per process, so many resumes ranked against one posting share it
+JOB_INDEX_CACHE_SIZE = 256
+
+# Weight of a phrase occurrence in each indexed field of a job
+FIELD_WEIGHTS = {
+    "required_skills": 4.0,
+    "title": 2.0,
+    "preferred_skills": 2.0,
+    "keywords": 1.5,
+    "text": 1.0,
+}
+
+# Technical tokens keep inner dots and trailing +/# ("node.js", "c++", "c#")
+_TOKEN = re.compile(r"[a-z0-9]+(?:[.][a-z0-9]+)*[+#]*")
+
+# Position gap between list items, so phrases never match across two items
+_ITEM_GAP = 2
+
+
+def tokenize(text: str) -> list:
+    """Split text into lowercase keyword tokens."""
+    return _TOKEN.findall(text.lower())
+
+
+def flatten_skills(skills) -> list:
+    """Skills as a flat list of strings, from either the flat or the categorized format."""
+    if isinstance(skills, dict):
+        flat = []
+        for skill_list in skills.values():
+            if isinstance(skill_list, list):
+                flat.extend(str(skill) for skill in skill_list)
+            elif skill_list:
+                flat.append(str(skill_list))
+        return flat
+    if isinstance(skills, list):
+        return [str(skill) for skill in skills]
+    return [str(skills)] if skills else []
+
+
+class KeywordIndex:
+    """
+    Positional inverted index over the fields of one job.
+
+    Each field maps a token to the sorted positions it occurs at, so a
+    multi-word phrase is counted by intersecting shifted posting lists
+    rather than by scanning the text.
+
+    Args:
+        fields: Mapping of field name to a string or a list of strings.
+    """
+
+    def __init__(self, fields: dict):
+        self.postings = {}
+        for field, value in fields.items():
+            items = [value] if isinstance(value, str) else value
+            postings = {}
+            position = 0
+            for item in items:
+                for token in tokenize(item):
+                    postings.setdefault(token, []).append(position)
+                    position += 1
+                position += _ITEM_GAP
+            self.postings[field] = postings
+
+    def count(self, field: str, tokens: list) -> int:
+        """Occurrences of a token sequence as a phrase in one field."""
+        postings = self.postings.get(field, {})
+        if not tokens or tokens[0] not in postings:
+            return 0
+        starts = set(postings[tokens[0]])
+        for offset, token in enumerate(tokens[1:], 1):
+            positions = postings.get(token)
+            if positions is None:
+                return 0
+            starts.intersection_update(position - offset for position in positions)
+            if not starts:
+                return 0
+        return len(starts)
+
+    def score(self, phrase: str) -> float:
+        """Weighted relevance of a phrase, with diminishing returns on repetition."""
+        tokens = tokenize(phrase)
+        return sum(
+            weight * math.log1p(self.count(field, tokens))
+            for field, weight in FIELD_WEIGHTS.items()
+        )
+
+    def rank(self, phrases: list) -> list:
+        """
+        Order phrases by relevance.
+
+        Returns:
+            List of (phrase, score), highest score first; ties keep their
+            original order.
+        """
+        scored = [(phrase, round(self.score(phrase), 4)) for phrase in phrases]
+        return sorted(scored, key=lambda item: -item[1])
+
+
+@functools.lru_cache(maxsize=JOB_INDEX_CACHE_SIZE)
+def _job_index(
+    job_description: str, title: str, required: tuple, preferred: tuple, keywords: tuple
+) -> KeywordIndex:
+    return KeywordIndex(
+        {
+            "text": job_description,
+            "title": title,
+            "required_skills": list(required),
+            "preferred_skills": list(preferred),
+            "keywords": list(keywords),
+        }
+    )
+
+
+def job_index(job_description: str, analysis: dict | None = None) -> KeywordIndex:
+    """
+    Build, or reuse, the keyword index of a job description.
+
+    Args:
+        job_description: Job posting text.
+        analysis: Job analysis (see groq_client.analyze_job_description);
+            its title and skill lists are indexed as weighted fields.
+
+    Returns:
+        KeywordIndex of the job.
+    """
+    analysis = analysis or {}
+    return _job_index(
+        job_description,
+        str(analysis.get("title") or ""),
+        tuple(analysis.get("required_skills") or ()),
+        tuple(analysis.get("preferred_skills") or ()),
+        tuple(analysis.get("keywords") or ()),
+    )
+
+
+def rank_skills(skills, job_description: str, analysis: dict | None = None) -> list:
+    """
+    Rank a resume's skills by relevance to a job.
+
+    Args:
+        skills: resume["skills"], flat or categorized.
+        job_description: Job posting text.
+        analysis: Optional job analysis whose skill lists weigh more than the text.
+
+    Returns:
+        List of (skill, score), most relevant first; skills absent from the
+        job score 0 and keep their original order at the end.
+    """
+    return job_index(job_description, analysis).rank(flatten_skills(skills))
@@ -0,0 +1,277 @@
+"""LLM backend interface and a deterministic offline stand-in for load testing."""
+
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+from typing import NamedTuple
+
+from .cache import make_key
+from .scheduler import CHARS_PER_TOKEN, estimate_tokens
+
+
+class Usage(NamedTuple):
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+
+
+class Completion(NamedTuple):
+    """
+    Text of a chat completion, its token usage and why generation stopped.
+
+    finish_reason is "length" when the output was cut off at max_tokens, and
+    None when the provider did not report it.
+    """
+
+    content: str
+    usage: Usage | None = None
+    finish_reason: str | None = None
+
+
+class TransientBackendError(Exception):
+    """A simulated or provider-agnostic failure that the request scheduler retries."""
+
+    retryable = True
+
+
+class LLMBackend:
+    """
+    Chat completion provider used by groq_client.
+
+    Implementations raise their own exceptions for failed requests; the
+    request scheduler retries those it recognizes as transient.
+    """
+
+    # Model identifier, part of every result cache key
+    model = None
+
+    def complete(self, messages: list, temperature: float, max_tokens: int) -> Completion:
+        """Return a JSON-mode completion for a list of chat messages."""
+        raise NotImplementedError
+
+    async def acomplete(self, messages: list, temperature: float, max_tokens: int) -> Completion:
+        """Async counterpart of complete."""
+        raise NotImplementedError
+
+    def stream(self, messages: list, temperature: float, max_tokens: int):
+        """
+        Open a streamed completion.
+
+        The request is sent before this returns, so failures to start the
+        stream surface here; the returned iterator yields text deltas.
+        """
+        raise NotImplementedError
+
+
+def default_fake_response(messages: list) -> str:
+    """
+    Produce a schema-valid response for the pipeline's own prompts.
+
+    Translation and optimization prompts get their input echoed back in the
+    expected shape; job analysis prompts get the posting's first line as the
+    title; structuring prompts get a minimal resume built from the text.
+    """
+    prompt = messages[-1]["content"] if len(messages) == 1 else messages[0]["content"]
+
+    if "Job Posting:\n" in prompt:
+        posting = prompt.split("Job Posting:\n", 1)[1].rsplit("\n\nReturn a JSON object", 1)[0]
+        lines = [line.strip() for line in posting.splitlines() if line.strip()]
+        analysis = {
+            "title": lines[0][:80] if lines else "",
+            "seniority": "",
+            "required_skills": [],
+            "preferred_skills": [],
+            "keywords": [],
+            "responsibilities": [],
+        }
+        return json.dumps(analysis, ensure_ascii=False)
+
+    for marker, wrap in (
+        ("Texts (JSON):\n", lambda value: {"translations": value}),
+        ("Current value (JSON):\n", lambda value: {"value": value}),
+        ("Original Resume (JSON):\n", lambda value: value),
+    ):
+        if marker in prompt:
+            value = json.loads(prompt.split(marker, 1)[1].split("\n", 1)[0])
+            return json.dumps(wrap(value), ensure_ascii=False)
+
+    # Structuring prompt: use the first resume line as the name and the rest as a summary
+    text = prompt.split("Resume Text:\n", 1)[-1].split("\n\nReturn a JSON object", 1)[0]
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    resume = {"name": lines[0] if lines else "", "summary": " ".join(lines[1:6])}
+    return json.dumps(resume, ensure_ascii=False)
+
+
+class FakeBackend(LLMBackend):
+    """
+    Deterministic offline backend.
+
+    Responses are replayed from recordings keyed by the request messages,
+    falling back to a responder function. Latency is simulated as a fixed
+    time to first token plus completion tokens divided by throughput, and a
+    fraction of requests fail with TransientBackendError. Responses longer
+    than max_tokens are cut off with finish_reason "length", like the API. Another fraction of
+    first attempts returns unparseable text, exercising the corrective
+    re-request; repair conversations always get a usable reply. A seeded
+    random generator makes error injection reproducible.
+
+    Args:
+        recordings: Mapping of message key (see message_key) to response text.
+        responder: Callable(messages) -> response text for unrecorded requests.
+        latency: Seconds before the first token.
+        tokens_per_second: Simulated completion throughput (0 for instant).
+        error_rate: Probability that a request fails.
+        malformed_rate: Probability that a first attempt returns invalid JSON.
+        seed: Random seed for error injection.
+    """
+
+    model = "fake"
+
+    def __init__(
+        self,
+        recordings: dict | None = None,
+        responder=default_fake_response,
+        latency: float = 0.0,
+        tokens_per_second: float = 0.0,
+        error_rate: float = 0.0,
+        malformed_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.recordings = recordings or {}
+        self.responder = responder
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    @staticmethod
+    def message_key(messages: list) -> str:
+        """Recording key for a list of chat messages."""
+        return make_key(messages)
+
+    @classmethod
+    def from_jsonl(cls, path: str, **kwargs) -> "FakeBackend":
+        """Build a backend replaying {"messages", "content"} records from a JSONL file."""
+        recordings = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    recordings[cls.message_key(record["messages"])] = record["content"]
+        return cls(recordings=recordings, **kwargs)
+
+    @classmethod
+    def from_env(cls) -> "FakeBackend":
+        """Build a backend configured from RESUME_TAILOR_FAKE_* environment variables."""
+        kwargs = {
+            "latency": float(os.getenv("RESUME_TAILOR_FAKE_LATENCY", "0")),
+            "tokens_per_second": float(os.getenv("RESUME_TAILOR_FAKE_TOKENS_PER_SECOND", "0")),
+            "error_rate": float(os.getenv("RESUME_TAILOR_FAKE_ERROR_RATE", "0")),
+            "malformed_rate": float(os.getenv("RESUME_TAILOR_FAKE_MALFORMED_RATE", "0")),
+            "seed": int(os.getenv("RESUME_TAILOR_FAKE_SEED", "0")),
+        }
+        recordings = os.getenv("RESUME_TAILOR_FAKE_RECORDINGS")
+        if recordings:
+            return cls.from_jsonl(recordings, **kwargs)
+        return cls(**kwargs)
+
+    def _respond(self, messages: list, max_tokens: int) -> tuple:
+        """Pick the response and decide on failure: (completion, generation_seconds)."""
+        with self._lock:
+            self.calls += 1
+            failed = self._random.random() < self.error_rate
+            # Only first attempts are corrupted, so every repair can succeed
+            malformed = len(messages) == 1 and self._random.random() < self.malformed_rate
+        if failed:
+            raise TransientBackendError("Simulated backend failure")
+
+        content = self.recordings.get(self.message_key(messages))
+        if content is None:
+            content = self.responder(messages)
+        if malformed:
+            # Chatty, and missing the colon after the first key: beyond local repair
+            content = "Sorry, here is the result: " + content.replace('": ', '" ', 1)
+
+        finish_reason = "stop"
+        if estimate_tokens(content) > max_tokens:
+            content = content[: max_tokens * CHARS_PER_TOKEN]
+            finish_reason = "length"
+
+        prompt_tokens = estimate_tokens(json.dumps(messages))
+        completion_tokens = estimate_tokens(content)
+        usage = Usage(prompt_tokens, completion_tokens, prompt_tokens + completion_tokens)
+        seconds = completion_tokens / self.tokens_per_second if self.tokens_per_second else 0.0
+        return Completion(content, usage, finish_reason), seconds
+
+    def complete(self, messages: list, temperature: float, max_tokens: int) -> Completion:
+        completion, seconds = self._respond(messages, max_tokens)
+        time.sleep(self.latency + seconds)
+        return completion
+
+    async def acomplete(self, messages: list, temperature: float, max_tokens: int) -> Completion:
+        completion, seconds = self._respond(messages, max_tokens)
+        await asyncio.sleep(self.latency + seconds)
+        return completion
+
+    def stream(self, messages: list, temperature: float, max_tokens: int):
+        completion, seconds = self._respond(messages, max_tokens)
+        time.sleep(self.latency)
+
+        def deltas():
+            content = completion.content
+            chunk_size = 16
+            delay = seconds * chunk_size / max(len(content), 1)
+            for start in range(0, len(content), chunk_size):
+                time.sleep(delay)
+                yield content[start:start + chunk_size]
+
+        return deltas()
+
+
+class RecordingBackend(LLMBackend):
+    """
+    Wrap a backend and append every exchange to a JSONL file for later replay.
+
+    Args:
+        backend: Backend that serves the requests.
+        path: JSONL file that receives {"messages", "content"} records.
+    """
+
+    def __init__(self, backend: LLMBackend, path: str):
+        self.backend = backend
+        self.model = backend.model
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _record(self, messages: list, content: str) -> None:
+        record = json.dumps({"messages": messages, "content": content}, ensure_ascii=False)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(record + "\n")
+
+    def complete(self, messages: list, temperature: float, max_tokens: int) -> Completion:
+        completion = self.backend.complete(messages, temperature, max_tokens)
+        self._record(messages, completion.content)
+        return completion
+
+    async def acomplete(self, messages: list, temperature: float, max_tokens: int) -> Completion:
+        completion = await self.backend.acomplete(messages, temperature, max_tokens)
+        self._record(messages, completion.content)
+        return completion
+
+    def stream(self, messages: list, temperature: float, max_tokens: int):
+        deltas = self.backend.stream(messages, temperature, max_tokens)
+
+        def recorded():
+            parts = []
+            for delta in deltas:
+                parts.append(delta)
+                yield delta
+            self._record(messages, "".join(parts))
+
+        return recorded()
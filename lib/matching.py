@@ -0,0 +1,282 @@
+"""Local resume-job match scoring with vectorized BM25 and TF-IDF similarity.
+
+Documents (job descriptions or resumes) are tokenized once into a sparse
+term-document index held as NumPy arrays. A query is scored against every
+document by gathering the postings of its terms and summing them with
+np.bincount, so ranking thousands of documents takes milliseconds and needs
+no LLM call.
+"""
+
+import numpy as np
+
+from .keywords import flatten_skills, tokenize
+
+# BM25 term-frequency saturation and document-length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Scoring methods accepted by MatchIndex
+METHODS = ("bm25", "tfidf")
+
+# Times each resume field's tokens are counted, so skills and titles outweigh bullets
+RESUME_FIELD_WEIGHTS = {
+    "skills": 3,
+    "professional_title": 2,
+    "titles": 2,
+    "summary": 1,
+    "bullets": 1,
+    "projects": 1,
+    "certifications": 1,
+}
+
+# Common words that carry no signal about a match
+STOPWORDS = frozenset(
+    """
+    a an and are as at be by for from has have in is it its of on or our that the their
+    this to was we were will with you your who what which while about across into over
+    all any can more most other such than then these they those through under up us
+    """.split()
+)
+
+
+def _terms(text: str) -> list:
+    return [token for token in tokenize(text) if token not in STOPWORDS]
+
+
+def resume_terms(resume: dict) -> list:
+    """
+    Tokenize a structured resume, repeating tokens by their field's weight.
+
+    Uses skills, the professional and job titles, the summary, experience and
+    project bullets, project names and technologies, and certification names.
+    """
+    experience = [entry for entry in resume.get("experience") or [] if isinstance(entry, dict)]
+    projects = [entry for entry in resume.get("projects") or [] if isinstance(entry, dict)]
+    certifications = [
+        entry for entry in resume.get("certifications") or [] if isinstance(entry, dict)
+    ]
+    fields = {
+        "skills": flatten_skills(resume.get("skills") or []),
+        "professional_title": [resume.get("professional_title") or ""],
+        "titles": [entry.get("title") or "" for entry in experience],
+        "summary": [resume.get("summary") or ""],
+        "bullets": [bullet for entry in experience for bullet in entry.get("bullets") or []],
+        "projects": [],
+        "certifications": [cert.get("name") or "" for cert in certifications],
+    }
+    for project in projects:
+        technologies = project.get("technologies") or []
+        if isinstance(technologies, str):
+            technologies = [technologies]
+        fields["projects"].extend(
+            [project.get("name") or "", project.get("description") or ""]
+            + list(technologies)
+            + list(project.get("bullets") or [])
+        )
+
+    terms = []
+    for field, texts in fields.items():
+        field_terms = [term for text in texts if isinstance(text, str) for term in _terms(text)]
+        terms.extend(field_terms * RESUME_FIELD_WEIGHTS[field])
+    return terms
+
+
+def job_terms(job_description: str) -> list:
+    """Tokenize a job description."""
+    return _terms(job_description)
+
+
+class MatchIndex:
+    """
+    Sparse BM25 and TF-IDF index over a corpus of tokenized documents.
+
+    Term frequencies are kept in CSR order (indptr, indices, counts: one row
+    per document) and the precomputed per-posting weights in CSC order (one
+    column per term), which is what scoring reads.
+
+    Args:
+        documents: Token lists, one per document.
+        k1: BM25 term-frequency saturation.
+        b: BM25 document-length normalization.
+    """
+
+    def __init__(self, documents: list, k1: float = BM25_K1, b: float = BM25_B):
+        self.vocabulary = {}
+        term_ids = []
+        lengths = np.zeros(len(documents), dtype=np.int64)
+        for row, tokens in enumerate(documents):
+            lengths[row] = len(tokens)
+            term_ids.extend(
+                self.vocabulary.setdefault(token, len(self.vocabulary)) for token in tokens
+            )
+
+        n_docs = len(documents)
+        n_terms = len(self.vocabulary)
+        self.n_docs = n_docs
+        rows = np.repeat(np.arange(n_docs, dtype=np.int64), lengths)
+        term_ids = np.asarray(term_ids, dtype=np.int64)
+
+        # CSR: unique (document, term) pairs with their counts, sorted by document
+        pairs, counts = np.unique(rows * max(n_terms, 1) + term_ids, return_counts=True)
+        doc_of = pairs // max(n_terms, 1)
+        self.indices = (pairs % max(n_terms, 1)).astype(np.int32)
+        self.counts = counts.astype(np.float32)
+        self.indptr = np.zeros(n_docs + 1, dtype=np.int64)
+        np.cumsum(np.bincount(doc_of, minlength=n_docs), out=self.indptr[1:])
+
+        df = np.bincount(self.indices, minlength=n_terms).astype(np.float64)
+        self.idf_bm25 = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+        self.idf = np.log((1 + n_docs) / (1 + df)) + 1  # Smoothed TF-IDF idf
+
+        tf = self.counts.astype(np.float64)
+        doc_len = lengths[doc_of].astype(np.float64)
+        avgdl = lengths.mean() if n_docs and lengths.any() else 1.0
+        saturation = tf + k1 * (1 - b + b * doc_len / avgdl)
+        bm25 = self.idf_bm25[self.indices] * tf * (k1 + 1) / saturation
+
+        # Cosine TF-IDF: sublinear tf, rows scaled to unit length
+        tfidf = (1 + np.log(tf)) * self.idf[self.indices]
+        norms = np.sqrt(np.bincount(doc_of, weights=tfidf * tfidf, minlength=n_docs))
+        tfidf /= np.where(norms > 0, norms, 1)[doc_of]
+
+        # CSC: the same postings grouped by term, for gathering a query's columns
+        order = np.argsort(self.indices, kind="stable")
+        self.col_docs = doc_of[order].astype(np.int32)
+        self.col_indptr = np.zeros(n_terms + 1, dtype=np.int64)
+        np.cumsum(df.astype(np.int64), out=self.col_indptr[1:])
+        self.weights = {
+            "bm25": bm25[order].astype(np.float32),
+            "tfidf": tfidf[order].astype(np.float32),
+        }
+
+    @classmethod
+    def from_jobs(cls, job_descriptions: list, **kwargs) -> "MatchIndex":
+        """Index job description texts."""
+        return cls([job_terms(text) for text in job_descriptions], **kwargs)
+
+    @classmethod
+    def from_resumes(cls, resumes: list, **kwargs) -> "MatchIndex":
+        """Index structured resumes."""
+        return cls([resume_terms(resume) for resume in resumes], **kwargs)
+
+    def _query_weights(self, tokens: list, method: str) -> tuple:
+        """Term ids of a query present in the vocabulary and their query-side weights."""
+        ids = np.fromiter(
+            (self.vocabulary.get(token, -1) for token in tokens), dtype=np.int64, count=len(tokens)
+        )
+        terms, counts = np.unique(ids[ids >= 0], return_counts=True)
+        # Sublinear query term frequency, so repeated query terms do not dominate
+        weights = 1 + np.log(counts)
+        if method == "tfidf":
+            weights = weights * self.idf[terms]
+            norm = np.sqrt(np.dot(weights, weights))
+            if norm > 0:
+                weights /= norm
+        return terms, weights
+
+    def _gather(self, terms: np.ndarray) -> tuple:
+        """Positions of every posting of the given terms in the CSC arrays, and their lengths."""
+        starts = self.col_indptr[terms]
+        lengths = self.col_indptr[terms + 1] - starts
+        total = int(lengths.sum())
+        # Concatenated ranges starts[i]..starts[i]+lengths[i] without a Python loop
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return offsets + np.arange(total), lengths
+
+    def scores(self, query: list, method: str = "bm25") -> np.ndarray:
+        """
+        Similarity of one tokenized query to every document.
+
+        Args:
+            query: Query tokens, e.g. from resume_terms or job_terms.
+            method: "bm25" or "tfidf" (cosine similarity in [0, 1]).
+
+        Returns:
+            Array of n_docs scores.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown method: {method}")
+        terms, weights = self._query_weights(query, method)
+        positions, lengths = self._gather(terms)
+        return np.bincount(
+            self.col_docs[positions],
+            weights=self.weights[method][positions] * np.repeat(weights, lengths),
+            minlength=self.n_docs,
+        )
+
+    def score_matrix(self, queries: list, method: str = "bm25") -> np.ndarray:
+        """
+        Similarity of many tokenized queries to every document, in one pass.
+
+        Returns:
+            Array of shape (len(queries), n_docs).
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown method: {method}")
+        per_query = [self._query_weights(query, method) for query in queries]
+        terms = np.concatenate([terms for terms, _ in per_query] or [np.zeros(0, np.int64)])
+        weights = np.concatenate([weights for _, weights in per_query] or [np.zeros(0)])
+        query_of = np.repeat(
+            np.arange(len(queries), dtype=np.int64), [len(terms) for terms, _ in per_query]
+        )
+
+        positions, lengths = self._gather(terms)
+        cells = np.repeat(query_of, lengths) * self.n_docs + self.col_docs[positions]
+        matrix = np.bincount(
+            cells,
+            weights=self.weights[method][positions] * np.repeat(weights, lengths),
+            minlength=len(queries) * self.n_docs,
+        )
+        return matrix.reshape(len(queries), self.n_docs)
+
+    def top_k(self, query: list, k: int | None = None, method: str = "bm25") -> list:
+        """
+        Best matching documents for a query.
+
+        Returns:
+            List of (document index, score), highest first with ties in
+            document order, also at the cutoff; all documents when k is None.
+        """
+        scores = self.scores(query, method)
+        if k is not None and 0 < k < self.n_docs:
+            # Partition for the k-th best score, then keep everything tied with
+            # it, so the stable sort below decides which tied documents make it
+            kth = -np.partition(-scores, k - 1)[k - 1]
+            candidates = np.flatnonzero(scores >= kth)
+        else:
+            candidates = np.arange(self.n_docs)
+        # Highest score first, ties in document order
+        order = candidates[np.lexsort((candidates, -scores[candidates]))][:k]
+        return [(int(index), float(scores[index])) for index in order]
+
+
+def rank_jobs(
+    resume: dict, job_descriptions: list, k: int | None = None, method: str = "bm25"
+) -> list:
+    """
+    Rank job descriptions by how well a resume matches them.
+
+    Args:
+        resume: Structured resume as a dictionary.
+        job_descriptions: Job posting texts.
+        k: Keep only the k best matches (default: all).
+        method: "bm25" or "tfidf".
+
+    Returns:
+        List of (job index, score), best match first.
+    """
+    index = MatchIndex.from_jobs(job_descriptions)
+    return index.top_k(resume_terms(resume), k, method)
+
+
+def rank_resumes(
+    job_description: str, resumes: list, k: int | None = None, method: str = "bm25"
+) -> list:
+    """
+    Rank structured resumes by how well they match a job description.
+
+    Returns:
+        List of (resume index, score), best match first.
+    """
+    index = MatchIndex.from_resumes(resumes)
+    return index.top_k(job_terms(job_description), k, method)
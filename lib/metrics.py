@@ -0,0 +1,233 @@
+"""Lightweight spans and counters for pipeline stages, exportable as Prometheus text.
+
+Spans and counters are also forwarded to OpenTelemetry when the
+opentelemetry-api package is installed; without an SDK configured those
+calls are no-ops.
+"""
+
+import functools
+import inspect
+import threading
+import time
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+try:
+    from opentelemetry import metrics as otel_metrics
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_metrics = None
+    otel_trace = None
+
+# Upper bounds, in seconds, of the stage duration histogram buckets
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Finished spans kept for the debug panel
+MAX_RECENT_SPANS = 200
+
+COUNTER_HELP = {
+    "llm_requests_total": "LLM requests sent, including retries",
+    "llm_retries_total": "LLM requests retried after a transient failure",
+    "llm_failures_total": "LLM requests that failed without further retries",
+    "llm_prompt_tokens_total": "Prompt tokens reported by the LLM API",
+    "llm_completion_tokens_total": "Completion tokens reported by the LLM API",
+    "cache_hits_total": "Cache lookups served from cache",
+    "cache_misses_total": "Cache lookups that missed",
+    "stage_errors_total": "Stages that raised an exception",
+}
+
+# Span of the innermost running stage in the current thread or task
+_current_span = ContextVar("current_span", default=None)
+
+
+class MetricsRegistry:
+    """Thread-safe counters, per-stage duration histograms and a log of recent spans."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}  # (name, labels) -> value
+        self._durations = {}  # stage -> [count, sum, bucket counts]
+        self._spans = deque(maxlen=MAX_RECENT_SPANS)
+        self._otel_counters = {}
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        """Add to a counter identified by name and labels."""
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+            if otel_metrics is not None and name not in self._otel_counters:
+                meter = otel_metrics.get_meter("resume_tailor")
+                self._otel_counters[name] = meter.create_counter(
+                    name, description=COUNTER_HELP.get(name, "")
+                )
+        if otel_metrics is not None:
+            self._otel_counters[name].add(value, {k: str(v) for k, v in labels.items()})
+
+    def observe(self, record: dict) -> None:
+        """Record a finished span."""
+        with self._lock:
+            stats = self._durations.setdefault(
+                record["stage"], [0, 0.0, [0] * len(DURATION_BUCKETS)]
+            )
+            stats[0] += 1
+            stats[1] += record["seconds"]
+            for index, bound in enumerate(DURATION_BUCKETS):
+                if record["seconds"] <= bound:
+                    stats[2][index] += 1
+            self._spans.append(record)
+
+    def counters(self) -> dict:
+        """Return counters as {"name{label=value,...}": value}."""
+        with self._lock:
+            return {
+                _series(name, labels): value for (name, labels), value in self._counters.items()
+            }
+
+    def stage_summary(self) -> dict:
+        """Return {stage: {"count", "total_seconds", "mean_seconds"}} for every stage seen."""
+        with self._lock:
+            return {
+                stage: {
+                    "count": count,
+                    "total_seconds": round(total, 4),
+                    "mean_seconds": round(total / count, 4),
+                }
+                for stage, (count, total, _) in self._durations.items()
+            }
+
+    def recent_spans(self) -> list:
+        """Return the most recent finished spans, oldest first."""
+        with self._lock:
+            return list(self._spans)
+
+    def prometheus_text(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            by_name = {}
+            for (name, labels), value in sorted(self._counters.items()):
+                by_name.setdefault(name, []).append((labels, value))
+            for name, series in by_name.items():
+                lines.append(f"# HELP resume_tailor_{name} {COUNTER_HELP.get(name, name)}")
+                lines.append(f"# TYPE resume_tailor_{name} counter")
+                for labels, value in series:
+                    lines.append(f"{_series('resume_tailor_' + name, labels)} {value}")
+
+            if self._durations:
+                name = "resume_tailor_stage_duration_seconds"
+                lines.append(f"# HELP {name} Wall time of pipeline stages")
+                lines.append(f"# TYPE {name} histogram")
+            for stage, (count, total, buckets) in sorted(self._durations.items()):
+                # Bucket counts are already cumulative
+                for bound, bucket in zip(DURATION_BUCKETS, buckets):
+                    labels = (("le", str(bound)), ("stage", stage))
+                    lines.append(f"{_series(name + '_bucket', labels)} {bucket}")
+                labels = (("le", "+Inf"), ("stage", stage))
+                lines.append(f"{_series(name + '_bucket', labels)} {count}")
+                lines.append(f"{_series(name + '_sum', (('stage', stage),))} {total}")
+                lines.append(f"{_series(name + '_count', (('stage', stage),))} {count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Clear all counters, durations and recorded spans."""
+        with self._lock:
+            self._counters.clear()
+            self._durations.clear()
+            self._spans.clear()
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _series(name: str, labels: tuple) -> str:
+    """Format a metric name with its labels."""
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+registry = MetricsRegistry()
+
+
+def increment(name: str, value: float = 1, **labels) -> None:
+    """Add to a counter in the process-wide registry."""
+    registry.increment(name, value, **labels)
+
+
+@contextmanager
+def span(stage: str, **attributes):
+    """
+    Time a pipeline stage.
+
+    Spans nest: a span started inside another records it as its parent.
+    Attributes can be added while the span runs through the yielded dict.
+
+    Args:
+        stage: Stage name, e.g. "extract_text" or "llm.generate".
+        attributes: Extra details recorded with the span (not used as labels).
+
+    Yields:
+        The span's attributes dictionary.
+    """
+    parent = _current_span.get()
+    record = {
+        "stage": stage,
+        "parent": parent["stage"] if parent else None,
+        "start": time.time(),
+        "attributes": attributes,
+        "status": "ok",
+    }
+    _current_span.set(record)
+    start = time.perf_counter()
+    with ExitStack() as stack:
+        otel_span = None
+        if otel_trace is not None:
+            tracer = otel_trace.get_tracer("resume_tailor")
+            otel_span = stack.enter_context(tracer.start_as_current_span(stage))
+        try:
+            yield attributes
+        except Exception:
+            record["status"] = "error"
+            registry.increment("stage_errors_total", stage=stage)
+            raise
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            _current_span.set(parent)
+            registry.observe(record)
+            if otel_span is not None:
+                for key, value in attributes.items():
+                    if isinstance(value, (str, bool, int, float)):
+                        otel_span.set_attribute(key, value)
+
+
+def traced(stage: str):
+    """Decorator running a function, coroutine function or generator function in a span."""
+
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(stage):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        if inspect.isgeneratorfunction(fn):
+            @functools.wraps(fn)
+            def generator_wrapper(*args, **kwargs):
+                with span(stage):
+                    yield from fn(*args, **kwargs)
+
+            return generator_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
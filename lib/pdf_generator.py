@@ -1,7 +1,93 @@
 """PDF generation using fpdf2."""
 
+import functools
+import os
+import threading
+from collections import OrderedDict
+from io import BytesIO
 from pathlib import Path
+from typing import BinaryIO, NamedTuple
+from fontTools import ttLib
 from fpdf import FPDF
+from fpdf.enums import Align, XPos, YPos
+from fpdf.fonts import SubsetMap, TTFFont
+from fpdf.line_break import Fragment, TextLine
+from .cache import make_key
+from .metrics import increment, traced
+from .templates import load_template, template_key
+from .text_layout import glyph_table, wrap, wrap_many
+
+FONTS_DIR = Path(__file__).parent.parent / "fonts"
+
+# Bump whenever the drawing code changes so memoized PDFs are invalidated;
+# template changes are covered by the template key
+TEMPLATE_VERSION = 2
+
+# Upper bound on the memory held by memoized PDFs
+RENDER_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Parsed fonts shared by all ResumePDF instances: (fontkey, path) -> (TTFFont, file bytes)
+_font_cache = {}
+_font_cache_lock = threading.Lock()
+
+
+def clear_font_cache():
+    """Drop all parsed fonts so the next ResumePDF re-parses its TTF files."""
+    with _font_cache_lock:
+        _font_cache.clear()
+
+
+def _clone_font(template: TTFFont, pdf: FPDF, font_bytes: bytes) -> TTFFont:
+    """
+    Create a per-document copy of a parsed font.
+
+    Width tables, cmap and font descriptor are shared with the template. The
+    fontTools object and glyph subset are fresh, since fpdf subsets the font
+    in place when the document is output.
+    """
+    font = TTFFont.__new__(TTFFont)
+    for attr in TTFFont.__slots__:
+        if hasattr(template, attr):
+            setattr(font, attr, getattr(template, attr))
+
+    font.i = len(pdf.fonts) + 1
+    font.ttfont = ttLib.TTFont(BytesIO(font_bytes), recalcTimestamp=False, lazy=True)
+    font.missing_glyphs = []
+    font.biggest_size_pt = 0
+    font.subset = SubsetMap(font)
+    return font
+
+
+class LayoutStyle(NamedTuple):
+    """Typography that page fitting may tighten; the defaults are the standard template."""
+
+    font_size: float = 11  # Body text, entry titles and bullets, in points
+    line_height: float = 5  # Height of one line of body text
+    spacing: float = 1.0  # Scale of the vertical gaps between blocks
+    max_bullets: int | None = None  # Bullets kept per experience or project entry
+
+
+DEFAULT_STYLE = LayoutStyle()
+
+
+class SectionOp(NamedTuple):
+    """One draw operation of a layout plan."""
+
+    name: str  # Section type, used for per-section measurements
+    draw: object  # Callable (pdf, resume_data) that lays the section out
+
+
+class LayoutPlan(NamedTuple):
+    """A template compiled into draw operations and page settings."""
+
+    key: str  # template_key() of the source template
+    name: str
+    operations: tuple
+    accent: tuple  # Section title and rule color
+    text_color: tuple
+    margins: tuple  # Left, top, right
+    bottom_margin: float
+    rule_end: float | None  # x where section rules end; None for the right margin
 
 
 class ResumePDF(FPDF):
@@ -10,36 +96,121 @@ class ResumePDF(FPDF):
     # Bullet character
     BULLET = "-"
 
-    def __init__(self):
+    def __init__(self, style: LayoutStyle = DEFAULT_STYLE, plan: LayoutPlan | None = None):
         super().__init__()
+        self.style = style
+        self.plan = plan or compile_template()
+        # Height of title rows, one unit taller than body lines
+        self.row_height = style.line_height + 1
         # Add Unicode fonts from bundled fonts directory
-        fonts_dir = Path(__file__).parent.parent / "fonts"
-        self.add_font("DejaVu", "", str(fonts_dir / "DejaVuSans.ttf"))
-        self.add_font("DejaVu", "B", str(fonts_dir / "DejaVuSans-Bold.ttf"))
-        self.set_auto_page_break(auto=True, margin=20)
+        self._add_cached_font("DejaVu", "", FONTS_DIR / "DejaVuSans.ttf")
+        self._add_cached_font("DejaVu", "B", FONTS_DIR / "DejaVuSans-Bold.ttf")
+        self.set_auto_page_break(auto=True, margin=self.plan.bottom_margin)
+        self.set_text_color(*self.plan.text_color)
         self.add_page()
-        self.set_margins(18, 15, 18)
+        self.set_margins(*self.plan.margins)
+
+    def _add_cached_font(self, family: str, style: str, path: Path):
+        """Register a TTF font, parsing the file only once per process."""
+        fontkey = f"{family.lower()}{style}"
+
+        with _font_cache_lock:
+            cached = _font_cache.get((fontkey, path))
+            if cached is None:
+                cached = (TTFFont(self, path, fontkey, style), path.read_bytes())
+                _font_cache[(fontkey, path)] = cached
+
+        template, font_bytes = cached
+        self.fonts[fontkey] = _clone_font(template, self, font_bytes)
+
+    def _gap(self, h: float):
+        """Leave vertical space between blocks, scaled by the style's spacing."""
+        self.ln(h * self.style.spacing)
+
+    def _measure(self, text: str) -> float:
+        """Width of text in the current font, from the font's precomputed glyph widths."""
+        _, table = glyph_table(self.current_font)
+        return table.measure([text], self.font_size_pt, self.k)[0]
+
+    def _write_justified(self, text: str, h: float, lines: tuple | None = None):
+        """
+        Write text wrapped to the right margin, like multi_cell(0, h, text, align="J").
+
+        Lines are laid out with the cached glyph-width layout engine and drawn
+        directly; text the engine cannot lay out goes through multi_cell.
+
+        Args:
+            text: Text to write.
+            h: Line height.
+            lines: Lines already laid out for this text at the current position.
+        """
+        max_width = self.w - self.r_margin - self.x
+        if lines is None:
+            lines = wrap(
+                text, self.current_font, self.font_size_pt, self.k, max_width, self.c_margin
+            )
+        if lines is None:
+            self.multi_cell(0, h, text, align="J")
+            return
 
-    def _add_bullet_point(self, text: str, indent: int = 23, bullet: str = "-"):
+        graphics_state = self._get_current_graphics_state()
+        last = len(lines) - 1
+        for index, line in enumerate(lines):
+            fragments = [Fragment(line.text, graphics_state, self.k)] if line.text else []
+            self._render_styled_text_line(
+                TextLine(
+                    fragments,
+                    text_width=line.width,
+                    number_of_spaces=line.spaces,
+                    align=Align.J if line.justify else Align.L,
+                    height=self.font_size,
+                    max_width=max_width,
+                    trailing_nl=line.trailing_nl,
+                ),
+                h=h,
+                new_x=XPos.RIGHT if index == last else XPos.LEFT,
+                new_y=YPos.NEXT,
+                link=None,
+            )
+        if not lines:
+            # multi_cell still occupies one line for empty text
+            self._render_styled_text_line(
+                TextLine([], 0, 0, Align.L, h, max_width, False), h=h, new_y=YPos.NEXT
+            )
+        elif lines[-1].trailing_nl:
+            self.ln()
+
+    def _wrap_bullets(self, bullets: list, indent: int = 23, bullet: str = "-") -> list:
+        """Lay out a batch of bullet texts for _add_bullet_point in one pass."""
+        self.set_font("DejaVu", "", self.style.font_size)
+        text_start = indent + self._measure(f"{bullet}  ")
+        max_width = self.w - self.r_margin - text_start
+        return wrap_many(
+            bullets, self.current_font, self.font_size_pt, self.k, max_width, self.c_margin
+        )
+
+    def _add_bullet_point(
+        self, text: str, indent: int = 23, bullet: str = "-", lines: tuple | None = None
+    ):
         """Add a bullet point with proper text alignment for wrapped lines."""
         # Save current left margin
         original_left_margin = self.l_margin
 
         # Calculate text start position (after bullet)
         bullet_text = f"{bullet}  "
-        self.set_font("DejaVu", "", 11)
-        bullet_width = self.get_string_width(bullet_text)
+        self.set_font("DejaVu", "", self.style.font_size)
+        bullet_width = self._measure(bullet_text)
         text_start = indent + bullet_width
 
         # Print bullet at indent position
         self.set_x(indent)
-        self.cell(bullet_width, 5, bullet_text, ln=False)
+        self.cell(bullet_width, self.style.line_height, bullet_text, ln=False)
 
         # Set left margin so wrapped lines align with text start
         self.set_left_margin(text_start)
 
         # Print text (will wrap at new left margin)
-        self.multi_cell(0, 5, text, align="J")
+        self._write_justified(text, self.style.line_height, lines)
 
         # Restore original left margin
         self.set_left_margin(original_left_margin)
@@ -49,7 +220,7 @@ class ResumePDF(FPDF):
         # Name - DejaVu Bold, ALL CAPS, centered
         self.set_font("DejaVu", "B", 24)
         self.cell(0, 12, name.upper(), ln=True, align="C")
-        self.ln(2)
+        self._gap(2)
 
         # Contact line: Title | Location | Phone | Email (regular weight, centered)
         contact_parts = []
@@ -67,12 +238,12 @@ class ResumePDF(FPDF):
             contact_line = " | ".join(contact_parts)
             self.cell(0, 6, contact_line, ln=True, align="C")
 
-        self.ln(6)
+        self._gap(6)
 
     def add_section_title(self, title: str):
         """Add a section title with line extending from text to right margin."""
         self.set_font("DejaVu", "B", 12)
-        self.set_text_color(70, 130, 180)  # Steel blue
+        self.set_text_color(*self.plan.accent)
 
         # Get the width of the title text
         title_text = title.upper()
@@ -83,29 +254,32 @@ class ResumePDF(FPDF):
 
         # Draw line from title end to right margin
         y_pos = self.get_y() + 3.5
-        self.set_draw_color(70, 130, 180)
-        self.line(self.get_x() + 2, y_pos, 192, y_pos)
+        self.set_draw_color(*self.plan.accent)
+        rule_end = self.plan.rule_end
+        if rule_end is None:
+            rule_end = self.w - self.r_margin
+        self.line(self.get_x() + 2, y_pos, rule_end, y_pos)
 
-        self.set_text_color(0, 0, 0)  # Reset to black
-        self.ln(10)
+        self.set_text_color(*self.plan.text_color)
+        self.ln(7 + 3 * self.style.spacing)
 
-    def add_summary(self, summary: str):
+    def add_summary(self, summary: str, title: str = "Profile"):
         """Add professional summary/profile section."""
         if not summary:
             return
 
-        self.add_section_title("Profile")
-        self.set_font("DejaVu", "", 11)
-        self.multi_cell(0, 5, summary, align="J")
-        self.ln(4)
+        self.add_section_title(title)
+        self.set_font("DejaVu", "", self.style.font_size)
+        self._write_justified(summary, self.style.line_height)
+        self._gap(4)
 
-    def add_skills(self, skills):
+    def add_skills(self, skills, title: str = "Technical Skills"):
         """Add technical skills section as flat comma-separated list."""
         if not skills:
             return
 
-        self.add_section_title("Technical Skills")
-        self.set_font("DejaVu", "", 11)
+        self.add_section_title(title)
+        self.set_font("DejaVu", "", self.style.font_size)
 
         # Handle both dict (categorized) and list (flat) formats
         if isinstance(skills, dict):
@@ -121,15 +295,15 @@ class ResumePDF(FPDF):
         else:
             skills_text = str(skills)
 
-        self.multi_cell(0, 5, skills_text, align="J")
-        self.ln(4)
+        self._write_justified(skills_text, self.style.line_height)
+        self._gap(4)
 
-    def add_education(self, education: list):
+    def add_education(self, education: list, title: str = "Education"):
         """Add education section with mixed format: two-line for first, single-line for rest."""
         if not education:
             return
 
-        self.add_section_title("Education")
+        self.add_section_title(title)
 
         for idx, edu in enumerate(education):
             degree = edu.get("degree", "")
@@ -146,43 +320,50 @@ class ResumePDF(FPDF):
 
             if idx == 0:
                 # First entry: two-line format for long degrees
-                self.set_font("DejaVu", "B", 11)
-                self.cell(0, 6, f"- {degree}", ln=True)
+                self.set_font("DejaVu", "B", self.style.font_size)
+                self.cell(0, self.row_height, f"- {degree}", ln=True)
                 if parts:
-                    self.set_font("DejaVu", "", 11)
+                    self.set_font("DejaVu", "", self.style.font_size)
                     self.set_x(self.l_margin + 7)
-                    self.cell(0, 5, " | ".join(parts), ln=True)
-                self.ln(2)
+                    self.cell(0, self.style.line_height, " | ".join(parts), ln=True)
+                self._gap(2)
             else:
                 # Remaining entries: single-line format to save space
-                self.set_font("DejaVu", "B", 11)
+                self.set_font("DejaVu", "B", self.style.font_size)
                 bullet_degree = f"- {degree}"
                 degree_width = self.get_string_width(bullet_degree) + 2
-                self.cell(degree_width, 6, bullet_degree, ln=False)
+                self.cell(degree_width, self.row_height, bullet_degree, ln=False)
                 if parts:
-                    self.set_font("DejaVu", "", 11)
-                    self.cell(0, 6, " - " + " | ".join(parts), ln=True)
+                    self.set_font("DejaVu", "", self.style.font_size)
+                    self.cell(0, self.row_height, " - " + " | ".join(parts), ln=True)
                 else:
-                    self.ln(6)
+                    self.ln(self.row_height)
 
-        self.ln(2)
+        self._gap(2)
 
-    def add_experience(self, experiences: list):
+    def add_experience(self, experiences: list, title: str = "Experience"):
         """Add work experience section."""
         if not experiences:
             return
 
-        self.add_section_title("Experience")
+        self.add_section_title(title)
 
+        line_height = self.style.line_height
         for exp in experiences:
-            # Check if enough space for header + at least one bullet
-            min_height_needed = 35
-            if self.get_y() + min_height_needed > self.h - self.b_margin:
+            bullets = exp.get("bullets", [])[: self.style.max_bullets]
+            wrapped = self._wrap_bullets(bullets)
+
+            # Keep the entry header together with its first bullet
+            min_height_needed = self.row_height + line_height + 2 * self.style.spacing
+            if wrapped:
+                first_lines = len(wrapped[0]) if wrapped[0] is not None else 1
+                min_height_needed += max(first_lines, 1) * line_height
+            if self.get_y() + min_height_needed > self.page_break_trigger:
                 self.add_page()
 
             # Line 1: Job title (bold)
-            self.set_font("DejaVu", "B", 11)
-            self.cell(0, 6, exp.get("title", ""), ln=True)
+            self.set_font("DejaVu", "B", self.style.font_size)
+            self.cell(0, self.row_height, exp.get("title", ""), ln=True)
 
             # Line 2: Company | Type | Location with dates right-aligned
             company_parts = []
@@ -196,30 +377,30 @@ class ResumePDF(FPDF):
             company_line = " | ".join(company_parts)
             dates = exp.get("dates", "")
 
-            self.set_font("DejaVu", "B", 11)
-            self.cell(0, 5, company_line, ln=False)
-            self.set_font("DejaVu", "", 11)
-            self.cell(0, 5, dates, ln=True, align="R")
+            self.set_font("DejaVu", "B", self.style.font_size)
+            self.cell(0, line_height, company_line, ln=False)
+            self.set_font("DejaVu", "", self.style.font_size)
+            self.cell(0, line_height, dates, ln=True, align="R")
 
-            self.ln(2)
+            self._gap(2)
 
             # Bullet points
-            for bullet in exp.get("bullets", []):
-                self._add_bullet_point(bullet)
+            for bullet, lines in zip(bullets, wrapped):
+                self._add_bullet_point(bullet, lines=lines)
 
-            self.ln(4)
+            self._gap(4)
 
-    def add_projects(self, projects: list):
+    def add_projects(self, projects: list, title: str = "Projects"):
         """Add projects section."""
         if not projects:
             return
 
-        self.add_section_title("Projects")
+        self.add_section_title(title)
 
         for project in projects:
             # Project name (bold)
-            self.set_font("DejaVu", "B", 11)
-            self.cell(0, 6, project.get("name", ""), ln=True)
+            self.set_font("DejaVu", "B", self.style.font_size)
+            self.cell(0, self.row_height, project.get("name", ""), ln=True)
 
             # Technologies if present
             if project.get("technologies"):
@@ -227,26 +408,27 @@ class ResumePDF(FPDF):
                 techs = project["technologies"]
                 if isinstance(techs, list):
                     techs = ", ".join(techs)
-                self.cell(0, 5, techs, ln=True)
+                self.cell(0, self.style.line_height, techs, ln=True)
 
             # Description if present
             if project.get("description"):
-                self.set_font("DejaVu", "", 11)
-                self.multi_cell(0, 5, project["description"], align="J")
+                self.set_font("DejaVu", "", self.style.font_size)
+                self._write_justified(project["description"], self.style.line_height)
 
             # Bullet points
-            for bullet in project.get("bullets", []):
-                self._add_bullet_point(bullet)
+            bullets = project.get("bullets", [])[: self.style.max_bullets]
+            for bullet, lines in zip(bullets, self._wrap_bullets(bullets)):
+                self._add_bullet_point(bullet, lines=lines)
 
-            self.ln(3)
+            self._gap(3)
 
-    def add_certifications(self, certifications: list):
+    def add_certifications(self, certifications: list, title: str = "Certifications"):
         """Add certifications section."""
         if not certifications:
             return
 
-        self.add_section_title("Certifications")
-        self.set_font("DejaVu", "", 11)
+        self.add_section_title(title)
+        self.set_font("DejaVu", "", self.style.font_size)
 
         for cert in certifications:
             # Format: • Certification Name - Issuer | Date
@@ -261,26 +443,26 @@ class ResumePDF(FPDF):
             if cert_parts:
                 cert_line += " - " + " | ".join(cert_parts)
 
-            self.cell(0, 6, cert_line, ln=True)
+            self.cell(0, self.row_height, cert_line, ln=True)
 
-        self.ln(4)
+        self._gap(4)
 
-    def add_references(self, references=None):
+    def add_references(self, references=None, title: str = "References"):
         """Add references section."""
-        self.add_section_title("References")
-        self.set_font("DejaVu", "", 11)
+        self.add_section_title(title)
+        self.set_font("DejaVu", "", self.style.font_size)
 
         if references and isinstance(references, list) and len(references) > 0:
             # List actual references if provided
             for ref in references:
                 name = ref.get("name", "")
-                title = ref.get("title", "")
+                ref_title = ref.get("title", "")
                 company = ref.get("company", "")
                 contact = ref.get("contact", "")
 
                 ref_text = name
-                if title:
-                    ref_text += f", {title}"
+                if ref_title:
+                    ref_text += f", {ref_title}"
                 if company:
                     ref_text += f" at {company}"
                 if contact:
@@ -289,57 +471,391 @@ class ResumePDF(FPDF):
                 self._add_bullet_point(ref_text)
         else:
             # Default: Available upon request
-            self.cell(0, 6, "Available upon request", ln=True)
+            self.cell(0, self.row_height, "Available upon request", ln=True)
+
+        self._gap(4)
 
-        self.ln(4)
 
+class MeasuringPDF(ResumePDF):
+    """
+    ResumePDF that lays out text without drawing it.
 
-def generate_pdf(resume_data: dict) -> bytes:
+    Every line of text still goes through fpdf's cursor movement and automatic
+    page breaks, but nothing is written to the page, so a whole resume can be
+    measured in a fraction of the time it takes to render it.
+    """
+
+    def _render_styled_text_line(
+        self,
+        text_line: TextLine,
+        h: float | None = None,
+        border=0,
+        new_x: XPos = XPos.RIGHT,
+        new_y: YPos = YPos.TOP,
+        fill: bool = False,
+        link="",
+        center: bool = False,
+        padding=None,
+        prevent_font_change: bool = False,
+    ) -> bool:
+        # Cursor movement of FPDF._render_styled_text_line for the positions ResumePDF uses
+        w = text_line.max_width
+        if w is None:
+            w = sum(frag.get_width() for frag in text_line.fragments) + 2 * self.c_margin
+        elif w == 0:
+            w = self.w - self.r_margin - self.x
+        if h is None:
+            h = max((frag.font_size for frag in text_line.fragments), default=0)
+        page_break_triggered = self._perform_page_break_if_need_be(h)
+        self._lasth = h or self.font_size
+
+        if new_x == XPos.RIGHT:
+            self.x += w
+        elif new_x == XPos.LMARGIN:
+            self.x = self.l_margin
+        if new_y == YPos.NEXT:
+            self.y += h
+        return page_break_triggered
+
+    def line(self, x1, y1, x2, y2):
+        pass
+
+
+class LayoutMeasure(NamedTuple):
+    """Result of a layout simulation."""
+
+    pages: int
+    last_page_y: float  # Cursor position on the last page
+    sections: dict  # Section name -> height it occupies, across pages
+
+
+def _draw_header(pdf: ResumePDF, resume_data: dict, title: str):
+    """Draw the name and contact header; it has no section heading, so title is unused."""
+    # Use professional_title if available, otherwise fall back to first job title
+    professional_title = resume_data.get("professional_title", "")
+    if not professional_title:
+        experiences = resume_data.get("experience", [])
+        if experiences and experiences[0].get("title"):
+            professional_title = experiences[0]["title"]
+    pdf.add_header(
+        resume_data.get("name", ""), resume_data.get("contact", {}), title=professional_title
+    )
+
+
+# Section type -> function(pdf, resume_data, title) drawing that section
+SECTION_RENDERERS = {
+    "header": _draw_header,
+    "summary": lambda pdf, data, title: pdf.add_summary(data.get("summary", ""), title),
+    "skills": lambda pdf, data, title: pdf.add_skills(data.get("skills", {}), title),
+    "education": lambda pdf, data, title: pdf.add_education(data.get("education", []), title),
+    "experience": lambda pdf, data, title: pdf.add_experience(data.get("experience", []), title),
+    "projects": lambda pdf, data, title: pdf.add_projects(data.get("projects", []), title),
+    "certifications": lambda pdf, data, title: pdf.add_certifications(
+        data.get("certifications", []), title
+    ),
+    "references": lambda pdf, data, title: pdf.add_references(data.get("references", None), title),
+}
+
+# Compiled layout plans by template key
+_plans = {}
+_plans_lock = threading.Lock()
+
+
+def compile_template(
+    template: str | os.PathLike | dict | LayoutPlan | None = None,
+) -> LayoutPlan:
+    """
+    Compile a template into a layout plan, once per distinct template.
+
+    Section order, headings, colors and margins are resolved here, so
+    rendering a document only replays the plan's draw operations.
+
+    Args:
+        template: Template name, path or dictionary (see templates.load_template),
+            None for the default template, or an already compiled plan.
+
+    Returns:
+        The cached LayoutPlan for the template.
+
+    Raises:
+        ValueError: If the template is unknown or malformed.
+    """
+    if isinstance(template, LayoutPlan):
+        return template
+    normalized = load_template(template)
+    key = template_key(normalized)
+    with _plans_lock:
+        plan = _plans.get(key)
+    if plan is not None:
+        return plan
+
+    operations = tuple(
+        SectionOp(
+            section["type"],
+            functools.partial(SECTION_RENDERERS[section["type"]], title=section["title"]),
+        )
+        for section in normalized["sections"]
+    )
+    plan = LayoutPlan(
+        key=key,
+        name=normalized["name"],
+        operations=operations,
+        accent=tuple(normalized["colors"]["accent"]),
+        text_color=tuple(normalized["colors"]["text"]),
+        margins=tuple(normalized["page"]["margins"]),
+        bottom_margin=normalized["page"]["bottom_margin"],
+        rule_end=normalized["rule_end"],
+    )
+    with _plans_lock:
+        return _plans.setdefault(key, plan)
+
+
+def clear_plan_cache():
+    """Drop compiled layout plans, e.g. after editing template files."""
+    with _plans_lock:
+        _plans.clear()
+
+
+def _compose(pdf: ResumePDF, resume_data: dict) -> dict:
+    """
+    Lay out every section of the document's layout plan.
+
+    Returns:
+        Mapping of section name to the height it occupies, page breaks
+        included.
+    """
+    heights = {}
+    for name, draw in pdf.plan.operations:
+        page, y = pdf.page, pdf.get_y()
+        draw(pdf, resume_data)
+        if pdf.page == page:
+            height = pdf.get_y() - y
+        else:
+            # Rest of the first page, full pages in between, then the top of the last page
+            page_height = pdf.page_break_trigger - pdf.t_margin
+            height = (
+                pdf.page_break_trigger - y
+                + (pdf.page - page - 1) * page_height
+                + pdf.get_y() - pdf.t_margin
+            )
+        heights[name] = round(height, 2)
+    return heights
+
+
+def measure_layout(
+    resume_data: dict, style: LayoutStyle = DEFAULT_STYLE, template=None
+) -> LayoutMeasure:
+    """
+    Simulate the layout of a resume without producing a PDF.
+
+    Args:
+        resume_data: Dictionary containing resume sections.
+        style: Typography to lay the resume out with.
+        template: Template or compiled plan, as for compile_template.
+
+    Returns:
+        Page count, final cursor position and per-section heights.
+    """
+    pdf = MeasuringPDF(style, compile_template(template))
+    sections = _compose(pdf, resume_data)
+    return LayoutMeasure(pdf.page, pdf.get_y(), sections)
+
+
+# Progressively tighter styles tried by fit_style before any bullet is dropped
+FIT_STYLES = (
+    DEFAULT_STYLE,
+    LayoutStyle(spacing=0.75),
+    LayoutStyle(10.5, 4.75, 0.75),
+    LayoutStyle(10, 4.5, 0.75),
+    LayoutStyle(10, 4.5, 0.5),
+    LayoutStyle(9.5, 4.25, 0.5),
+    LayoutStyle(9, 4, 0.5),
+)
+
+# Bullets always kept per entry when trimming
+MIN_BULLETS = 2
+
+
+def _fit_candidates(resume_data: dict):
+    """Styles to try for page fitting, least to most aggressive."""
+    yield from FIT_STYLES
+
+    # Then drop trailing bullets from long entries, tightest style first
+    entries = (resume_data.get("experience") or []) + (resume_data.get("projects") or [])
+    most_bullets = max(
+        (
+            len(entry["bullets"])
+            for entry in entries
+            if isinstance(entry, dict) and isinstance(entry.get("bullets"), list)
+        ),
+        default=0,
+    )
+    for max_bullets in range(most_bullets - 1, MIN_BULLETS - 1, -1):
+        yield FIT_STYLES[-1]._replace(max_bullets=max_bullets)
+
+
+@traced("fit_pages")
+def fit_style(resume_data: dict, target_pages: int, template=None) -> LayoutStyle:
+    """
+    Pick the least aggressive style that lays a resume out on target_pages or fewer.
+
+    Candidates are measured with measure_layout, from the standard template
+    through smaller type and tighter spacing to trimming each entry's last
+    bullets. Wrapped lines are cached, so each simulation after the first
+    mostly replays cached measurements.
+
+    Args:
+        resume_data: Dictionary containing resume sections.
+        target_pages: Maximum number of pages.
+        template: Template or compiled plan, as for compile_template.
+
+    Returns:
+        The first fitting style, or the tightest one if none fits.
+    """
+    plan = compile_template(template)
+    style = DEFAULT_STYLE
+    for style in _fit_candidates(resume_data):
+        if measure_layout(resume_data, style, plan).pages <= target_pages:
+            break
+    return style
+
+
+def _build_pdf(resume_data: dict, target_pages: int | None, template) -> ResumePDF:
+    """Lay out a resume on a new document, fitting it to target_pages if given."""
+    plan = compile_template(template)
+    style = fit_style(resume_data, target_pages, plan) if target_pages else DEFAULT_STYLE
+    pdf = ResumePDF(style, plan)
+    _compose(pdf, resume_data)
+    return pdf
+
+
+@traced("render_pdf")
+def generate_pdf(
+    resume_data: dict, target_pages: int | None = None, template=None
+) -> bytes:
     """
     Generate a PDF from structured resume data.
 
     Args:
         resume_data: Dictionary containing resume sections.
+        target_pages: Fit the resume on at most this many pages by tightening
+            type and spacing, then trimming bullets (see fit_style).
+        template: Template name, path or dictionary (see compile_template);
+            None for the default template.
 
     Returns:
         PDF as bytes.
     """
-    pdf = ResumePDF()
+    # Output to bytes
+    return bytes(_build_pdf(resume_data, target_pages, template).output())
 
-    # Use professional_title if available, otherwise fall back to first job title
-    title = resume_data.get("professional_title", "")
-    if not title:
-        experiences = resume_data.get("experience", [])
-        if experiences and experiences[0].get("title"):
-            title = experiences[0]["title"]
 
-    # Header with name and contact
-    pdf.add_header(
-        resume_data.get("name", ""),
-        resume_data.get("contact", {}),
-        title=title,
-    )
+@traced("render_pdf")
+def render_pdf(
+    resume_data: dict,
+    destination: str | os.PathLike | BinaryIO,
+    target_pages: int | None = None,
+    template=None,
+) -> int:
+    """
+    Render a PDF straight to a file or a writable binary stream such as a zip entry.
+
+    Unlike generate_pdf, no bytes copy of the document is made: fpdf's output
+    buffer is written as is and released with the document.
+
+    Args:
+        resume_data: Dictionary containing resume sections.
+        destination: File path or binary file object opened for writing.
+        target_pages: Maximum number of pages, as for generate_pdf.
+        template: Template, as for generate_pdf.
 
-    # Profile/Summary
-    pdf.add_summary(resume_data.get("summary", ""))
+    Returns:
+        Number of bytes written.
+    """
+    pdf = _build_pdf(resume_data, target_pages, template)
+    pdf.output(destination)
+    return len(pdf.buffer)
+
+
+class RenderCache:
+    """In-memory LRU cache of rendered PDFs, bounded by total size in bytes."""
+
+    def __init__(self, max_bytes: int = RENDER_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        """Return cached PDF bytes and mark them most recently used."""
+        with self._lock:
+            pdf_bytes = self._entries.get(key)
+            if pdf_bytes is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pdf_bytes
+
+    def set(self, key: str, pdf_bytes: bytes) -> None:
+        """Store PDF bytes, evicting least recently used entries over the size bound."""
+        if len(pdf_bytes) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.size -= len(self._entries.pop(key))
+            self._entries[key] = pdf_bytes
+            self.size += len(pdf_bytes)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
 
-    # Technical Skills
-    pdf.add_skills(resume_data.get("skills", {}))
+    def clear(self) -> None:
+        """Drop every cached PDF."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
 
-    # Education
-    pdf.add_education(resume_data.get("education", []))
 
-    # Experience
-    pdf.add_experience(resume_data.get("experience", []))
+_render_cache = RenderCache()
 
-    # Projects (if any)
-    pdf.add_projects(resume_data.get("projects", []))
 
-    # Certifications (if any)
-    pdf.add_certifications(resume_data.get("certifications", []))
+def _font_version() -> list:
+    """Identify the bundled fonts by name and size."""
+    return sorted((path.name, path.stat().st_size) for path in FONTS_DIR.glob("*.ttf"))
 
-    # References
-    pdf.add_references(resume_data.get("references", None))
 
-    # Output to bytes
-    return bytes(pdf.output())
+_FONT_VERSION = _font_version()
+
+
+def resume_hash(resume_data: dict, target_pages: int | None = None, template=None) -> str:
+    """Canonical hash of a resume together with its template, layout and font versions."""
+    plan = compile_template(template)
+    return make_key(resume_data, TEMPLATE_VERSION, _FONT_VERSION, target_pages, plan.key)
+
+
+def generate_pdf_cached(
+    resume_data: dict, target_pages: int | None = None, template=None
+) -> bytes:
+    """
+    Generate a PDF, reusing the previous render when the resume is unchanged.
+
+    Args:
+        resume_data: Dictionary containing resume sections.
+        target_pages: Maximum number of pages, as for generate_pdf.
+        template: Template, as for generate_pdf.
+
+    Returns:
+        PDF as bytes.
+    """
+    key = resume_hash(resume_data, target_pages, template)
+    pdf_bytes = _render_cache.get(key)
+    if pdf_bytes is None:
+        increment("cache_misses_total", cache="render")
+        pdf_bytes = generate_pdf(resume_data, target_pages, template)
+        _render_cache.set(key, pdf_bytes)
+    else:
+        increment("cache_hits_total", cache="render")
+    return pdf_bytes
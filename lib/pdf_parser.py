@@ -1,25 +1,152 @@
 """PDF text extraction using pdfplumber."""
 
-import pdfplumber
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
+from pathlib import Path
+
+import pdfplumber
+import pypdfium2
+
+from .metrics import span
+
+# Fraction of text lines split by a wide horizontal gap above which a page is
+# treated as multi-column and routed to pdfplumber instead of the fast path
+MULTI_COLUMN_LINE_RATIO = 0.25
+
+# Horizontal gap, as a fraction of page width, that separates two columns
+COLUMN_GAP_RATIO = 0.08
+
+
+def read_pdf_bytes(pdf_file) -> bytes:
+    """Return the raw bytes of PDF data given as bytes, a file-like object or a path."""
+    if isinstance(pdf_file, bytes):
+        return pdf_file
+    if isinstance(pdf_file, (str, Path)):
+        return Path(pdf_file).read_bytes()
+    if isinstance(pdf_file, BytesIO):
+        return pdf_file.getvalue()
+    return pdf_file.read()
+
+
+def _is_single_column(textpage, page_width: float) -> bool:
+    """Guess whether a pdfium text page has a simple single-column layout."""
+    rects = [textpage.get_rect(i) for i in range(textpage.count_rects())]
+    if not rects:
+        return True
+
+    # Group text rectangles into lines by vertical overlap
+    lines = []
+    for left, bottom, right, top in sorted(rects, key=lambda r: (-r[3], r[0])):
+        for line in lines:
+            overlap = min(top, line["top"]) - max(bottom, line["bottom"])
+            if overlap > 0.5 * min(top - bottom, line["top"] - line["bottom"]):
+                line["spans"].append((left, right))
+                break
+        else:
+            lines.append({"top": top, "bottom": bottom, "spans": [(left, right)]})
+
+    split_lines = 0
+    for line in lines:
+        spans = sorted(line["spans"])
+        gaps = (b[0] - a[1] for a, b in zip(spans, spans[1:]))
+        if any(gap > COLUMN_GAP_RATIO * page_width for gap in gaps):
+            split_lines += 1
+
+    return split_lines / len(lines) < MULTI_COLUMN_LINE_RATIO
+
+
+def _fast_page_text(pdf_document, plumber_pdf, index: int) -> str:
+    """Extract one page with pdfium, falling back to pdfplumber for complex layouts."""
+    page = pdf_document[index]
+    textpage = page.get_textpage()
+    if _is_single_column(textpage, page.get_width()):
+        text = textpage.get_text_range()
+        return "\n".join(line.rstrip() for line in text.replace("\r\n", "\n").split("\n"))
+    return plumber_pdf.pages[index].extract_text() or ""
+
 
+def _extract_pages(pdf_bytes: bytes, indices: list, fast: bool) -> list:
+    """Extract the text of the given pages (worker process entry point)."""
+    with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+        if not fast:
+            return [pdf.pages[i].extract_text() or "" for i in indices]
 
-def extract_text_from_pdf(pdf_file: BytesIO) -> str:
+        pdf_document = pypdfium2.PdfDocument(pdf_bytes)
+        try:
+            return [_fast_page_text(pdf_document, pdf, i) for i in indices]
+        finally:
+            pdf_document.close()
+
+
+def iter_pages_text(
+    pdf_file, fast: bool = False, parallel: bool = False, max_workers: int | None = None
+):
+    """
+    Extract text page by page, yielding each page as soon as it is ready.
+
+    Args:
+        pdf_file: A file-like object or path containing the PDF data.
+        fast: Use the pdfium fast path for single-column pages.
+        parallel: Farm pages out to a process pool.
+        max_workers: Worker processes for parallel mode (default: CPU count).
+
+    Yields:
+        Text of each page, in page order (empty string for pages without text).
+    """
+    pdf_bytes = read_pdf_bytes(pdf_file)
+
+    if not parallel:
+        with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+            if not fast:
+                for page in pdf.pages:
+                    yield page.extract_text() or ""
+                return
+
+            pdf_document = pypdfium2.PdfDocument(pdf_bytes)
+            try:
+                for index in range(len(pdf_document)):
+                    yield _fast_page_text(pdf_document, pdf, index)
+            finally:
+                pdf_document.close()
+        return
+
+    with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+        page_count = len(pdf.pages)
+
+    max_workers = max_workers or os.cpu_count() or 1
+    # Several chunks per worker so early pages come back while later ones are parsed
+    chunk_size = max(1, math.ceil(page_count / (max_workers * 2)))
+    chunks = [
+        list(range(start, min(start + chunk_size, page_count)))
+        for start in range(0, page_count, chunk_size)
+    ]
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks) or 1)) as pool:
+        futures = [pool.submit(_extract_pages, pdf_bytes, chunk, fast) for chunk in chunks]
+        for future in futures:
+            yield from future.result()
+
+
+def extract_text_from_pdf(
+    pdf_file: BytesIO, fast: bool = False, parallel: bool = False, max_workers: int | None = None
+) -> str:
     """
     Extract text content from a PDF file.
 
     Args:
         pdf_file: A file-like object containing the PDF data.
+        fast: Use the pdfium fast path for single-column pages.
+        parallel: Farm pages out to a process pool.
+        max_workers: Worker processes for parallel mode (default: CPU count).
 
     Returns:
         Extracted text as a string.
     """
-    text_parts = []
-
-    with pdfplumber.open(pdf_file) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(page_text)
+    with span("extract_text", fast=fast, parallel=parallel) as attributes:
+        pages = iter_pages_text(pdf_file, fast=fast, parallel=parallel, max_workers=max_workers)
+        text_parts = [page_text for page_text in pages if page_text]
+        attributes["pages"] = len(text_parts)
 
     return "\n\n".join(text_parts)
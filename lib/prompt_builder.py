@@ -0,0 +1,83 @@
+"""Compact prompt construction: minified JSON and task-specific field filtering."""
+
+import json
+
+from .scheduler import estimate_tokens
+
+# Fields the model does not need to see (and must not change) when optimizing
+OPTIMIZE_EXCLUDED_FIELDS = ("name", "contact", "references")
+
+
+def compact_json(data) -> str:
+    """Serialize data as minified JSON, keeping non-ASCII characters unescaped."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def split_fields(resume_json: dict, excluded: tuple) -> tuple:
+    """
+    Separate the fields a task needs from those held back.
+
+    Args:
+        resume_json: Structured resume as a dictionary.
+        excluded: Top-level keys to hold back from the prompt.
+
+    Returns:
+        (payload, held_back) dictionaries.
+    """
+    payload = {key: value for key, value in resume_json.items() if key not in excluded}
+    held_back = {key: value for key, value in resume_json.items() if key in excluded}
+    return payload, held_back
+
+
+def merge_fields(result: dict, held_back: dict, key_order: list) -> dict:
+    """
+    Re-insert held-back fields into a model result.
+
+    Held-back values always win over anything the model returned for the
+    same keys. Keys follow the original resume order, with any new keys
+    from the model appended.
+
+    Args:
+        result: Parsed model output.
+        held_back: Fields removed before prompting.
+        key_order: Top-level key order of the original resume.
+
+    Returns:
+        Merged resume dictionary.
+    """
+    merged = {}
+    for key in key_order:
+        if key in held_back:
+            merged[key] = held_back[key]
+        elif key in result:
+            merged[key] = result[key]
+    for key, value in result.items():
+        if key not in merged:
+            merged[key] = value
+    return merged
+
+
+def build_resume_prompt(template: str, resume_json: dict, excluded: tuple, **fields) -> tuple:
+    """
+    Render a resume prompt with compact JSON and excluded fields held back.
+
+    Args:
+        template: Prompt template with a {resume_json} placeholder.
+        resume_json: Structured resume as a dictionary.
+        excluded: Top-level keys to hold back from the prompt.
+        fields: Other template placeholders.
+
+    Returns:
+        (prompt, held_back, stats) where stats holds estimated token counts
+        for the compact prompt and for the previous indented full-resume form.
+    """
+    payload, held_back = split_fields(resume_json, excluded)
+    prompt = template.format(resume_json=compact_json(payload), **fields)
+    baseline = template.format(resume_json=json.dumps(resume_json, indent=2), **fields)
+
+    stats = {
+        "prompt_tokens": estimate_tokens(prompt),
+        "baseline_tokens": estimate_tokens(baseline),
+    }
+    stats["saved_tokens"] = stats["baseline_tokens"] - stats["prompt_tokens"]
+    return prompt, held_back, stats
@@ -19,6 +19,23 @@ Return a JSON object with these sections (only include sections that exist in th
 
 Return ONLY valid JSON, no markdown formatting or explanation."""
 
+# Rules shared by the full-resume optimization prompts, so the two cannot drift
+OPTIMIZE_RULES = """   - Adjusting bullet points to emphasize relevant experience (without fabricating)
+   - Keeping each bullet point to maximum 2 lines: preserve technical keywords and metrics, remove filler phrases
+   - Strengthening action verbs and quantifiable achievements
+   - Using diverse vocabulary - avoid repeating words like "demonstrating", "showcasing", "leveraging", "utilizing"; each bullet should use distinct action verbs
+   - Do not use the word "Spearheaded"
+3. Preserve:
+   - All factual information (dates, companies, job titles, education, certifications)
+   - The overall structure and format
+   - Professional tone
+4. Skills must be a flat array of strings, not categorized (e.g., ["Python", "AWS", "Docker"])
+5. Include certifications if present in the original resume
+6. Language quality: Vary action verbs across bullet points. Avoid filler words and repetitive phrasing. Each achievement should read distinctly.
+
+Return the optimized resume as a JSON object with the same structure as the input.
+Return ONLY valid JSON, no markdown formatting or explanation."""
+
 OPTIMIZE_RESUME_PROMPT = """You are an expert resume optimizer. Your task is to fine-tune a resume for a specific job description while preserving the original style, structure, and truthfulness.
 
 Original Resume (JSON):
@@ -32,36 +49,99 @@ Instructions:
 2. Enhance the resume by:
    - Updating professional_title to match the target job role using standard abbreviations (e.g., "ML Engineer" for machine learning roles, "AI Engineer" for artificial intelligence roles)
    - Reordering skills to prioritize job-relevant ones first (skills should be a flat array of strings)
-   - Adjusting bullet points to emphasize relevant experience (without fabricating)
-   - Keeping each bullet point to maximum 2 lines: preserve technical keywords and metrics, remove filler phrases
    - Incorporating relevant keywords naturally where appropriate
-   - Strengthening action verbs and quantifiable achievements
-   - Using diverse vocabulary - avoid repeating words like "demonstrating", "showcasing", "leveraging", "utilizing"; each bullet should use distinct action verbs
-   - Do not use the word "Spearheaded"
-3. Preserve:
-   - All factual information (dates, companies, job titles, education, certifications)
-   - The overall structure and format
-   - Professional tone
-   - References section exactly as provided (do not modify contact information)
-4. Skills must be a flat array of strings, not categorized (e.g., ["Python", "AWS", "Docker"])
-5. Include certifications if present in the original resume
-6. Language quality: Vary action verbs across bullet points. Avoid filler words and repetitive phrasing. Each achievement should read distinctly.
+""" + OPTIMIZE_RULES
 
-Return the optimized resume as a JSON object with the same structure as the input.
-Return ONLY valid JSON, no markdown formatting or explanation."""
 
+ANALYZE_JOB_PROMPT = """You are a recruiting analyst. Analyze this job posting so the analysis can be reused to tailor many resumes.
+
+Job Posting:
+{job_description}
+
+Return a JSON object with:
+- title: Target job title using standard abbreviations (e.g., "ML Engineer", "Software Developer")
+- seniority: One of "intern", "junior", "mid", "senior", "lead", "principal", "executive", or "" if unclear
+- required_skills: Array of must-have skills and technologies as short names, most important first (e.g., ["Python", "Kubernetes"])
+- preferred_skills: Array of nice-to-have skills and technologies as short names
+- keywords: Array of at most 20 other terms a screener would look for (domains, methodologies, certifications)
+- responsibilities: Array of at most 6 short phrases summarizing the main duties
+
+Return ONLY valid JSON, no markdown formatting or explanation."""
 
-TRANSLATE_RESUME_PROMPT = """Translate this resume to {target_language}. Maintain the exact JSON structure and all field names in English. Only translate the content values.
+OPTIMIZE_ANALYZED_RESUME_PROMPT = """You are an expert resume optimizer. Your task is to fine-tune a resume for a specific job while preserving the original style, structure, and truthfulness.
 
-Resume (JSON):
+Original Resume (JSON):
 {resume_json}
 
+Job Analysis (JSON):
+{job_analysis}
+
+Resume skills found in the job, most relevant first (JSON):
+{ranked_skills}
+
+Instructions:
+1. Target the title, seniority, required skills, keywords and responsibilities from the job analysis
+2. Enhance the resume by:
+   - Updating professional_title to match the target job title using standard abbreviations
+   - Reordering skills to put the ranked skills above first, then other job-relevant ones (skills should be a flat array of strings)
+   - Incorporating required skills and keywords naturally where the experience supports them
+""" + OPTIMIZE_RULES
+
+
+TRANSLATE_STRINGS_PROMPT = """Translate each resume text in this JSON array to {target_language}.
+
+Texts (JSON):
+{strings_json}
+
 Rules:
-- Keep all JSON keys in English (name, contact, experience, etc.)
 - Translate all text content to professional {target_language}
 - Preserve dates, company names, and proper nouns
 - Maintain technical terms that are commonly used in English (e.g., "Python", "AWS")
-- Keep professional_title and job titles in English (e.g., "ML Engineer", "AI Engineer", "Data Scientist", "Software Engineer", "DevOps Engineer")
-- Keep education degree names in English (e.g., "MSc in data science", "Bachelor of Computer Science", "Master in Management")
+- Keep job titles and education degree names in English (e.g., "ML Engineer", "MSc in data science")
+
+Return a JSON object of the form {{"translations": [...]}} with exactly one translated string per input text, in the same order.
+Return ONLY valid JSON, no markdown formatting or explanation."""
+
+
+OPTIMIZE_SECTION_PROMPT = """You are an expert resume optimizer. Your task is to fine-tune one section of a resume for a specific job description while preserving the original style and truthfulness.
+
+Section: {section_path}
+
+Current value (JSON):
+{section_json}
+
+Context (JSON):
+{context_json}
+
+Job Description:
+{job_description}
+
+Instructions:
+{section_instructions}
+- Incorporate relevant keywords from the job description naturally where appropriate
+- Never fabricate experience, metrics, employers, dates or qualifications
+- Do not use the word "Spearheaded"
+
+Return a JSON object of the form {{"value": <optimized section value>}}, where the value has the same type as the current value.
+Return ONLY valid JSON, no markdown formatting or explanation."""
+
+SECTION_INSTRUCTIONS = {
+    "professional_title": """- Update the professional title to match the target job role using standard abbreviations (e.g., "ML Engineer" for machine learning roles, "AI Engineer" for artificial intelligence roles)
+- Return a single short string""",
+    "summary": """- Rewrite the profile summary to emphasize experience relevant to the job description
+- Keep a professional tone and roughly the same length""",
+    "skills": """- Reorder skills to prioritize job-relevant ones first
+- Skills must be a flat array of strings, not categorized (e.g., ["Python", "AWS", "Docker"])
+- Only add skills that are clearly supported by the context""",
+    "bullets": """- Adjust the bullet points to emphasize experience relevant to the job description
+- Keep each bullet point to maximum 2 lines: preserve technical keywords and metrics, remove filler phrases
+- Strengthen action verbs and quantifiable achievements
+- Vary action verbs across bullet points; avoid words like "demonstrating", "showcasing", "leveraging", "utilizing"
+- Return an array of strings""",
+}
+
+REPAIR_JSON_PROMPT = """Your previous response could not be used:
+{errors}
 
+Return the complete corrected JSON object, keeping all content from your previous response.
 Return ONLY valid JSON, no markdown formatting or explanation."""
@@ -0,0 +1,234 @@
+"""Parsing, local repair and schema validation of LLM JSON responses."""
+
+import itertools
+import json
+import re
+
+# Expected type of each string field in list entries, per resume section
+ENTRY_FIELDS = {
+    "experience": ("company", "title", "dates", "location", "type"),
+    "education": ("institution", "degree", "field", "location", "dates", "gpa"),
+    "projects": ("name", "description"),
+    "certifications": ("name", "issuer", "date"),
+    "references": ("name", "title", "company", "contact"),
+}
+STRING_FIELDS = ("name", "professional_title", "summary")
+
+
+class TruncatedJSONError(json.JSONDecodeError):
+    """Output ends before its JSON value is complete, e.g. cut off at the token limit."""
+
+
+def strip_code_fences(content: str) -> str:
+    """Remove a surrounding markdown code block and any text outside the JSON value."""
+    content = content.strip()
+
+    # Handle potential markdown code blocks
+    if content.startswith("```"):
+        content = content.split("```")[1]
+        if content.startswith("json"):
+            content = content[4:]
+        content = content.strip()
+
+    start = min((i for i in (content.find("{"), content.find("[")) if i >= 0), default=0)
+    return content[start:]
+
+
+def repair_json(text: str, allow_truncated: bool = True) -> str:
+    """
+    Fix common defects in model-generated JSON.
+
+    Removes trailing commas and text after the top-level value, closes an
+    unterminated string and any open brackets and braces, and, when the
+    output was truncated mid-element, drops the incomplete last element.
+
+    Args:
+        text: JSON text, without code fences.
+        allow_truncated: Set to False to reject truncated output instead of
+            closing it, since that silently loses its last elements.
+
+    Raises:
+        TruncatedJSONError: If the output is truncated and allow_truncated
+            is False.
+    """
+    text = re.sub(r",(\s*[}\]])", r"\1", text.strip())
+
+    stack = []
+    cuts = []  # (end index, closers needed) at each point where a prefix is complete
+    in_string = False
+    escape = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+            cuts.append((i + 1, "".join(reversed(stack))))
+        elif ch in "}]":
+            if stack:
+                stack.pop()
+            if not stack:
+                # Ignore anything after the top-level value closes
+                return text[:i + 1]
+            cuts.append((i + 1, "".join(reversed(stack))))
+        elif ch == ",":
+            cuts.append((i, "".join(reversed(stack))))
+
+    if (stack or in_string) and not allow_truncated:
+        raise TruncatedJSONError("Output ends before the JSON value is complete", text, len(text))
+    closed = text + ('"' if in_string else "") + "".join(reversed(stack))
+    # Build shorter candidates lazily; usually the first or second one parses
+    candidates = (text[:end] + closers for end, closers in reversed(cuts))
+    for candidate in itertools.chain((closed,), candidates):
+        try:
+            json.loads(candidate)
+            return candidate
+        except json.JSONDecodeError:
+            continue
+    return closed
+
+
+def parse_json_response(content: str, allow_truncated: bool = True):
+    """
+    Parse a model response as JSON, repairing it locally if needed.
+
+    Args:
+        content: Model output.
+        allow_truncated: Set to False to reject truncated output rather than
+            drop its incomplete tail (see repair_json).
+
+    Raises:
+        json.JSONDecodeError: If the response cannot be parsed even after
+            repair (TruncatedJSONError if it is truncated and
+            allow_truncated is False).
+    """
+    text = strip_code_fences(content)
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return json.loads(repair_json(text, allow_truncated))
+
+
+def coerce_resume(data: dict) -> dict:
+    """Fix trivial type mismatches in place: null fields, bare-string bullets and skills."""
+    for key in [key for key, value in data.items() if value is None]:
+        del data[key]
+
+    if isinstance(data.get("skills"), str):
+        data["skills"] = [s.strip() for s in data["skills"].split(",") if s.strip()]
+
+    for section in ("experience", "projects"):
+        for entry in data.get(section) or []:
+            if isinstance(entry, dict) and isinstance(entry.get("bullets"), str):
+                entry["bullets"] = [entry["bullets"]]
+    return data
+
+
+def validate_resume(data) -> list:
+    """
+    Check a resume dictionary against what ResumePDF.add_* methods expect.
+
+    Fields are optional, but present fields must have the right types.
+
+    Returns:
+        List of human-readable problems (empty when valid).
+    """
+    if not isinstance(data, dict):
+        return ["top-level value must be a JSON object"]
+
+    errors = []
+    for key in STRING_FIELDS:
+        if key in data and not isinstance(data[key], str):
+            errors.append(f"{key} must be a string")
+
+    contact = data.get("contact", {})
+    if not isinstance(contact, dict):
+        errors.append("contact must be an object")
+    elif any(not isinstance(value, str) for value in contact.values()):
+        errors.append("contact values must be strings")
+
+    skills = data.get("skills", [])
+    if isinstance(skills, list):
+        if any(not isinstance(skill, str) for skill in skills):
+            errors.append("skills must be a list of strings")
+    elif not isinstance(skills, dict):
+        errors.append("skills must be a list of strings")
+
+    for section, fields in ENTRY_FIELDS.items():
+        entries = data.get(section, [])
+        if not isinstance(entries, list):
+            errors.append(f"{section} must be an array")
+            continue
+        for index, entry in enumerate(entries):
+            if not isinstance(entry, dict):
+                errors.append(f"{section}[{index}] must be an object")
+                continue
+            for field in fields:
+                if field in entry and not isinstance(entry[field], (str, int, float)):
+                    errors.append(f"{section}[{index}].{field} must be a string")
+            bullets = entry.get("bullets", [])
+            if not isinstance(bullets, list) or any(not isinstance(b, str) for b in bullets):
+                errors.append(f"{section}[{index}].bullets must be a list of strings")
+
+    return errors
+
+
+# Sections whose value is a list of strings; every other kind is a single string
+LIST_SECTION_KINDS = ("skills", "bullets")
+
+
+def validate_section_value(data, kind: str) -> list:
+    """
+    Check a section-scoped response of the form {"value": ...}.
+
+    Args:
+        data: Parsed model output.
+        kind: Section kind from sections.section_kind, e.g. "summary" or "bullets".
+
+    Returns:
+        List of human-readable problems (empty when valid).
+    """
+    if not isinstance(data, dict) or "value" not in data:
+        return ['response must be a JSON object with a "value" key']
+    value = data["value"]
+    if kind in LIST_SECTION_KINDS:
+        if not isinstance(value, list) or any(not isinstance(item, str) for item in value):
+            return [f"value must be a list of strings for {kind}"]
+    elif not isinstance(value, str):
+        return [f"value must be a string for {kind}"]
+    return []
+
+
+def validate_job_analysis(data) -> list:
+    """Check a job analysis response against the fields ANALYZE_JOB_PROMPT asks for."""
+    if not isinstance(data, dict):
+        return ["top-level value must be a JSON object"]
+
+    errors = []
+    for key in ("title", "seniority"):
+        if not isinstance(data.get(key, ""), str):
+            errors.append(f"{key} must be a string")
+    for key in ("required_skills", "preferred_skills", "keywords", "responsibilities"):
+        value = data.get(key, [])
+        if not isinstance(value, list) or any(not isinstance(item, str) for item in value):
+            errors.append(f"{key} must be a list of strings")
+    return errors
+
+
+def validate_translations(data, count: int) -> list:
+    """Check a batch translation response of the form {"translations": [...]}."""
+    if not isinstance(data, dict) or not isinstance(data.get("translations"), list):
+        return ['response must be a JSON object with a "translations" array']
+    translations = data["translations"]
+    if len(translations) != count:
+        return [f"expected {count} translations, got {len(translations)}"]
+    if any(not isinstance(text, str) for text in translations):
+        return ["translations must be strings"]
+    return []
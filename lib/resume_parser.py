@@ -0,0 +1,450 @@
+"""Rule-based, layout-aware resume parser with LLM fallback."""
+
+import re
+from collections import Counter
+from io import BytesIO
+
+import pdfplumber
+
+from .groq_client import structure_resume
+from .pdf_parser import extract_text_from_pdf, read_pdf_bytes
+
+# Documents scoring below this are sent to the LLM instead
+DEFAULT_MIN_CONFIDENCE = 0.75
+
+# Normalized heading text -> schema section ("other" sections are recognized but dropped)
+SECTION_HEADINGS = {
+    "summary": ("summary", "profile", "professional summary", "professional profile",
+                "about me", "about", "objective", "career objective", "career summary"),
+    "experience": ("experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "career history", "relevant experience"),
+    "education": ("education", "academic background", "education and training",
+                  "education & training", "academic qualifications"),
+    "skills": ("skills", "technical skills", "core skills", "key skills", "competencies",
+               "core competencies", "technologies", "skills & tools", "tech stack"),
+    "projects": ("projects", "personal projects", "key projects", "selected projects",
+                 "academic projects"),
+    "certifications": ("certifications", "certification", "certificates",
+                       "licenses & certifications", "licenses and certifications"),
+    "references": ("references", "referees"),
+    "other": ("languages", "interests", "hobbies", "publications", "awards",
+              "volunteering", "volunteer experience", "achievements"),
+}
+_HEADING_LOOKUP = {text: section for section, texts in SECTION_HEADINGS.items() for text in texts}
+
+BULLET_CHARS = "-•▪▫◦●○*–—·►■"
+BOLD_FONT = re.compile(r"bold|black|heavy|semibold|demi", re.IGNORECASE)
+
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE = rf"(?:{_MONTH}\s+)?(?:19|20)\d{{2}}|\d{{1,2}}/(?:19|20)\d{{2}}"
+DATE_RANGE = re.compile(
+    rf"(?:{_DATE})(?:\s*(?:-|–|—|to)\s*(?:{_DATE}|present|current|now|today))?",
+    re.IGNORECASE,
+)
+EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE = re.compile(r"\+?\d[\d\s().-]{7,}\d")
+LINKEDIN = re.compile(r"(?:https?://)?(?:www\.)?linkedin\.com/\S+", re.IGNORECASE)
+GITHUB = re.compile(r"(?:https?://)?(?:www\.)?github\.com/\S+", re.IGNORECASE)
+URL = re.compile(
+    r"(?:https?://)?(?:www\.)?[\w-]+\.(?:com|io|dev|me|net|org|ai)(?:/\S*)?", re.IGNORECASE
+)
+WORK_TYPES = ("remote", "hybrid", "on-site", "onsite", "full-time", "part-time", "contract",
+              "freelance", "internship")
+FIELD_SEPARATORS = re.compile(r"\s+[|•·]\s+|\s+[-–—]\s+")
+DEGREE = re.compile(
+    r"\b(?:bachelor|master|phd|doctorate|mba|diploma|degree|licence"
+    r"|b\.?sc|m\.?sc|b\.?s|m\.?s|b\.?a|m\.?a|b\.?eng|m\.?eng)\b",
+    re.IGNORECASE,
+)
+
+
+def _read_lines(pdf_bytes: bytes) -> list:
+    """Group the words of every page into lines annotated with font size and weight."""
+    lines = []
+    with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+        for page_number, page in enumerate(pdf.pages):
+            words = page.extract_words(extra_attrs=["fontname", "size"])
+            words.sort(key=lambda w: (round(w["top"]), w["x0"]))
+            current = []
+            for word in words:
+                if current and abs(word["top"] - current[0]["top"]) > 2:
+                    lines.append(_make_line(current, page_number))
+                    current = []
+                current.append(word)
+            if current:
+                lines.append(_make_line(current, page_number))
+    return lines
+
+
+def _make_line(words: list, page_number: int) -> dict:
+    words = sorted(words, key=lambda w: w["x0"])
+    bold = [bool(BOLD_FONT.search(w["fontname"])) for w in words]
+    lead = 0
+    while lead < len(words) and bold[lead]:
+        lead += 1
+    return {
+        "text": " ".join(w["text"] for w in words),
+        "bold_text": " ".join(w["text"] for w in words[:lead]),
+        "rest_text": " ".join(w["text"] for w in words[lead:]),
+        "bold": all(bold),
+        "size": max(w["size"] for w in words),
+        "x0": words[0]["x0"],
+        "page": page_number,
+        "chars": sum(len(w["text"]) for w in words),
+    }
+
+
+def _heading_section(line: dict) -> str | None:
+    """Return the schema section a line is a heading for, if it is one."""
+    text = line["text"]
+    if len(text.split()) > 5 or text[:1] in BULLET_CHARS:
+        return None
+    normalized = re.sub(r"[^a-z& ]", "", text.lower()).strip()
+    normalized = re.sub(r"\s+", " ", normalized)
+    section = _HEADING_LOOKUP.get(normalized)
+    if section and (line["bold"] or text.isupper() or line["size"] > line.get("body_size", 0)):
+        return section
+    return None
+
+
+def _is_bullet(text: str) -> bool:
+    return text[:1] in BULLET_CHARS and len(text) > 1 and (text[1] == " " or text[0] not in "-*")
+
+
+def _strip_bullet(text: str) -> str:
+    return text.lstrip(BULLET_CHARS).strip()
+
+
+def _split_fields(text: str) -> list:
+    return [part.strip() for part in FIELD_SEPARATORS.split(text) if part.strip()]
+
+
+def _take_dates(text: str) -> tuple:
+    """Remove the last date range from text, returning (remaining_text, dates)."""
+    matches = list(DATE_RANGE.finditer(text))
+    if not matches:
+        return text, ""
+    match = matches[-1]
+    remaining = (text[:match.start()] + text[match.end():]).strip(" |,-–—·•")
+    return remaining.strip(), match.group(0).strip()
+
+
+def _parse_header(lines: list) -> tuple:
+    """Extract name, professional title and contact details from the header block."""
+    name = ""
+    title = ""
+    contact = {}
+    if not lines:
+        return name, title, contact
+
+    name_line = max(lines[:3], key=lambda line: line["size"])
+    name = name_line["text"].title() if name_line["text"].isupper() else name_line["text"]
+
+    for line in lines:
+        if line is name_line:
+            continue
+        for part in re.split(r"\s*[|•·]\s*", line["text"]):
+            part = part.strip()
+            if not part:
+                continue
+            if EMAIL.fullmatch(part) and "email" not in contact:
+                contact["email"] = part
+            elif LINKEDIN.search(part) and "linkedin" not in contact:
+                contact["linkedin"] = part
+            elif GITHUB.search(part) and "github" not in contact:
+                contact["github"] = part
+            elif PHONE.fullmatch(part) and "phone" not in contact:
+                contact["phone"] = part
+            elif URL.fullmatch(part) and "website" not in contact:
+                contact["website"] = part
+            elif "," in part and "location" not in contact:
+                contact["location"] = part
+            elif not title:
+                title = part
+    return name, title, contact
+
+
+def _group_entries(lines: list) -> list:
+    """
+    Split section lines into entries of (header_lines, bullet_texts).
+
+    A non-bullet line starts a new entry once the current entry has bullets;
+    indented plain lines continue the previous bullet.
+    """
+    entries = []
+    header, bullets = [], []
+    bullet_x = None
+
+    for line in lines:
+        text = line["text"]
+        if _is_bullet(text) and not line["bold"]:
+            bullets.append(_strip_bullet(text))
+            bullet_x = line["x0"]
+        elif bullets and bullet_x is not None and line["x0"] > bullet_x + 2 and not line["bold"]:
+            bullets[-1] += " " + text
+        elif bullets and not line["bold"] and not DATE_RANGE.search(text) and len(header) < 3:
+            bullets[-1] += " " + text
+        else:
+            if bullets or (header and line["bold"] and header[-1]["bold"] and len(header) >= 2):
+                entries.append((header, bullets))
+                header, bullets, bullet_x = [], [], None
+            header.append(line)
+
+    if header or bullets:
+        entries.append((header, bullets))
+    return entries
+
+
+def _parse_experience(lines: list) -> list:
+    experiences = []
+    for header, bullets in _group_entries(lines):
+        if not header:
+            continue
+        entry = {
+            "title": "", "company": "", "dates": "", "location": "", "type": "", "bullets": bullets
+        }
+        texts = []
+        for line in header:
+            text, dates = _take_dates(line["text"])
+            if dates and not entry["dates"]:
+                entry["dates"] = dates
+            if text:
+                texts.append(text)
+
+        if texts:
+            entry["title"] = texts[0]
+        fields = [f for text in texts[1:] for f in _split_fields(text)]
+        if len(texts) == 1 and " at " in texts[0]:
+            entry["title"], company = texts[0].split(" at ", 1)
+            fields.insert(0, company)
+        for field in fields:
+            if field.lower() in WORK_TYPES and not entry["type"]:
+                entry["type"] = field
+            elif not entry["company"]:
+                entry["company"] = field
+            elif not entry["location"]:
+                entry["location"] = field
+        experiences.append({key: value for key, value in entry.items() if value or key == "bullets"})
+    return experiences
+
+
+def _parse_projects(lines: list) -> list:
+    projects = []
+    for header, bullets in _group_entries(lines):
+        if not header:
+            continue
+        project = {"name": header[0]["text"], "bullets": bullets}
+        details = [line["text"] for line in header[1:]]
+        if details:
+            techs = [t.strip() for t in details[0].split(",") if t.strip()]
+            if len(techs) > 1:
+                project["technologies"] = techs
+                details = details[1:]
+        if details:
+            project["description"] = " ".join(details)
+        projects.append(project)
+    return projects
+
+
+def _parse_education(lines: list) -> list:
+    education = []
+    for line in lines:
+        bullet = _is_bullet(line["text"])
+        text = _strip_bullet(line["text"]) if bullet else line["text"]
+        starts_entry = bullet or line["bold_text"] or not education or DEGREE.search(text)
+        if not starts_entry:
+            _fill_education(education[-1], text)
+            continue
+
+        if line["bold_text"]:
+            degree_text = _strip_bullet(line["bold_text"])
+            rest = line["rest_text"].strip(" -–—|")
+        else:
+            # Plain "Degree, Institution, Location, Dates" line
+            text, dates = _take_dates(text)
+            parts = [part.strip() for part in re.split(r",\s*|\s+[|•·]\s+", text) if part.strip()]
+            degree_text = parts[0] if parts else text
+            rest = " | ".join(parts[1:] + ([dates] if dates else []))
+
+        entry = {}
+        match = re.match(r"(.*?)\s*\((.*)\)\s*$", degree_text)
+        if match:
+            entry["degree"], entry["field"] = match.group(1), match.group(2)
+        else:
+            entry["degree"] = degree_text
+        education.append(entry)
+        if rest:
+            _fill_education(entry, rest)
+    return education
+
+
+def _fill_education(entry: dict, text: str) -> None:
+    """Add institution, location and dates found in text to an education entry."""
+    text, dates = _take_dates(text)
+    if dates and "dates" not in entry:
+        entry["dates"] = dates
+    for field in _split_fields(text):
+        if "institution" not in entry:
+            entry["institution"] = field
+        elif "location" not in entry:
+            entry["location"] = field
+
+
+def _parse_skills(lines: list) -> list:
+    skills = []
+    for line in lines:
+        text = _strip_bullet(line["text"])
+        for skill in re.split(r"\s*[,;|•·]\s*", text):
+            # Drop category labels such as "Languages: Python"
+            skill = re.sub(r"^[^:]{1,30}:\s*", "", skill).strip(" .")
+            if skill and skill not in skills:
+                skills.append(skill)
+    return skills
+
+
+def _parse_certifications(lines: list) -> list:
+    certifications = []
+    for line in lines:
+        text, date = _take_dates(_strip_bullet(line["text"]))
+        parts = _split_fields(text)
+        if not parts:
+            continue
+        cert = {"name": parts[0]}
+        if len(parts) > 1:
+            cert["issuer"] = parts[1]
+        if date:
+            cert["date"] = date
+        certifications.append(cert)
+    return certifications
+
+
+def _parse_references(lines: list) -> list:
+    references = []
+    for line in lines:
+        text = _strip_bullet(line["text"])
+        if "request" in text.lower():
+            continue
+        text, _, contact = text.partition(" - ")
+        name, _, title = text.partition(", ")
+        title, _, company = title.partition(" at ")
+        reference = {"name": name.strip(), "title": title.strip(), "company": company.strip()}
+        if contact:
+            reference["contact"] = contact.strip()
+        references.append({key: value for key, value in reference.items() if value})
+    return references
+
+
+def _score(resume: dict, unassigned_chars: int, total_chars: int) -> float:
+    """Heuristic confidence that the parse captured the document faithfully."""
+    experiences = resume.get("experience", [])
+    complete = [e for e in experiences if e.get("title") and e.get("dates") and e.get("bullets")]
+
+    score = 0.0
+    score += 0.15 if resume.get("name") else 0.0
+    contact = resume.get("contact", {})
+    score += 0.15 if contact.get("email") or contact.get("phone") else 0.0
+    score += 0.30 * (len(complete) / len(experiences)) if experiences else 0.0
+    score += 0.15 if resume.get("education") else 0.0
+    score += 0.15 if resume.get("skills") else 0.0
+    score += 0.10 if resume.get("summary") else 0.0
+
+    # Penalize text that landed outside every recognized section
+    if total_chars:
+        score *= 1 - min(1.0, 2 * unassigned_chars / total_chars)
+    return round(score, 3)
+
+
+def parse_resume_layout(pdf_file) -> tuple:
+    """
+    Parse a resume PDF into the structure_resume schema without an LLM.
+
+    Sections are found from heading lines (bold, upper-case or larger than
+    body text), and entries from bold headers, bullets and date ranges.
+
+    Args:
+        pdf_file: A file-like object or path containing the PDF data.
+
+    Returns:
+        (resume, confidence) where confidence is between 0 and 1.
+    """
+    lines = _read_lines(read_pdf_bytes(pdf_file))
+    if not lines:
+        return {}, 0.0
+
+    sizes = Counter()
+    for line in lines:
+        sizes[round(line["size"], 1)] += line["chars"]
+    body_size = sizes.most_common(1)[0][0]
+    for line in lines:
+        line["body_size"] = body_size
+
+    header_lines = []
+    sections = {}
+    current = None
+    unassigned_chars = 0
+    for line in lines:
+        section = _heading_section(line)
+        if section:
+            current = section
+            sections.setdefault(section, [])
+        elif current is None:
+            header_lines.append(line)
+        else:
+            sections[current].append(line)
+
+    # Header lines beyond the first few are probably body text we failed to section
+    if len(header_lines) > 4:
+        unassigned_chars += sum(line["chars"] for line in header_lines[4:])
+        header_lines = header_lines[:4]
+
+    name, title, contact = _parse_header(header_lines)
+    resume = {"name": name}
+    if title:
+        resume["professional_title"] = title
+    resume["contact"] = contact
+
+    if sections.get("summary"):
+        resume["summary"] = " ".join(line["text"] for line in sections["summary"])
+    if sections.get("experience"):
+        resume["experience"] = _parse_experience(sections["experience"])
+    if sections.get("education"):
+        resume["education"] = _parse_education(sections["education"])
+    if sections.get("skills"):
+        resume["skills"] = _parse_skills(sections["skills"])
+    if sections.get("projects"):
+        resume["projects"] = _parse_projects(sections["projects"])
+    if sections.get("certifications"):
+        resume["certifications"] = _parse_certifications(sections["certifications"])
+    if "references" in sections:
+        resume["references"] = _parse_references(sections["references"])
+
+    total_chars = sum(line["chars"] for line in lines)
+    return resume, _score(resume, unassigned_chars, total_chars)
+
+
+def structure_resume_pdf(
+    pdf_file,
+    resume_text: str | None = None,
+    min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+    use_cache: bool = True,
+) -> tuple:
+    """
+    Structure a resume PDF, using the local parser when it is confident.
+
+    Args:
+        pdf_file: A file-like object or path containing the PDF data.
+        resume_text: Already extracted text, reused for the LLM fallback.
+        min_confidence: Minimum local parser confidence to skip the LLM.
+        use_cache: Set to False to bypass the LLM result cache.
+
+    Returns:
+        (resume, method) where method is "local" or "llm".
+    """
+    pdf_bytes = read_pdf_bytes(pdf_file)
+    resume, confidence = parse_resume_layout(pdf_bytes)
+    if confidence >= min_confidence:
+        return resume, "local"
+
+    if resume_text is None:
+        resume_text = extract_text_from_pdf(BytesIO(pdf_bytes), fast=True)
+    return structure_resume(resume_text, use_cache=use_cache), "llm"
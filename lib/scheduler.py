@@ -0,0 +1,269 @@
+"""Rate-limit-aware scheduling, retries and backoff for LLM requests."""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from collections import deque
+
+import groq
+
+from .metrics import increment, span
+
+# Characters per token used for rough prompt size estimates
+CHARS_PER_TOKEN = 4
+
+# HTTP status codes worth retrying
+RETRYABLE_STATUS_CODES = (408, 409, 429, 500, 502, 503, 504)
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the number of tokens in a piece of text."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _retry_after(error: Exception) -> float | None:
+    """Read the server-requested delay from a retry-after header, if any."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+
+    headers = response.headers
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except ValueError:
+        return None
+    return None
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Return True for rate limits, server errors, connection failures and retryable errors."""
+    if getattr(error, "retryable", False):
+        return True
+    if isinstance(error, (groq.APIConnectionError, groq.APITimeoutError)):
+        return True
+    if isinstance(error, groq.APIStatusError):
+        return error.status_code in RETRYABLE_STATUS_CODES
+    return False
+
+
+class RequestScheduler:
+    """
+    Keep LLM calls inside requests-per-minute and tokens-per-minute budgets.
+
+    Each call reserves one request and an estimated token count (prompt plus
+    max_tokens) in a sliding one-minute window. Calls that would exceed either
+    budget wait until enough of the window has expired. Retryable failures are
+    retried with jittered exponential backoff, honoring retry-after headers.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = 30,
+        tokens_per_minute: int = 12000,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        window: float = 60.0,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.window = window
+
+        self._lock = threading.Lock()
+        self._reservations = deque()  # [timestamp, tokens] pairs
+        self._queue_depth = 0
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _reserve(self, tokens: int) -> tuple:
+        """
+        Try to reserve budget for one request.
+
+        Returns:
+            (reservation, delay). reservation is set when budget was reserved;
+            otherwise delay is the number of seconds to wait before retrying.
+        """
+        now = time.monotonic()
+        with self._lock:
+            while self._reservations and now - self._reservations[0][0] >= self.window:
+                self._reservations.popleft()
+
+            if len(self._reservations) >= self.requests_per_minute:
+                return None, self._reservations[0][0] + self.window - now
+
+            used = sum(entry[1] for entry in self._reservations)
+            if self._reservations and used + tokens > self.tokens_per_minute:
+                # Wait until enough earlier reservations fall out of the window
+                freed = 0
+                for timestamp, reserved in self._reservations:
+                    freed += reserved
+                    if used - freed + tokens <= self.tokens_per_minute:
+                        return None, timestamp + self.window - now
+                return None, self._reservations[-1][0] + self.window - now
+
+            reservation = [now, tokens]
+            self._reservations.append(reservation)
+            return reservation, 0.0
+
+    def settle(self, reservation: list, actual_tokens: int) -> None:
+        """Replace a reservation's token estimate with the actual usage."""
+        with self._lock:
+            reservation[1] = actual_tokens
+
+    def _record_wait(self, waited: float) -> None:
+        with self._lock:
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def acquire(self, tokens: int) -> list:
+        """Block until budget is available, then return the reservation."""
+        start = time.monotonic()
+        with self._lock:
+            self._queue_depth += 1
+        try:
+            while True:
+                reservation, delay = self._reserve(tokens)
+                if reservation is not None:
+                    break
+                time.sleep(delay)
+        finally:
+            with self._lock:
+                self._queue_depth -= 1
+        self._record_wait(time.monotonic() - start)
+        return reservation
+
+    async def aacquire(self, tokens: int) -> list:
+        """Async counterpart of acquire that sleeps without blocking the loop."""
+        start = time.monotonic()
+        with self._lock:
+            self._queue_depth += 1
+        try:
+            while True:
+                reservation, delay = self._reserve(tokens)
+                if reservation is not None:
+                    break
+                await asyncio.sleep(delay)
+        finally:
+            with self._lock:
+                self._queue_depth -= 1
+        self._record_wait(time.monotonic() - start)
+        return reservation
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """Delay before the next attempt: retry-after if given, else full jitter."""
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return retry_after + random.uniform(0, self.base_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def _should_retry(self, attempt: int, error: Exception) -> bool:
+        with self._lock:
+            retry = attempt < self.max_retries and _is_retryable(error)
+            if retry:
+                self.retries += 1
+            else:
+                self.failures += 1
+        increment("llm_retries_total" if retry else "llm_failures_total")
+        return retry
+
+    def call(self, fn, tokens: int):
+        """
+        Run fn() within the rate budgets, retrying transient failures.
+
+        Args:
+            fn: Zero-argument callable that performs the API request.
+            tokens: Estimated tokens the request will consume.
+
+        Returns:
+            Whatever fn returns.
+        """
+        attempt = 0
+        while True:
+            with span("llm.queue"):
+                reservation = self.acquire(tokens)
+            with self._lock:
+                self.requests += 1
+            increment("llm_requests_total")
+            try:
+                with span("llm.generate", attempt=attempt):
+                    response = fn()
+            except Exception as e:
+                if not self._should_retry(attempt, e):
+                    raise
+                time.sleep(self._backoff(attempt, e))
+                attempt += 1
+                continue
+            self._settle_usage(reservation, response)
+            return response
+
+    async def acall(self, fn, tokens: int):
+        """Async counterpart of call; fn returns an awaitable."""
+        attempt = 0
+        while True:
+            with span("llm.queue"):
+                reservation = await self.aacquire(tokens)
+            with self._lock:
+                self.requests += 1
+            increment("llm_requests_total")
+            try:
+                with span("llm.generate", attempt=attempt):
+                    response = await fn()
+            except Exception as e:
+                if not self._should_retry(attempt, e):
+                    raise
+                await asyncio.sleep(self._backoff(attempt, e))
+                attempt += 1
+                continue
+            self._settle_usage(reservation, response)
+            return response
+
+    def _settle_usage(self, reservation: list, response) -> None:
+        """Use reported token usage, when the response has it, for the budget."""
+        usage = getattr(response, "usage", None)
+        total = getattr(usage, "total_tokens", None)
+        if isinstance(total, int):
+            self.settle(reservation, total)
+
+    def metrics(self) -> dict:
+        """Return queue depth, wait time, retry counters and current window usage."""
+        now = time.monotonic()
+        with self._lock:
+            window = [entry for entry in self._reservations if now - entry[0] < self.window]
+            return {
+                "queue_depth": self._queue_depth,
+                "requests": self.requests,
+                "retries": self.retries,
+                "failures": self.failures,
+                "total_wait_seconds": round(self.total_wait_seconds, 3),
+                "max_wait_seconds": round(self.max_wait_seconds, 3),
+                "window_requests": len(window),
+                "window_tokens": sum(entry[1] for entry in window),
+            }
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> RequestScheduler:
+    """Get the process-wide scheduler, configured from GROQ_* environment variables."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = RequestScheduler(
+                requests_per_minute=int(os.getenv("GROQ_REQUESTS_PER_MINUTE", "30")),
+                tokens_per_minute=int(os.getenv("GROQ_TOKENS_PER_MINUTE", "12000")),
+                max_retries=int(os.getenv("GROQ_MAX_RETRIES", "5")),
+            )
+        return _scheduler
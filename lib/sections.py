@@ -0,0 +1,127 @@
+"""Addressing and patching individual resume sections by path."""
+
+import copy
+import re
+
+# Top-level sections that can be optimized on their own
+SCALAR_SECTIONS = ("professional_title", "summary", "skills")
+
+# Lists whose entries have individually optimizable bullets
+BULLET_SECTIONS = ("experience", "projects")
+
+_PATH_PART = re.compile(r"([A-Za-z_]+)(?:\[(\d+)\])?")
+
+
+def parse_path(path: str) -> list:
+    """
+    Split a section path such as "experience[2].bullets" into keys and indices.
+
+    Args:
+        path: Dotted section path with optional [index] suffixes.
+
+    Returns:
+        List of dictionary keys (str) and list indices (int).
+    """
+    parts = []
+    for token in path.split("."):
+        match = _PATH_PART.fullmatch(token)
+        if not match:
+            raise ValueError(f"Invalid section path: {path}")
+        parts.append(match.group(1))
+        if match.group(2) is not None:
+            parts.append(int(match.group(2)))
+    return parts
+
+
+def get_section(resume: dict, path: str):
+    """Return the value stored at a section path."""
+    value = resume
+    for part in parse_path(path):
+        value = value[part]
+    return value
+
+
+def set_section(resume: dict, path: str, value) -> None:
+    """Replace the value stored at a section path, in place."""
+    parts = parse_path(path)
+    target = resume
+    for part in parts[:-1]:
+        target = target[part]
+    target[parts[-1]] = value
+
+
+def section_kind(path: str) -> str:
+    """
+    Return the kind of section a path points to (e.g. "summary" or "bullets").
+
+    Raises:
+        ValueError: If the path is not an independently optimizable section.
+    """
+    parts = parse_path(path)
+    if len(parts) == 1 and parts[0] in SCALAR_SECTIONS:
+        return parts[0]
+    if (
+        len(parts) == 3
+        and parts[0] in BULLET_SECTIONS
+        and isinstance(parts[1], int)
+        and parts[2] == "bullets"
+    ):
+        return "bullets"
+    allowed = ", ".join(SCALAR_SECTIONS + tuple(f"{name}[N].bullets" for name in BULLET_SECTIONS))
+    raise ValueError(f"Cannot optimize section {path!r}; expected one of {allowed}")
+
+
+def default_section_paths(resume: dict) -> list:
+    """
+    List every independently optimizable section present in a resume.
+
+    Returns:
+        Paths such as "summary", "skills" and "experience[0].bullets".
+    """
+    paths = [name for name in SCALAR_SECTIONS if resume.get(name)]
+    for name in BULLET_SECTIONS:
+        for index, entry in enumerate(resume.get(name) or []):
+            if isinstance(entry, dict) and entry.get("bullets"):
+                paths.append(f"{name}[{index}].bullets")
+    return paths
+
+
+def section_context(resume: dict, path: str) -> dict:
+    """
+    Build the minimal context the model needs to rewrite one section.
+
+    Bullets get the header fields of their entry; top-level sections get the
+    candidate's title and the headers of their roles.
+    """
+    parts = parse_path(path)
+    if len(parts) >= 3:
+        entry = resume[parts[0]][parts[1]]
+        return {key: value for key, value in entry.items() if key != "bullets"}
+
+    context = {
+        "professional_title": resume.get("professional_title", ""),
+        "experience": [
+            {key: exp.get(key, "") for key in ("title", "company", "dates")}
+            for exp in resume.get("experience") or []
+        ],
+    }
+    if parts[0] != "skills":
+        context["skills"] = resume.get("skills", [])
+    return context
+
+
+def apply_patch(resume: dict, patch: dict) -> dict:
+    """
+    Merge a {path: value} patch into a copy of a resume.
+
+    Args:
+        resume: Structured resume as a dictionary (not modified).
+        patch: Mapping of section paths to replacement values.
+
+    Returns:
+        New resume dictionary with the patched sections.
+    """
+    merged = copy.deepcopy(resume)
+    for path, value in patch.items():
+        set_section(merged, path, value)
+    return merged
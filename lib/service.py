@@ -0,0 +1,316 @@
+"""Headless HTTP API for the resume pipeline.
+
+Run with:
+    uvicorn lib.service:app --workers 1
+
+Endpoints (JSON bodies unless noted):
+    POST /extract      raw PDF body -> {"text": ...}
+    POST /structure    {"resume_text"} -> structured resume
+    POST /analyze      {"job_description"} -> job analysis (title, seniority, skills, keywords)
+    POST /optimize     {"resume", "job_description", "job_analysis"?} -> optimized resume
+    POST /translate    {"resume", "target_language"} -> translated resume
+    POST /render       {"resume", "target_pages"?, "template"?} -> application/pdf
+    POST /jobs/{task}  same body as /{task} -> 202 {"id", "status", ...}
+    GET  /jobs/{id}         job status
+    GET  /jobs/{id}/result  job result (JSON, or PDF for render jobs)
+    GET  /metrics           Prometheus metrics
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from pydantic import BaseModel, Field, ValidationError
+
+from . import groq_client
+from .metrics import registry, span
+from .pdf_generator import compile_template, generate_pdf
+from .pdf_parser import extract_text_from_pdf
+from .response import validate_job_analysis, validate_resume
+
+# Request body limits
+MAX_PDF_BYTES = int(os.getenv("RESUME_TAILOR_MAX_PDF_BYTES", str(10 * 1024 * 1024)))
+MAX_JSON_BYTES = int(os.getenv("RESUME_TAILOR_MAX_JSON_BYTES", str(1024 * 1024)))
+
+# Finished jobs kept for polling before the oldest are dropped
+MAX_JOBS = int(os.getenv("RESUME_TAILOR_MAX_JOBS", "1000"))
+
+# Worker processes for PDF extraction and rendering (default: CPU count)
+PROCESS_WORKERS = int(os.getenv("RESUME_TAILOR_PROCESS_WORKERS", "0")) or None
+
+
+class StructureRequest(BaseModel):
+    resume_text: str
+    use_cache: bool = True
+
+
+class AnalyzeRequest(BaseModel):
+    job_description: str
+    use_cache: bool = True
+
+
+class OptimizeRequest(BaseModel):
+    resume: dict
+    job_description: str
+    job_analysis: dict | None = None  # From /analyze, to skip analyzing the posting again
+    use_cache: bool = True
+
+
+class TranslateRequest(BaseModel):
+    resume: dict
+    target_language: str = "French"
+    use_cache: bool = True
+
+
+class RenderRequest(BaseModel):
+    resume: dict
+    target_pages: int | None = Field(None, ge=1)
+    template: str | dict | None = None  # Template name or inline template
+
+
+# Body model per task; None means a raw PDF body
+TASK_MODELS = {
+    "extract": None,
+    "structure": StructureRequest,
+    "analyze": AnalyzeRequest,
+    "optimize": OptimizeRequest,
+    "translate": TranslateRequest,
+    "render": RenderRequest,
+}
+
+
+async def _read_body(request: Request, limit: int) -> bytes:
+    """Read a request body, rejecting it with 413 as soon as it exceeds the limit."""
+    length = request.headers.get("content-length")
+    if length is not None and length.isdigit() and int(length) > limit:
+        raise HTTPException(413, f"Request body exceeds {limit} bytes")
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > limit:
+            raise HTTPException(413, f"Request body exceeds {limit} bytes")
+    return bytes(body)
+
+
+async def _parse_request(request: Request, task: str):
+    """Read and validate the body for a task: raw PDF bytes or a request model."""
+    model = TASK_MODELS[task]
+    if model is None:
+        body = await _read_body(request, MAX_PDF_BYTES)
+        if not body.startswith(b"%PDF"):
+            raise HTTPException(415, "Request body must be a PDF document")
+        return body
+
+    body = await _read_body(request, MAX_JSON_BYTES)
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as e:
+        raise HTTPException(422, json.loads(e.json(include_url=False)))
+
+
+class Pipeline:
+    """
+    Runs pipeline tasks: LLM calls on the event loop, CPU-bound PDF work in processes.
+
+    Args:
+        llm: Object providing the async astructure_resume, aanalyze_job_description,
+            aoptimize_resume and atranslate_resume functions (default: the Groq
+            client module). Pass a stub to run the service without network access.
+        pool: Process pool for extraction and rendering.
+    """
+
+    def __init__(self, llm, pool: ProcessPoolExecutor):
+        self.llm = llm
+        self.pool = pool
+
+    async def _in_process(self, stage: str, fn, *args):
+        with span(stage):
+            return await asyncio.get_running_loop().run_in_executor(self.pool, fn, *args)
+
+    async def run(self, task: str, payload):
+        """Run one task and return its result (a dict, or PDF bytes for render)."""
+        if task == "extract":
+            text = await self._in_process("service.extract", extract_text_from_pdf, payload, True)
+            return {"text": text}
+
+        if task == "render":
+            errors = validate_resume(payload.resume)
+            if errors:
+                raise HTTPException(422, errors)
+            try:
+                # Workers compile their own plan; this only rejects bad templates early
+                compile_template(payload.template)
+            except ValueError as e:
+                raise HTTPException(422, str(e))
+            return await self._in_process(
+                "service.render",
+                generate_pdf,
+                payload.resume,
+                payload.target_pages,
+                payload.template,
+            )
+
+        if task == "optimize" and payload.job_analysis is not None:
+            errors = validate_job_analysis(payload.job_analysis)
+            if errors:
+                raise HTTPException(422, errors)
+
+        try:
+            if task == "structure":
+                return await self.llm.astructure_resume(payload.resume_text, payload.use_cache)
+            if task == "analyze":
+                return await self.llm.aanalyze_job_description(
+                    payload.job_description, payload.use_cache
+                )
+            if task == "optimize":
+                return await self.llm.aoptimize_resume(
+                    payload.resume,
+                    payload.job_description,
+                    payload.use_cache,
+                    job_analysis=payload.job_analysis,
+                )
+            return await self.llm.atranslate_resume(
+                payload.resume, payload.target_language, payload.use_cache
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(502, f"LLM request failed: {e}")
+
+
+class JobStore:
+    """In-memory registry of background jobs, bounded to the most recent max_jobs."""
+
+    def __init__(self, max_jobs: int = MAX_JOBS):
+        self.max_jobs = max_jobs
+        self._jobs = OrderedDict()
+
+    def submit(self, task: str, coro) -> dict:
+        """Start a coroutine as a background job and return its record."""
+        job = {
+            "id": uuid.uuid4().hex,
+            "task": task,
+            "status": "running",
+            "created_at": time.time(),
+            "finished_at": None,
+            "error": None,
+        }
+        self._jobs[job["id"]] = job
+        job["_task"] = asyncio.create_task(self._run(job, coro))
+
+        # Drop the oldest finished jobs beyond the limit
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.max_jobs:
+                break
+            if self._jobs[job_id]["status"] != "running":
+                del self._jobs[job_id]
+        return job
+
+    async def _run(self, job: dict, coro) -> None:
+        try:
+            job["_result"] = await coro
+            job["status"] = "done"
+        except HTTPException as e:
+            job["status"] = "error"
+            job["error"] = e.detail
+        except Exception as e:
+            job["status"] = "error"
+            job["error"] = str(e)
+        finally:
+            job["finished_at"] = time.time()
+
+    def get(self, job_id: str) -> dict:
+        """Return a job record, raising 404 if it is unknown or expired."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise HTTPException(404, "Unknown job")
+        return job
+
+    @staticmethod
+    def view(job: dict) -> dict:
+        """Public fields of a job record."""
+        return {key: value for key, value in job.items() if not key.startswith("_")}
+
+
+def _task_response(result):
+    """HTTP response for a task result."""
+    if isinstance(result, bytes):
+        return Response(result, media_type="application/pdf")
+    return JSONResponse(result)
+
+
+def create_app(llm=None, process_workers: int | None = PROCESS_WORKERS) -> FastAPI:
+    """
+    Build the API application.
+
+    Args:
+        llm: LLM backend for Pipeline (default: the Groq client module).
+        process_workers: Worker processes for extraction and rendering.
+
+    Returns:
+        FastAPI application.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        with ProcessPoolExecutor(max_workers=process_workers) as pool:
+            app.state.pipeline = Pipeline(llm or groq_client, pool)
+            app.state.jobs = JobStore()
+            yield
+
+    app = FastAPI(title="Resume Tailor API", lifespan=lifespan)
+
+    def task_endpoint(task: str):
+        async def endpoint(request: Request):
+            payload = await _parse_request(request, task)
+            return _task_response(await request.app.state.pipeline.run(task, payload))
+
+        return endpoint
+
+    for task in TASK_MODELS:
+        app.add_api_route(f"/{task}", task_endpoint(task), methods=["POST"], name=task)
+
+    @app.post("/jobs/{task}", status_code=202)
+    async def submit_job(task: str, request: Request):
+        if task not in TASK_MODELS:
+            raise HTTPException(404, f"Unknown task: {task}")
+        payload = await _parse_request(request, task)
+        job = request.app.state.jobs.submit(task, request.app.state.pipeline.run(task, payload))
+        return JobStore.view(job)
+
+    @app.get("/jobs/{job_id}")
+    async def job_status(job_id: str, request: Request):
+        return JobStore.view(request.app.state.jobs.get(job_id))
+
+    @app.get("/jobs/{job_id}/result")
+    async def job_result(job_id: str, request: Request):
+        job = request.app.state.jobs.get(job_id)
+        if job["status"] == "running":
+            raise HTTPException(409, "Job is still running")
+        if job["status"] == "error":
+            raise HTTPException(409, {"error": job["error"]})
+        return _task_response(job["_result"])
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/metrics")
+    async def metrics():
+        # Stages run in worker processes (extraction, rendering) are timed by the caller only
+        return PlainTextResponse(
+            registry.prometheus_text(), media_type="text/plain; version=0.0.4"
+        )
+
+    return app
+
+
+app = create_app()
@@ -0,0 +1,227 @@
+"""Declarative resume templates: section order, headings, colors and page margins.
+
+Templates are JSON files (or YAML, when PyYAML is installed) in the templates
+directory, for example:
+
+    {
+      "name": "classic",
+      "sections": [{"type": "header"}, {"type": "summary", "title": "Profile"}, ...],
+      "colors": {"accent": [70, 130, 180], "text": [0, 0, 0]},
+      "page": {"margins": [18, 15, 18], "bottom_margin": 20},
+      "rule_end": 192
+    }
+
+Omitted keys and section titles take the classic template's values. A null
+rule_end draws section rules up to the right margin.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+from .cache import make_key
+
+TEMPLATES_DIR = Path(
+    os.getenv("RESUME_TAILOR_TEMPLATES_DIR", Path(__file__).parent.parent / "templates")
+)
+DEFAULT_TEMPLATE = "classic"
+
+SECTION_TYPES = (
+    "header",
+    "summary",
+    "skills",
+    "education",
+    "experience",
+    "projects",
+    "certifications",
+    "references",
+)
+
+DEFAULTS = {
+    "name": "custom",
+    "sections": [
+        {"type": "header"},
+        {"type": "summary", "title": "Profile"},
+        {"type": "skills", "title": "Technical Skills"},
+        {"type": "education", "title": "Education"},
+        {"type": "experience", "title": "Experience"},
+        {"type": "projects", "title": "Projects"},
+        {"type": "certifications", "title": "Certifications"},
+        {"type": "references", "title": "References"},
+    ],
+    "colors": {"accent": [70, 130, 180], "text": [0, 0, 0]},
+    "page": {"margins": [18, 15, 18], "bottom_margin": 20},
+    "rule_end": 192,
+}
+
+TEMPLATE_SUFFIXES = (".json", ".yaml", ".yml")
+
+# Heading used when a section omits its title
+DEFAULT_TITLES = {section["type"]: section.get("title", "") for section in DEFAULTS["sections"]}
+
+# Normalized templates loaded from files: path -> (modification time, template)
+_loaded = {}
+_loaded_lock = threading.Lock()
+
+
+def list_templates() -> list:
+    """Names of the templates in the templates directory."""
+    if not TEMPLATES_DIR.is_dir():
+        return [DEFAULT_TEMPLATE]
+    names = {path.stem for path in TEMPLATES_DIR.iterdir() if path.suffix in TEMPLATE_SUFFIXES}
+    return sorted(names | {DEFAULT_TEMPLATE})
+
+
+def _is_color(value) -> bool:
+    return (
+        isinstance(value, (list, tuple))
+        and len(value) == 3
+        and all(isinstance(c, int) and 0 <= c <= 255 for c in value)
+    )
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def normalize_template(template: dict) -> dict:
+    """
+    Fill in defaults and validate a template.
+
+    Args:
+        template: Template as parsed from JSON or YAML.
+
+    Returns:
+        A complete template dictionary.
+
+    Raises:
+        ValueError: If the template is malformed.
+    """
+    if not isinstance(template, dict):
+        raise ValueError("Template must be an object")
+
+    errors = []
+    overrides = {}
+    for key in ("colors", "page"):
+        overrides[key] = template.get(key, {})
+        if not isinstance(overrides[key], dict):
+            errors.append(f"{key}: expected an object")
+            overrides[key] = {}
+
+    result = {
+        "name": template.get("name", DEFAULTS["name"]),
+        "sections": template.get("sections", DEFAULTS["sections"]),
+        "colors": {**DEFAULTS["colors"], **overrides["colors"]},
+        "page": {**DEFAULTS["page"], **overrides["page"]},
+        "rule_end": template.get("rule_end", DEFAULTS["rule_end"]),
+    }
+
+    sections = result["sections"]
+    if not isinstance(sections, list) or not sections:
+        errors.append("sections: expected a non-empty list")
+        sections = []
+    normalized_sections = []
+    for index, section in enumerate(sections):
+        if isinstance(section, str):
+            section = {"type": section}
+        if not isinstance(section, dict) or section.get("type") not in SECTION_TYPES:
+            errors.append(f"sections[{index}]: type must be one of {', '.join(SECTION_TYPES)}")
+            continue
+        title = section.get("title", DEFAULT_TITLES[section["type"]])
+        if not isinstance(title, str):
+            errors.append(f"sections[{index}].title: expected a string")
+            continue
+        normalized_sections.append({"type": section["type"], "title": title})
+    result["sections"] = normalized_sections
+
+    for key, value in result["colors"].items():
+        if not _is_color(value):
+            errors.append(f"colors.{key}: expected [r, g, b] with values 0-255")
+    margins = result["page"]["margins"]
+    if not (
+        isinstance(margins, (list, tuple))
+        and len(margins) == 3
+        and all(_is_number(m) and m >= 0 for m in margins)
+    ):
+        errors.append("page.margins: expected [left, top, right]")
+    if not _is_number(result["page"]["bottom_margin"]):
+        errors.append("page.bottom_margin: expected a number")
+    if result["rule_end"] is not None and not _is_number(result["rule_end"]):
+        errors.append("rule_end: expected a number or null")
+
+    if errors:
+        raise ValueError("Invalid template: " + "; ".join(errors))
+    return result
+
+
+def _read_template_file(path: Path) -> dict:
+    text = path.read_text(encoding="utf-8")
+    if path.suffix in (".yaml", ".yml"):
+        if yaml is None:
+            raise ValueError(f"PyYAML is required to read {path.name}")
+        return yaml.safe_load(text)
+    return json.loads(text)
+
+
+def _template_path(name: str) -> Path | None:
+    for suffix in TEMPLATE_SUFFIXES:
+        path = TEMPLATES_DIR / f"{name}{suffix}"
+        if path.is_file():
+            return path
+    return None
+
+
+def load_template(template: str | Path | dict | None = None) -> dict:
+    """
+    Resolve a template reference to a normalized template.
+
+    Args:
+        template: A template name from the templates directory, a path to a
+            template file, a template dictionary, or None for the default.
+            Strings are only looked up by name, never as file paths.
+
+    Returns:
+        Normalized template dictionary.
+
+    Raises:
+        ValueError: If the template is unknown or malformed.
+    """
+    if isinstance(template, dict):
+        return normalize_template(template)
+
+    if template is None or isinstance(template, str):
+        name = template or DEFAULT_TEMPLATE
+        if "/" in name or "\\" in name or name.startswith("."):
+            raise ValueError(f"Invalid template name: {name}")
+        path = _template_path(name)
+        if path is None:
+            if name == DEFAULT_TEMPLATE:
+                return normalize_template({**DEFAULTS, "name": DEFAULT_TEMPLATE})
+            raise ValueError(f"Unknown template: {name}")
+    else:
+        path = Path(template)
+
+    # Parse each file once, re-reading it only when it changes
+    mtime = path.stat().st_mtime_ns
+    with _loaded_lock:
+        cached = _loaded.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        normalized = normalize_template(_read_template_file(path))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid template {path.name}: {e}")
+    with _loaded_lock:
+        _loaded[path] = (mtime, normalized)
+    return normalized
+
+
+def template_key(template: dict) -> str:
+    """Stable hash of a normalized template, used in plan and render cache keys."""
+    return make_key(template)
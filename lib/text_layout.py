@@ -0,0 +1,206 @@
+"""Text measurement and line wrapping with precomputed glyph advance tables.
+
+Mirrors fpdf2's word-wrapping rules for plain text in a single TrueType font,
+so lines laid out here break exactly where multi_cell would break them, but
+without fpdf's per-character re-measurement of the whole line.
+"""
+
+import functools
+import threading
+from typing import NamedTuple
+
+from fpdf.fonts import TTFFont
+
+# Wrapped paragraphs kept per process
+WRAP_CACHE_SIZE = 4096
+
+# Characters whose fpdf line-breaking semantics are not reproduced here:
+# soft hyphens, non-breaking spaces, tabs and other breaking spaces, carriage
+# returns and form feeds. Text containing any of them is left to fpdf.
+UNSUPPORTED_CHARACTERS = frozenset(
+    "\u00ad\u00a0\t\r\f\u200b\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008"
+    "\u2009\u200a\u205f\u3000"
+)
+
+# Slack for comparing widths derived from integer glyph units with float page units
+_TOLERANCE = 1e-6
+
+
+class Line(NamedTuple):
+    """One laid-out line of text."""
+
+    text: str
+    width: float  # In document units
+    spaces: int  # Spaces available for justification
+    justify: bool  # False for the last line of a paragraph and forced breaks
+    trailing_nl: bool = False
+
+
+class GlyphTable:
+    """
+    Advance widths of one font, in 1/1000 em, keyed by character.
+
+    Built once per font file from the widths fpdf parsed, so measuring a
+    string is a single pass of dictionary lookups.
+    """
+
+    def __init__(self, font: TTFFont):
+        self.widths = {chr(code): width for code, width in font.cw.items()}
+        self.default = font.desc.missing_width
+
+    def units(self, text: str) -> int:
+        """Total advance of a string in 1/1000 em."""
+        get = self.widths.get
+        default = self.default
+        return sum(get(char, default) for char in text)
+
+    def measure(self, texts, size_pt: float, k: float) -> list:
+        """Widths of several strings, in document units, at the given font size."""
+        return [self.units(text) * size_pt * 0.001 / k for text in texts]
+
+
+# Glyph tables by (fontkey, font file): they depend on the file only, not the document
+_tables = {}
+_tables_lock = threading.Lock()
+
+
+def glyph_table(font: TTFFont) -> tuple:
+    """
+    Return the cache key and glyph table for a parsed font, building it on first use.
+
+    Returns:
+        Tuple of (table key, GlyphTable).
+    """
+    key = (font.fontkey, str(font.ttffile))
+    with _tables_lock:
+        table = _tables.get(key)
+        if table is None:
+            table = _tables[key] = GlyphTable(font)
+    return key, table
+
+
+def clear_layout_cache():
+    """Drop glyph tables and memoized line wrapping."""
+    with _tables_lock:
+        _tables.clear()
+    _wrap.cache_clear()
+
+
+def supports(text: str) -> bool:
+    """Whether wrap() reproduces fpdf's line breaking for this text."""
+    return not UNSUPPORTED_CHARACTERS.intersection(text)
+
+
+def _wrap_paragraph(
+    text: str, table: GlyphTable, limit: float, to_width, trailing_nl: bool
+) -> list | None:
+    """Greedy fpdf-compatible wrapping of text without newlines, measured in glyph units."""
+    get = table.widths.get
+    default = table.default
+    lines = []
+    start = 0
+    units = 0
+    spaces = 0
+    last_space = None  # (index, units before it, spaces before it)
+    index = 0
+    length = len(text)
+
+    while index < length:
+        char = text[index]
+        width = get(char, default)
+        if units + width > limit:
+            if char == " ":
+                # A space overflowing the line is dropped
+                lines.append(Line(text[start:index], to_width(units), spaces, True))
+                start = index + 1
+            elif last_space is not None:
+                # Break at the last space, which is dropped
+                space_index, space_units, space_spaces = last_space
+                lines.append(
+                    Line(text[start:space_index], to_width(space_units), space_spaces, True)
+                )
+                start = space_index + 1
+            elif index > start:
+                # A single word wider than the line is split without justification
+                lines.append(Line(text[start:index], to_width(units), spaces, False))
+                start = index
+            else:
+                return None
+            index = start
+            units = spaces = 0
+            last_space = None
+            continue
+
+        if char == " ":
+            last_space = (index, units, spaces)
+            spaces += 1
+        units += width
+        index += 1
+
+    if start < length:
+        lines.append(Line(text[start:], to_width(units), spaces, False, trailing_nl))
+    elif trailing_nl:
+        # An explicit newline always ends a line, even an empty one
+        lines.append(Line("", 0.0, 0, False, True))
+    return lines
+
+
+@functools.lru_cache(maxsize=WRAP_CACHE_SIZE)
+def _wrap(text: str, table_key: tuple, size_pt: float, k: float, max_width: float, margin: float):
+    table = _tables[table_key]
+
+    def to_width(units):
+        # Same arithmetic as fpdf, so justification spacing matches to the last digit
+        return units * size_pt * 0.001 / k
+
+    # Available width in glyph units, after the cell margins on both sides
+    limit = (max_width - 2 * margin) * k * 1000 / size_pt + _TOLERANCE
+
+    lines = []
+    paragraphs = text.split("\n")
+    for number, paragraph in enumerate(paragraphs):
+        trailing_nl = number < len(paragraphs) - 1
+        wrapped = _wrap_paragraph(paragraph, table, limit, to_width, trailing_nl)
+        if wrapped is None:
+            return None
+        lines.extend(wrapped)
+    return tuple(lines)
+
+
+def wrap(
+    text: str, font: TTFFont, size_pt: float, k: float, max_width: float, margin: float
+) -> tuple | None:
+    """
+    Break text into lines the way FPDF.multi_cell does in word-wrap mode.
+
+    Results are memoized per (text, font, size, width), so repeated bullets and
+    re-renders of the same resume skip measurement entirely.
+
+    Args:
+        text: Text to lay out.
+        font: Parsed TrueType font the text is set in.
+        size_pt: Font size in points.
+        k: Scale factor from points to document units.
+        max_width: Cell width in document units.
+        margin: Cell margin applied on both sides of every line.
+
+    Returns:
+        Tuple of Line, or None if the text needs fpdf's own line breaking.
+    """
+    if not supports(text):
+        return None
+    table_key, _ = glyph_table(font)
+    return _wrap(text, table_key, size_pt, k, max_width, margin)
+
+
+def wrap_many(
+    texts, font: TTFFont, size_pt: float, k: float, max_width: float, margin: float
+) -> list:
+    """Lay out several texts sharing a font and width; see wrap()."""
+    if not texts:
+        return []
+    table_key, _ = glyph_table(font)
+    return [
+        _wrap(text, table_key, size_pt, k, max_width, margin) if supports(text) else None
+        for text in texts
+    ]
@@ -0,0 +1,182 @@
+"""Persistent translation memory and string-level resume translation helpers."""
+
+import copy
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .cache import DEFAULT_CACHE_PATH
+
+DEFAULT_MEMORY_PATH = Path(
+    os.getenv(
+        "RESUME_TAILOR_TRANSLATION_MEMORY_PATH",
+        DEFAULT_CACHE_PATH.parent / "translation_memory.sqlite3",
+    )
+)
+
+# Languages offered in the UI, with the suffix used in file names
+SUPPORTED_LANGUAGES = {
+    "French": "FR",
+    "German": "DE",
+    "Spanish": "ES",
+    "Italian": "IT",
+    "Portuguese": "PT",
+    "Dutch": "NL",
+}
+
+# Top-level fields that are never translated
+KEPT_FIELDS = ("name", "contact", "professional_title")
+
+# Translated fields of list entries; names, titles, dates and degree names stay in English
+ENTRY_TRANSLATED_FIELDS = {
+    "experience": ("location", "type", "bullets"),
+    "education": ("location",),
+    "projects": ("description", "bullets"),
+    "certifications": (),
+    "references": (),
+}
+
+# Maximum SQLite parameters per lookup query
+_LOOKUP_CHUNK = 500
+
+
+class TranslationMemory:
+    """SQLite store of translated strings keyed by (source string, target language)."""
+
+    def __init__(self, path: Path | str = DEFAULT_MEMORY_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translations (
+                source TEXT NOT NULL,
+                language TEXT NOT NULL,
+                target TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (source, language)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def lookup(self, sources: list, language: str) -> dict:
+        """Return the known translations of the given strings as a {source: target} dict."""
+        language = language.strip().lower()
+        sources = list(dict.fromkeys(sources))
+        found = {}
+        with self._lock:
+            for start in range(0, len(sources), _LOOKUP_CHUNK):
+                chunk = sources[start:start + _LOOKUP_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = self._conn.execute(
+                    f"SELECT source, target FROM translations "
+                    f"WHERE language = ? AND source IN ({placeholders})",
+                    (language, *chunk),
+                )
+                found.update(rows.fetchall())
+        return found
+
+    def store(self, translations: dict, language: str) -> None:
+        """Save {source: target} translations for a language."""
+        language = language.strip().lower()
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations (source, language, target, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                [(source, language, target, now) for source, target in translations.items()],
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove every stored translation."""
+        with self._lock:
+            self._conn.execute("DELETE FROM translations")
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        """Return the number of stored translations per language."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT language, COUNT(*) FROM translations GROUP BY language"
+            )
+            return dict(rows.fetchall())
+
+
+_memory = None
+_memory_lock = threading.Lock()
+
+
+def get_translation_memory() -> TranslationMemory:
+    """Get the process-wide translation memory, creating it on first use."""
+    global _memory
+    with _memory_lock:
+        if _memory is None:
+            _memory = TranslationMemory()
+        return _memory
+
+
+def _collect(value, path: tuple, segments: list) -> None:
+    """Append (path, text) for every string leaf under value that contains words."""
+    if isinstance(value, str):
+        if any(c.isalpha() for c in value):
+            segments.append((path, value))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            _collect(item, path + (index,), segments)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            _collect(item, path + (key,), segments)
+
+
+def extract_segments(resume_json: dict) -> list:
+    """
+    List the strings of a resume that need translating.
+
+    Args:
+        resume_json: Structured resume as a dictionary.
+
+    Returns:
+        List of (path, text) where path is a tuple of keys and indices.
+    """
+    segments = []
+    for key, value in resume_json.items():
+        if key in KEPT_FIELDS:
+            continue
+        if key in ENTRY_TRANSLATED_FIELDS and isinstance(value, list):
+            for index, entry in enumerate(value):
+                if not isinstance(entry, dict):
+                    continue
+                for field in ENTRY_TRANSLATED_FIELDS[key]:
+                    if field in entry:
+                        _collect(entry[field], (key, index, field), segments)
+        else:
+            _collect(value, (key,), segments)
+    return segments
+
+
+def apply_translations(resume_json: dict, segments: list, translations: dict) -> dict:
+    """
+    Rebuild a resume with translated strings.
+
+    Args:
+        resume_json: Structured resume as a dictionary.
+        segments: (path, text) pairs from extract_segments.
+        translations: Mapping of source text to translated text.
+
+    Returns:
+        A new resume dictionary; the input is not modified.
+    """
+    result = copy.deepcopy(resume_json)
+    for path, text in segments:
+        container = result
+        for part in path[:-1]:
+            container = container[part]
+        container[path[-1]] = translations.get(text, text)
+    return result